@@ -0,0 +1,263 @@
+"""
+Lockstep batch simulator for tuning the board.
+
+Plays N independent games at once with NumPy: positions, balances, property
+owners and the skip / no-rent flags are (games x teams) or (games x tiles)
+arrays, and step() plays one turn of the current team in every game with a
+handful of array operations. Organizers use it to try prices and rents
+(engine.GameEngine._build_property_data, or a property_data override)
+before an event. Usage:
+
+    python batch_sim.py [games] [max_turns] [seed]
+
+The rules are the engine's, plus what the game master applies by hand in
+the live game (see ARTHVIDYA_MONOPOLY_RULES.md):
+
+- a single d6 per turn, with the GO bonus for passing or landing on GO
+- Society Penalty (pay and skip the next turn) and Event Penalty
+- the mystery wheel on MYSTERY_TILES, with the wheel's anti-repetition:
+  the last RECENT_MYSTERY_RESULTS outcomes of a game are not drawn again
+  (recent_results=0 gives independent draws, as markov.py assumes).
+  Mystery moves and teleports: tile effects (penalties, the skipped turn,
+  the GO bonus) are not applied where they end, as in the engine, but rent
+  and buying are
+- rent for landing on an opponent's property, unless the team drew "No rent
+  next turn" on its previous turn
+- buying policy: a team buys an unowned property it lands on if it keeps at
+  least its buy_reserve afterwards (0: always buy when affordable,
+  float('inf'): never buy)
+- a team whose balance goes negative is eliminated and its properties go
+  back to the bank; a game ends with one team left or after max_turns, and
+  the winner is the last team standing or the highest net worth (cash plus
+  property prices)
+
+Chance questions carry no money, so chance tiles have no effect. The live
+game's dice avoid repeating the previous roll; here the d6 is uniform.
+"""
+import sys
+import time
+
+import numpy as np
+
+from engine import (
+    BOARD_SPACES, EVENT_PENALTY, EVENT_PENALTY_TILE, FREE_PARKING_TILE, GO_BONUS, MYSTERY_TILES,
+    SOCIETY_PENALTY, SOCIETY_PENALTY_TILE, STARTING_BALANCE, GameEngine,
+)
+
+NO_OWNER = -1
+RECENT_MYSTERY_RESULTS = 3  # GameEngine.max_recent_results
+DEFAULT_MAX_TURNS = 200
+
+
+class BatchSimulator:
+    """N independent games advanced one turn at a time, in lockstep"""
+
+    def __init__(self, n_games, seed=None, buy_reserve=0, property_data=None, mystery_cards=None,
+                 n_teams=None, starting_balance=STARTING_BALANCE, recent_results=RECENT_MYSTERY_RESULTS):
+        defaults = GameEngine(seed=0, history_size=0)
+        if property_data is None:
+            property_data = defaults.property_data
+        if mystery_cards is None:
+            mystery_cards = defaults.mystery_cards
+        if n_teams is None:
+            n_teams = len(defaults.teams)
+        self.n_games = n_games
+        self.n_teams = n_teams
+        self.rng = np.random.default_rng(seed)
+        self.games = np.arange(n_games)
+
+        self.price = np.zeros(BOARD_SPACES, np.int64)
+        self.rent = np.zeros(BOARD_SPACES, np.int64)
+        self.buyable = np.zeros(BOARD_SPACES, bool)
+        for tile, info in property_data.items():
+            self.price[tile] = info["price"]
+            self.rent[tile] = info["rent"]
+            self.buyable[tile] = True
+        self.is_mystery = np.zeros(BOARD_SPACES, bool)
+        self.is_mystery[MYSTERY_TILES] = True
+
+        # Mystery card effects as arrays indexed by card
+        n_cards = len(mystery_cards)
+        self.card_steps = np.zeros(n_cards, np.int64)
+        self.card_teleport = np.full(n_cards, -1, np.int64)
+        self.card_no_rent = np.zeros(n_cards, bool)
+        for i, card in enumerate(mystery_cards):
+            if card["type"] == "move":
+                self.card_steps[i] = card["steps"]
+            elif card["type"] == "go_to_free_parking":
+                self.card_teleport[i] = FREE_PARKING_TILE
+            elif card["type"] == "go_to_society_penalty":
+                self.card_teleport[i] = SOCIETY_PENALTY_TILE
+            elif card["type"] == "no_rent":
+                self.card_no_rent[i] = True
+
+        # Minimum cash each seat keeps after buying
+        self.buy_reserve = np.broadcast_to(np.asarray(buy_reserve, np.float64), (n_teams,)).copy()
+
+        shape = (n_games, n_teams)
+        self.pos = np.zeros(shape, np.int64)
+        self.balance = np.full(shape, starting_balance, np.int64)
+        self.skip = np.zeros(shape, bool)
+        self.no_rent = np.zeros(shape, bool)
+        self.eliminated = np.zeros(shape, bool)
+        self.owner = np.full((n_games, BOARD_SPACES), NO_OWNER, np.int64)
+        self.recent_mystery = np.full((n_games, recent_results), -1, np.int64)
+        self.current = np.zeros(n_games, np.int64)
+        self.turns = np.zeros(n_games, np.int64)
+        self.finished = np.zeros(n_games, bool)
+
+        # Totals over all games
+        self.landings = np.zeros(BOARD_SPACES, np.int64)
+        self.rent_collected = np.zeros(BOARD_SPACES, np.int64)
+        self.purchases = np.zeros(BOARD_SPACES, np.int64)
+        self.mystery_draws = np.zeros(n_cards, np.int64)
+        self.bankruptcies = np.zeros(n_teams, np.int64)
+
+    def run(self, max_turns=DEFAULT_MAX_TURNS):
+        """Play until every game has a single team left or has run max_turns turns"""
+        for _ in range(max_turns):
+            if self.finished.all():
+                break
+            self.step()
+        return self.summary()
+
+    def step(self):
+        """Play one turn of the current team in every unfinished game"""
+        live = ~self.finished
+        g = self.games
+        t = self.current
+        n = self.n_games
+
+        start = self.pos[g, t]
+        pos = (start + self.rng.integers(1, 7, n)) % BOARD_SPACES
+        balance = self.balance[g, t] + np.where(pos < start, GO_BONUS, 0)
+        no_rent = self.no_rent[g, t]
+        self.no_rent[g, t] &= ~live
+
+        society = pos == SOCIETY_PENALTY_TILE
+        balance -= np.where(society, SOCIETY_PENALTY, 0)
+        balance -= np.where(pos == EVENT_PENALTY_TILE, EVENT_PENALTY, 0)
+        self.skip[g[society & live], t[society & live]] = True
+
+        spinning = self.is_mystery[pos] & live
+        if spinning.any():
+            rows = g[spinning]
+            card = self._spin(rows)
+            moved = (pos[rows] + self.card_steps[card]) % BOARD_SPACES
+            teleport = self.card_teleport[card]
+            pos[rows] = np.where(teleport >= 0, teleport, moved)
+            self.no_rent[rows, t[rows]] |= self.card_no_rent[card]
+            self.mystery_draws += np.bincount(card, minlength=len(self.card_steps))
+
+        owner = self.owner[g, pos]
+        pays = live & (owner != NO_OWNER) & (owner != t) & ~no_rent
+        rent = np.where(pays, self.rent[pos], 0)
+        balance -= rent
+        np.add.at(self.balance, (g[pays], owner[pays]), rent[pays])
+
+        buys = (live & self.buyable[pos] & (owner == NO_OWNER)
+                & (balance - self.price[pos] >= self.buy_reserve[t]))
+        balance -= np.where(buys, self.price[pos], 0)
+        self.owner[g[buys], pos[buys]] = t[buys]
+
+        self.pos[g[live], t[live]] = pos[live]
+        self.balance[g[live], t[live]] = balance[live]
+        self.landings += np.bincount(pos[live], minlength=BOARD_SPACES)
+        self.rent_collected += np.bincount(pos[pays], weights=rent[pays], minlength=BOARD_SPACES).astype(np.int64)
+        self.purchases += np.bincount(pos[buys], minlength=BOARD_SPACES)
+        self.turns += live
+
+        # Only the team on turn pays, so only it can go bankrupt
+        broke = live & (balance < 0)
+        if broke.any():
+            rows = g[broke]
+            self.eliminated[rows, t[rows]] = True
+            self.bankruptcies += np.bincount(t[rows], minlength=self.n_teams)
+            released = self.owner[rows] == t[rows, None]
+            self.owner[rows] = np.where(released, NO_OWNER, self.owner[rows])
+            self.finished |= (~self.eliminated).sum(axis=1) <= 1
+
+        self._advance(live)
+
+    def _spin(self, rows):
+        """Mystery card index per game in rows, never one of its recent results"""
+        n_cards = len(self.card_steps)
+        keys = self.rng.random((len(rows), n_cards))
+        recent = self.recent_mystery[rows]
+        blocked = (recent[:, :, None] == np.arange(n_cards)).any(axis=1)
+        blocked &= ~blocked.all(axis=1, keepdims=True)
+        card = np.where(blocked, -1.0, keys).argmax(axis=1)
+        if recent.shape[1]:
+            self.recent_mystery[rows] = np.concatenate([recent[:, 1:], card[:, None]], axis=1)
+        return card
+
+    def _advance(self, live):
+        """Next team on turn, passing over eliminated teams and clearing skip flags (as next_turn)"""
+        g = self.games
+        pending = live.copy()
+        for _ in range(2 * self.n_teams):
+            if not pending.any():
+                break
+            rows = g[pending]
+            nxt = (self.current[rows] + 1) % self.n_teams
+            self.current[rows] = nxt
+            out = self.eliminated[rows, nxt]
+            skipped = self.skip[rows, nxt] & ~out
+            self.skip[rows[skipped], nxt[skipped]] = False
+            pending[rows] = out | skipped
+
+    def net_worth(self):
+        """(games x teams) cash plus the prices of owned properties"""
+        owned = np.zeros((self.n_games, self.n_teams), np.int64)
+        held = self.owner != NO_OWNER
+        rows, tiles = np.nonzero(held)
+        np.add.at(owned, (rows, self.owner[rows, tiles]), self.price[tiles])
+        return self.balance + owned
+
+    def winners(self):
+        """Winning seat per game: last team standing, else the highest net worth"""
+        worth = np.where(self.eliminated, np.iinfo(np.int64).min, self.net_worth())
+        return worth.argmax(axis=1)
+
+    def summary(self):
+        games = self.n_games
+        landings = self.landings / max(1, self.landings.sum())
+        price = np.where(self.price > 0, self.price, 1)
+        return {
+            "games": games,
+            "finished": int(self.finished.sum()),
+            "mean_turns": float(self.turns.mean()),
+            "win_rate": np.bincount(self.winners(), minlength=self.n_teams) / games,
+            "bankruptcy_rate": self.bankruptcies / games,
+            # Where turns end, i.e. after mystery moves (so mystery tiles themselves stay low)
+            "landing_share": landings,
+            "rent_per_game": self.rent_collected / games,
+            "purchases_per_game": self.purchases / games,
+            # Rent a property earns per game, relative to its price
+            "rent_to_price": np.where(self.buyable, self.rent_collected / games / price, 0.0),
+            "mystery_share": self.mystery_draws / max(1, self.mystery_draws.sum()),
+        }
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    max_turns = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_MAX_TURNS
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    start = time.perf_counter()
+    sim = BatchSimulator(games, seed=seed)
+    result = sim.run(max_turns)
+    elapsed = time.perf_counter() - start
+    names = GameEngine(seed=0, history_size=0).property_data
+    print(f"{games} games in {elapsed:.2f}s ({games / elapsed * 60:,.0f} games/min), "
+          f"{result['finished']} decided, {result['mean_turns']:.1f} turns on average")
+    print("win rate by seat:      " + "  ".join(f"{r:.3f}" for r in result["win_rate"]))
+    print("bankruptcies by seat:  " + "  ".join(f"{r:.3f}" for r in result["bankruptcy_rate"]))
+    print(f"{'tile':>4}  {'name':<22}{'landed':>8}{'rent/game':>12}{'rent/price':>12}")
+    for tile in range(BOARD_SPACES):
+        name = names[tile]["name"] if tile in names else ""
+        print(f"{tile:>4}  {name:<22}{result['landing_share'][tile]:>8.3f}"
+              f"{result['rent_per_game'][tile]:>12,.0f}{result['rent_to_price'][tile]:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
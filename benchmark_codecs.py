@@ -0,0 +1,73 @@
+"""
+Micro-benchmark for the bridge codecs.
+
+Encodes and decodes a representative game state snapshot with every codec
+available in this environment and reports the encoded size and the time per
+snapshot. Usage:
+
+    python benchmark_codecs.py [iterations]
+"""
+import sys
+import time
+from datetime import datetime
+
+import codec
+
+
+def sample_snapshot():
+    """A snapshot shaped like the ones the game publishes mid-game"""
+    colors = ["#D32F2F", "#1976D2", "#388E3C", "#F57C00", "#7B1FA2"]
+    return {
+        "epoch": int(time.time() * 1000),
+        "version": 1234,
+        "current_player": 2,
+        "game_phase": "playing",
+        "dice_rolled": True,
+        "current_position": 14,
+        "properties": {
+            str(tile): {"owner": f"T{tile % 5 + 1}", "name": f"Property {tile}"}
+            for tile in (1, 3, 5, 6, 7, 9, 11, 12, 13, 15, 17, 19)
+        },
+        "teams": [
+            {"id": f"T{i + 1}", "name": f"Team {i + 1}", "color": colors[i],
+             "balance": 10000000 - i * 375000, "pos": (i * 5) % 24}
+            for i in range(5)
+        ],
+        "messages": [
+            {"seq": i, "timestamp": datetime.now().isoformat(),
+             "message": f"Team {i % 5 + 1}: Rolled {i % 6 + 1} and {(i * 3) % 6 + 1}"}
+            for i in range(50)
+        ],
+        "pending_actions": {},
+        "game_log": [],
+        "event_seq": 50,
+    }
+
+
+def bench(snapshot_codec, snapshot, iterations):
+    data = snapshot_codec.encode(snapshot)
+    assert codec.decode(data) == snapshot, f"{snapshot_codec.name} does not round-trip"
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        snapshot_codec.encode(snapshot)
+    encode_s = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        codec.decode(data)
+    decode_s = (time.perf_counter() - start) / iterations
+    return len(data), encode_s, decode_s
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    snapshot = sample_snapshot()
+    print(f"{'codec':<10}{'bytes':>10}{'encode us':>12}{'decode us':>12}")
+    for name in sorted(codec.CODECS):
+        size, encode_s, decode_s = bench(codec.CODECS[name], snapshot, iterations)
+        print(f"{name:<10}{size:>10}{encode_s * 1e6:>12.1f}{decode_s * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Background I/O worker for the Streamlit bridge.
+
+All disk access for the bridge (publishing game_state.json, appending the
+event log, consuming the control command and player action spools) happens
+on a dedicated thread so the pygame render loop never blocks on
+open/json/write calls.
+
+Outbound state snapshots are coalesced: only the newest snapshot queued since
+the last write is published. Inbound commands are parsed on the worker thread
+and handed to the game loop as BridgeCommand objects through a bounded queue.
+Spool directories are only listed when their stat metadata changed.
+"""
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+
+from file_watch import StatWatcher
+
+
+@dataclass
+class BridgeCommand:
+    source: str          # "control_center" or a team id such as "T1"
+    name: str            # e.g. "roll_dice", "end_turn"
+    team_id: str = None  # set for player actions
+    payload: dict = field(default_factory=dict)
+
+
+def parse_control_command(data):
+    """Build a BridgeCommand from a control center entry, or None if malformed"""
+    if not isinstance(data, dict) or not data.get('command'):
+        return None
+    return BridgeCommand(source=data.get('source', 'control_center'),
+                         name=data['command'], payload=data)
+
+
+def parse_player_action(data):
+    """Build a BridgeCommand from a team page entry, or None if malformed"""
+    if not isinstance(data, dict) or not data.get('action') or not data.get('team_id'):
+        return None
+    return BridgeCommand(source=data['team_id'], name=data['action'],
+                         team_id=data['team_id'], payload=data)
+
+
+class BridgeWorker(threading.Thread):
+    """Owns all bridge file I/O on a background thread"""
+
+    def __init__(self, publisher, control_spool, action_spool, event_log=None,
+                 poll_interval=0.05, outbox_size=32, inbox_size=64, log_flush_interval=0.5):
+        super().__init__(name="streamlit-bridge", daemon=True)
+        self.publisher = publisher
+        self.event_log = event_log
+        self.log_flush_interval = log_flush_interval
+        self._next_log_flush = 0.0
+        self.control_spool = control_spool
+        self.action_spool = action_spool
+        self.control_watch = StatWatcher(control_spool.new_dir)
+        self.action_watch = StatWatcher(action_spool.new_dir)
+        self.poll_interval = poll_interval
+        self.outbox = queue.Queue(maxsize=outbox_size)
+        self.inbox = queue.Queue(maxsize=inbox_size)
+        self._stop_event = threading.Event()
+
+    # ---- game thread API -------------------------------------------------
+
+    def submit_state(self, state):
+        """Queue a state snapshot for publishing (older unwritten snapshots are dropped)"""
+        self._put_outbound(state)
+
+    def get_command(self):
+        """Return the next parsed inbound command, or None if none is pending"""
+        try:
+            return self.inbox.get_nowait()
+        except queue.Empty:
+            return None
+
+    def watch_stats(self):
+        """Skipped vs performed spool directory reads, to confirm polling savings"""
+        return [self.control_watch.stats(), self.action_watch.stats()]
+
+    def stop(self, timeout=1.0):
+        """Stop the worker after flushing anything still queued"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
+
+    def _put_outbound(self, item):
+        while True:
+            try:
+                self.outbox.put_nowait(item)
+                return
+            except queue.Full:
+                # Drop the oldest snapshot; it is superseded by newer ones anyway
+                try:
+                    self.outbox.get_nowait()
+                except queue.Empty:
+                    pass
+
+    # ---- worker thread ---------------------------------------------------
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                self._flush_outbound(block=True)
+                self._poll_inbound()
+                self._flush_event_log(force=False)
+            except Exception as e:
+                print(f"Streamlit bridge error: {e}")
+        try:
+            self._flush_outbound(block=False)
+            self._flush_event_log(force=True)
+        except Exception as e:
+            print(f"Streamlit bridge error during shutdown: {e}")
+
+    def _flush_outbound(self, block):
+        try:
+            latest_state = self.outbox.get(timeout=self.poll_interval) if block else self.outbox.get_nowait()
+        except queue.Empty:
+            return
+        # Coalesce: only the newest queued snapshot is published
+        while True:
+            try:
+                latest_state = self.outbox.get_nowait()
+            except queue.Empty:
+                break
+        self.publisher.publish(latest_state)
+
+    def _flush_event_log(self, force):
+        # Batch event log appends instead of opening the file per event
+        if self.event_log is None:
+            return
+        now = time.monotonic()
+        if not force and now < self._next_log_flush:
+            return
+        self._next_log_flush = now + self.log_flush_interval
+        self.event_log.flush()
+
+    def _poll_inbound(self):
+        self._drain_spool(self.control_spool, self.control_watch, parse_control_command)
+        self._drain_spool(self.action_spool, self.action_watch, parse_player_action)
+
+    def _drain_spool(self, spool, watch, parse):
+        # Only list the spool directory when its stat metadata changed
+        if not watch.changed():
+            return
+        for name in spool.pending():
+            if self.inbox.full():
+                # Leave the rest spooled until the game catches up
+                watch.invalidate()
+                return
+            data = spool.read(name)
+            command = parse(data) if data is not None else None
+            if command is not None:
+                self.inbox.put_nowait(command)
+            spool.discard(name)
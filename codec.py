@@ -0,0 +1,235 @@
+"""
+Pluggable serializers for the bridge files.
+
+Available codecs:
+
+    json     compact stdlib JSON (the default)
+    orjson   JSON via orjson, when installed
+    msgpack  MessagePack via msgpack, when installed
+    packed   dependency-free struct-packed binary
+
+The writing codec is chosen with the ARTHVIDYA_BRIDGE_CODEC environment
+variable; readers never need to know it, because decode() detects the format
+from the first bytes. Binary formats start with a marker that cannot begin a
+JSON document.
+"""
+import itertools
+import json
+import os
+import struct
+from collections import namedtuple
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+_tmp_counter = itertools.count()
+
+DEFAULT_CODEC = "json"
+CODEC_ENV_VAR = "ARTHVIDYA_BRIDGE_CODEC"
+
+PACKED_MAGIC = b"AMP1"
+MSGPACK_MAGIC = b"\xc1"  # a byte MessagePack itself never uses
+
+Codec = namedtuple("Codec", ["name", "encode", "decode"])
+
+
+# ---- packed binary ----------------------------------------------------------
+# Tagged values; short strings and containers use a one-byte length and small
+# integers four bytes, so typical snapshots pack smaller than compact JSON.
+
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+
+def _pack_size(short_tag, long_tag, size, out):
+    if size < 256:
+        out += short_tag
+        out += _U8.pack(size)
+    else:
+        out += long_tag
+        out += _U32.pack(size)
+
+
+def _pack_str(text, out):
+    data = text.encode("utf-8")
+    _pack_size(b"s", b"S", len(data), out)
+    out += data
+
+
+def _pack_value(value, out):
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int):
+        if -2 ** 31 <= value < 2 ** 31:
+            out += b"i"
+            out += _I32.pack(value)
+        elif -2 ** 63 <= value < 2 ** 63:
+            out += b"q"
+            out += _I64.pack(value)
+        else:
+            out += b"I"
+            _pack_str(str(value), out)
+    elif isinstance(value, float):
+        out += b"d"
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        _pack_str(value, out)
+    elif isinstance(value, (list, tuple)):
+        _pack_size(b"l", b"L", len(value), out)
+        for item in value:
+            _pack_value(item, out)
+    elif isinstance(value, dict):
+        _pack_size(b"m", b"M", len(value), out)
+        for key, item in value.items():
+            _pack_str(str(key), out)
+            _pack_value(item, out)
+    else:
+        raise TypeError(f"cannot pack {type(value).__name__}")
+
+
+def _unpack_size(tag, buf, offset):
+    if tag.islower():
+        return buf[offset], offset + 1
+    return _U32.unpack_from(buf, offset)[0], offset + _U32.size
+
+
+def _unpack_value(buf, offset):
+    tag = bytes(buf[offset:offset + 1])
+    offset += 1
+    if tag == b"N":
+        return None, offset
+    if tag == b"T":
+        return True, offset
+    if tag == b"F":
+        return False, offset
+    if tag == b"i":
+        return _I32.unpack_from(buf, offset)[0], offset + _I32.size
+    if tag == b"q":
+        return _I64.unpack_from(buf, offset)[0], offset + _I64.size
+    if tag == b"d":
+        return _F64.unpack_from(buf, offset)[0], offset + _F64.size
+    if tag == b"I":
+        text, offset = _unpack_value(buf, offset)
+        return int(text), offset
+    if tag in (b"s", b"S"):
+        size, offset = _unpack_size(tag, buf, offset)
+        return str(buf[offset:offset + size], "utf-8"), offset + size
+    if tag in (b"l", b"L"):
+        count, offset = _unpack_size(tag, buf, offset)
+        items = []
+        for _ in range(count):
+            item, offset = _unpack_value(buf, offset)
+            items.append(item)
+        return items, offset
+    if tag in (b"m", b"M"):
+        count, offset = _unpack_size(tag, buf, offset)
+        mapping = {}
+        for _ in range(count):
+            key, offset = _unpack_value(buf, offset)
+            mapping[key], offset = _unpack_value(buf, offset)
+        return mapping, offset
+    raise ValueError(f"bad packed tag {tag!r} at offset {offset - 1}")
+
+
+def _packed_encode(obj):
+    out = bytearray(PACKED_MAGIC)
+    _pack_value(obj, out)
+    return bytes(out)
+
+
+def _packed_decode(data):
+    value, offset = _unpack_value(memoryview(data), len(PACKED_MAGIC))
+    if offset != len(data):
+        raise ValueError("trailing data after packed value")
+    return value
+
+
+# ---- codec table ------------------------------------------------------------
+
+def _json_encode(obj):
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_decode(data):
+    return json.loads(data)
+
+
+CODECS = {
+    "json": Codec("json", _json_encode, _json_decode),
+    "packed": Codec("packed", _packed_encode, _packed_decode),
+}
+if orjson is not None:
+    CODECS["orjson"] = Codec("orjson", orjson.dumps, orjson.loads)
+if msgpack is not None:
+    CODECS["msgpack"] = Codec(
+        "msgpack",
+        lambda obj: MSGPACK_MAGIC + msgpack.packb(obj),
+        lambda data: msgpack.unpackb(data[len(MSGPACK_MAGIC):], strict_map_key=False),
+    )
+
+
+def get_codec(name=None):
+    """Return the named codec, or the configured one; unknown or missing codecs fall back to JSON"""
+    if name is None:
+        name = os.environ.get(CODEC_ENV_VAR, DEFAULT_CODEC)
+    codec = CODECS.get(name)
+    if codec is None:
+        print(f"Bridge codec {name!r} is not available, using {DEFAULT_CODEC}")
+        codec = CODECS[DEFAULT_CODEC]
+    return codec
+
+
+def decode(data):
+    """Decode bytes written by any codec, detecting the format; raises ValueError if invalid"""
+    try:
+        if data.startswith(PACKED_MAGIC):
+            return _packed_decode(data)
+        if data.startswith(MSGPACK_MAGIC):
+            if msgpack is None:
+                raise ValueError("data is MessagePack but msgpack is not installed")
+            return CODECS["msgpack"].decode(data)
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError:
+        raise
+    except Exception as e:
+        # struct.error, UnicodeDecodeError, msgpack errors, ...
+        raise ValueError(f"cannot decode bridge data: {e}") from e
+
+
+def dump(path, obj, codec=None):
+    """Atomically replace path with obj encoded by codec (readers never see a partial file)"""
+    codec = codec or get_codec()
+    # Unique per writer, so concurrent writers of the same file never share a temp file
+    tmp_path = f"{path}.{os.getpid()}.{next(_tmp_counter)}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(codec.encode(obj))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load(path):
+    """Read and decode path; raises OSError or ValueError"""
+    with open(path, 'rb') as f:
+        return decode(f.read())
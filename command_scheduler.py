@@ -0,0 +1,137 @@
+"""
+Scheduling of bridge commands inside the game loop.
+
+Every command source (the control center, each team page) gets its own
+bounded FIFO. Submitting a command that is identical to one still queued, or
+to one executed within the coalescing window, is coalesced into it instead
+of queued again, so hammering a button cannot flood the game.
+
+Each frame the game drains the queues round-robin (one command per source
+per round) within its time budget. Before a command runs, the game's check
+function decides whether it is valid right now: a command that is only
+temporarily invalid (e.g. the token is still moving) stays at the head of its
+queue until it becomes valid or times out; an invalid one is rejected. Every
+outcome is reported with a reason the clients can show.
+"""
+import time
+from collections import OrderedDict, deque
+
+MAX_QUEUED_PER_SOURCE = 8
+COALESCE_WINDOW_S = 1.0
+DEFER_TIMEOUT_S = 10.0
+
+# Command outcomes reported to on_result(command, status, reason)
+EXECUTED = "executed"
+COALESCED = "coalesced"
+DEFERRED = "deferred"
+REJECTED = "rejected"
+
+# Check results
+READY = None
+
+
+def defer(reason):
+    return (DEFERRED, reason)
+
+
+def reject(reason):
+    return (REJECTED, reason)
+
+
+class _Queued:
+    __slots__ = ("command", "key", "queued_at", "deferred_reason")
+
+    def __init__(self, command, key, queued_at):
+        self.command = command
+        self.key = key
+        self.queued_at = queued_at
+        self.deferred_reason = None
+
+
+class CommandScheduler:
+    """Bounded per-source command queues with coalescing and deferral"""
+
+    def __init__(self, on_result=None, max_per_source=MAX_QUEUED_PER_SOURCE,
+                 coalesce_window=COALESCE_WINDOW_S, defer_timeout=DEFER_TIMEOUT_S):
+        self.on_result = on_result
+        self.max_per_source = max_per_source
+        self.coalesce_window = coalesce_window
+        self.defer_timeout = defer_timeout
+        self.queues = OrderedDict()
+        self.last_executed = {}  # command key -> monotonic time it last ran
+        self.counts = {EXECUTED: 0, COALESCED: 0, DEFERRED: 0, REJECTED: 0}
+
+    @staticmethod
+    def command_key(command):
+        return (command.source, command.team_id, command.name)
+
+    def pending(self):
+        return sum(len(q) for q in self.queues.values())
+
+    def submit(self, command, now=None):
+        """Queue a command; returns False if it was coalesced or rejected"""
+        now = time.monotonic() if now is None else now
+        key = self.command_key(command)
+        fifo = self.queues.setdefault(command.source, deque())
+        if any(item.key == key for item in fifo):
+            self._report(command, COALESCED, "same command is already queued")
+            return False
+        executed_at = self.last_executed.get(key)
+        if executed_at is not None and now - executed_at < self.coalesce_window:
+            self._report(command, COALESCED, "same command was just executed")
+            return False
+        if len(fifo) >= self.max_per_source:
+            self._report(command, REJECTED, "too many queued commands")
+            return False
+        fifo.append(_Queued(command, key, now))
+        return True
+
+    def run(self, check, execute, deadline):
+        """Execute ready commands round-robin until none is ready or deadline (perf_counter) passes"""
+        progress = True
+        while progress and time.perf_counter() < deadline:
+            progress = False
+            for source in list(self.queues):
+                fifo = self.queues[source]
+                if self._run_head(fifo, check, execute):
+                    progress = True
+                if not fifo:
+                    del self.queues[source]
+                if time.perf_counter() >= deadline:
+                    return
+
+    def _run_head(self, fifo, check, execute):
+        """Try the head command of one queue; returns True if it was consumed"""
+        if not fifo:
+            return False
+        item = fifo[0]
+        verdict = check(item.command)
+        now = time.monotonic()
+        if verdict is READY:
+            fifo.popleft()
+            self.last_executed[item.key] = now
+            try:
+                execute(item.command)
+            except Exception as e:
+                self._report(item.command, REJECTED, f"error: {e}")
+                return True
+            self._report(item.command, EXECUTED, None)
+            return True
+
+        status, reason = verdict
+        if status == DEFERRED and now - item.queued_at < self.defer_timeout:
+            if item.deferred_reason != reason:
+                # Report each new deferral reason once, not every frame
+                item.deferred_reason = reason
+                self._report(item.command, DEFERRED, reason)
+            return False
+        fifo.popleft()
+        if status == DEFERRED:
+            reason = f"timed out waiting: {reason}"
+        self._report(item.command, REJECTED, reason)
+        return True
+
+    def _report(self, command, status, reason):
+        self.counts[status] += 1
+        if self.on_result is not None:
+            self.on_result(command, status, reason)
@@ -0,0 +1,103 @@
+"""
+Dirty-rectangle tracking for the pygame renderer.
+
+Drawing code registers each dynamic element once per frame with a key, its
+screen rect and a signature of whatever determines its pixels (position,
+balance, hover state, ...). At the end of the frame the tracker compares
+this with the previous frame and returns only the regions whose elements
+moved, changed, appeared or disappeared, so the game can push those with
+pygame.display.update(rects) instead of flipping the whole window.
+"""
+import pygame
+
+FULL_UPDATE_FRACTION = 0.5  # push the whole screen when more than this is dirty
+DEBUG_OUTLINE_COLOR = (0, 200, 0)
+
+
+class DirtyTracker:
+    """Collects changed screen regions between frames"""
+
+    def __init__(self, debug=False):
+        self.debug = debug
+        self.screen_rect = None
+        self.regions = {}  # key -> (rect, signature) as of the last frame
+        self.current = {}
+        self.dirty = []
+        self.full = True
+        self.last_outlines = []
+        self.frames = 0
+        self.full_frames = 0
+        self.pushed_pixels = 0
+        self.total_pixels = 0
+
+    def begin_frame(self, screen_rect):
+        if screen_rect != self.screen_rect:
+            self.screen_rect = pygame.Rect(screen_rect)
+            self.full = True
+        self.current = {}
+        self.dirty = []
+
+    def track(self, key, rect, signature=None):
+        """Register a dynamic element; it is dirty if its rect or signature changed"""
+        rect = pygame.Rect(rect)
+        self.current[key] = (rect, signature)
+        previous = self.regions.get(key)
+        if previous is None:
+            self.dirty.append(rect)
+        elif previous[0] != rect or previous[1] != signature:
+            self.dirty.append(rect.union(previous[0]))
+
+    def mark(self, rect):
+        self.dirty.append(pygame.Rect(rect))
+
+    def mark_all(self):
+        self.full = True
+
+    def end_frame(self):
+        """Return the rects to push this frame"""
+        for key, (rect, _) in self.regions.items():
+            if key not in self.current:
+                self.dirty.append(rect)  # element disappeared
+        self.regions = self.current
+
+        screen_area = self.screen_rect.width * self.screen_rect.height
+        rects = _merge([r.clip(self.screen_rect) for r in self.dirty if r.width and r.height])
+        if self.full or sum(r.width * r.height for r in rects) > FULL_UPDATE_FRACTION * screen_area:
+            rects = [self.screen_rect.copy()]
+            self.full_frames += 1
+        self.full = False
+
+        self.frames += 1
+        self.total_pixels += screen_area
+        self.pushed_pixels += sum(r.width * r.height for r in rects)
+        return rects
+
+    def draw_outlines(self, surface, rects):
+        """Outline this frame's dirty rects; returns rects extended so stale outlines get erased"""
+        for rect in rects:
+            pygame.draw.rect(surface, DEBUG_OUTLINE_COLOR, rect, 1)
+        pushed = rects + self.last_outlines
+        self.last_outlines = [r.copy() for r in rects]
+        return pushed
+
+    def stats(self):
+        pushed = self.pushed_pixels / self.total_pixels if self.total_pixels else 0.0
+        return {"frames": self.frames, "full_frames": self.full_frames, "pushed_fraction": pushed}
+
+
+def _merge(rects):
+    """Merge overlapping rects so display.update gets fewer, larger regions"""
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        changed = True
+        while changed:
+            changed = False
+            for other in merged:
+                if rect.colliderect(other):
+                    merged.remove(other)
+                    rect.union_ip(other)
+                    changed = True
+                    break
+        merged.append(rect)
+    return merged
@@ -0,0 +1,1118 @@
+"""
+Headless rules engine for Arthvidya Monopoly.
+
+GameEngine holds the whole game state (teams, ownership, turn, overlays,
+spin wheel, timers and undo history) and applies the game actions: rolling,
+moving, tile effects, buying, chance and mystery cards, selling and trading.
+It imports nothing from pygame, so servers, simulators and tests can create
+one in a fraction of a millisecond and play games without a window; main.Game
+subclasses it and only adds the window, drawing, sounds and the Streamlit
+bridge.
+
+Time only advances through step(dt): token movement, the spin wheel and the
+named timers (feedback popups, mystery auto-apply) all run on the engine's
+simulated clock, so a simulation can step as fast as it likes. Pass a seed for
+reproducible dice and card draws; without one the dice are reseeded from the
+wall clock on every roll as the live game always did. Simulations that never
+undo can pass history_size=0 to skip the undo snapshots taken before each
+action.
+
+_play_sound() and log_streamlit_event() are hooks that do nothing here and
+are overridden by the pygame front end. check_streamlit_command() decides
+whether a command from the web pages may run now; it lives here so the rules
+for commands sent mid-move can be tested without a window.
+"""
+import random
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+
+from command_scheduler import READY, defer, reject
+from ownership import OwnershipIndex
+from timers import TimerScheduler
+
+BOARD_SPACES = 24
+CHANCE_TILES = [4, 8, 16, 20]
+MYSTERY_TILES = [2, 10, 14, 22]
+STARTING_BALANCE = 10_000_000
+GO_BONUS = 2_000_000  # for passing or landing on GO
+SOCIETY_PENALTY_TILE = 6
+SOCIETY_PENALTY = 1_000_000  # and the team skips its next turn
+FREE_PARKING_TILE = 12
+EVENT_PENALTY_TILE = 18
+EVENT_PENALTY = 1_500_000
+MOVE_TILES_PER_S = 3.6  # token speed (was 0.06 of a tile per frame at 60 FPS)
+FEEDBACK_DURATION_S = 2.0
+MYSTERY_APPLY_DELAY_S = 5.0
+SPIN_DURATION_S = 4.0
+SPIN_SAMPLE_RATE = 60  # the frame rate the spin speeds were tuned for
+
+STREAMLIT_CONTROL_COMMANDS = ('roll_dice', 'next_turn', 'buy_property', 'sell_property',
+                              'test_chance', 'test_mystery', 'start_trading', 'reset_game')
+STREAMLIT_PLAYER_ACTIONS = ('roll_dice', 'end_turn', 'buy_property', 'sell_property',
+                            'take_chance', 'spin_mystery', 'start_trading')
+# Player actions that wait for a moving token instead of being rejected; the
+# others depend on the tile it lands on, which the player has not seen yet
+DEFERRED_WHILE_MOVING = ('sell_property', 'start_trading')
+
+
+@dataclass
+class Team:
+    team_id: str
+    name: str
+    color: tuple
+    balance: int
+    pos: int
+
+
+def spin_trajectory(frames, start_speed, target_angle):
+    """Per-frame wheel angles for a spin that decelerates and stops on target_angle (mod 360)
+
+    Follows the game's speed profile (constant, linear slowdown, then cubic
+    decay) and stretches it slightly so the last angle lands exactly on the
+    target segment instead of snapping to it.
+    """
+    profile = _spin_profile(frames, start_speed)
+    total = profile[-1]
+    scale = (total + (target_angle - total) % 360) / total
+    return [angle * scale for angle in profile]
+
+
+@lru_cache(maxsize=8)
+def _spin_profile(frames, start_speed):
+    """Cumulative unscaled angles of the speed profile; every spin uses the same one"""
+    speeds = []
+    for step in range(1, frames + 1):
+        progress = step / frames
+        if progress < 0.6:
+            speed = start_speed
+        elif progress < 0.85:
+            speed = start_speed * (1.0 - (progress - 0.6) / 0.25)
+        else:
+            speed = start_speed * ((1.0 - progress) ** 3) * 2
+        speeds.append(max(speed, 0.5))
+    angles = []
+    angle = 0.0
+    for speed in speeds:
+        angle += speed
+        angles.append(angle)
+    return tuple(angles)
+
+
+def spin_angle_at(trajectory, fraction):
+    """Angle fraction (0..1) of the way through a trajectory, interpolated between its samples"""
+    position = max(0.0, min(fraction, 1.0)) * len(trajectory)
+    index = int(position)
+    if index >= len(trajectory):
+        return trajectory[-1]
+    previous = trajectory[index - 1] if index > 0 else 0.0
+    return previous + (trajectory[index] - previous) * (position - index)
+
+
+class GameEngine:
+    """Game state and rules, without any rendering"""
+
+    def __init__(self, seed=None, verbose=False, history_size=50):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.verbose = verbose  # print the wheel's segment debug output
+        self.sim_time = 0.0  # seconds stepped so far; the clock for self.timers
+
+        self.teams = [
+            Team("T1", "Team 1", (211, 47, 47), STARTING_BALANCE, 0),
+            Team("T2", "Team 2", (25, 118, 210), STARTING_BALANCE, 0),
+            Team("T3", "Team 3", (56, 142, 60), STARTING_BALANCE, 0),
+            Team("T4", "Team 4", (245, 124, 0), STARTING_BALANCE, 0),
+            Team("T5", "Team 5", (123, 31, 162), STARTING_BALANCE, 0),
+        ]
+        self.current_idx = 0
+
+        self.properties = [
+            {"index": i, "owner": None} for i in range(BOARD_SPACES)
+        ]
+        self.moving = False
+        self.move_steps = 0
+        self.move_progress = 0.0  # 0..1 between tiles
+        self.from_pos_idx = None
+        self.to_pos_idx = None
+        self.token_trail = {t.team_id: [] for t in self.teams}
+        self.skip_next_turn = {t.team_id: False for t in self.teams}
+
+        # Overlays
+        self.show_chance = False
+        self.chance_card = None
+        self.chance_feedback = None
+        self.timers = TimerScheduler(clock=self._sim_clock)  # feedback popup and mystery auto-apply deadlines
+        self.show_chance_confirm = False  # New: confirmation popup
+
+        self.show_mystery = False
+        self.mystery_card = None
+        self.mystery_feedback = None
+
+        # Spin wheel animation variables
+        self.spinning = False
+        self.spin_angle = 0
+        self.spin_speed = 0
+        self.spin_target_angle = 0
+        self.spin_duration = 0
+        self.spin_elapsed = 0.0  # seconds into the current spin
+        self.spin_trajectory = []
+        self.selected_mystery = None
+        self.target_segment = None
+
+        # Randomization tracking
+        self.used_mysteries = []
+        self.used_chance_questions = []
+        self.recent_mystery_results = []  # Track last few results to avoid repetition
+        self.max_recent_results = 3  # Don't repeat within last 3 spins
+
+        # Property selling overlay
+        self.show_sell_property = False
+        self.sell_property_feedback = None
+        # Property trading system
+        self.show_trading = False
+        self.trading_seller = None
+        self.trading_property = None
+        self.trading_offers = {}  # {team_id: offer_amount}
+        self.trading_feedback = None
+        self.trading_phase = None  # 'select_property', 'collect_offers', 'choose_buyer'
+        self.trading_mode = False
+        self.trading_offer_amounts = {}  # {team_id: current_offer_amount}
+
+        self.chance_cards = self._build_chance_cards()
+        self.mystery_cards = self._build_mystery_cards()
+        self.property_data = self._build_property_data()
+        # Kept in step with self.properties by _set_owner; read ownership from here
+        self.ownership = OwnershipIndex(self.property_data)
+
+        # Undo system
+        self.game_history = []
+        self.max_history_size = history_size  # Limit history to prevent memory issues; 0 disables undo
+
+        # Dice randomization tracking
+        self.last_dice_roll = None
+
+    def _sim_clock(self):
+        return self.sim_time
+
+    def check_streamlit_command(self, command):
+        """Decide whether a scheduled bridge command can run now, must wait, or is rejected"""
+        if command.name == 'roll_dice' and self.moving:
+            # A repeated click must not roll a second time once the token lands
+            return reject("dice already rolled, token is moving")
+        if command.team_id is None:
+            if command.name not in STREAMLIT_CONTROL_COMMANDS:
+                return reject(f"unknown command '{command.name}'")
+            return READY
+
+        if command.name not in STREAMLIT_PLAYER_ACTIONS:
+            return reject(f"unknown action '{command.name}'")
+        if not self.teams or command.team_id != self.teams[self.current_idx].team_id:
+            return reject("it is not your turn")
+        if self.moving:
+            if command.name in DEFERRED_WHILE_MOVING:
+                return defer("token is still moving")
+            return reject("token is still moving")
+        if command.name == 'take_chance' and not self.show_chance_confirm:
+            return reject("there is no chance card to take")
+        if command.name == 'spin_mystery' and not self.show_mystery:
+            return reject("there is no mystery wheel to spin")
+        return READY
+
+    def _play_sound(self, sound_name):
+        """Hook: the pygame front end plays the named sound effect"""
+
+    def log_streamlit_event(self, message):
+        """Hook: the pygame front end forwards game events to the Streamlit pages"""
+
+    def step(self, dt):
+        """Advance movement, the spin wheel and the timers by dt seconds"""
+        self.sim_time += dt
+        if self.moving:
+            # Slow smooth interpolation
+            self.move_progress += MOVE_TILES_PER_S * dt
+            # A long step (headless simulation) may cover several tiles
+            while self.moving and self.move_progress >= 1.0:
+                self.move_progress -= 1.0
+                # commit the step
+                team = self.teams[self.current_idx]
+                # Detect wrap-around to apply GO bonus
+                if self.to_pos_idx < self.from_pos_idx:
+                    team.balance += GO_BONUS
+                team.pos = self.to_pos_idx
+                self._record_trail()
+
+                # Play movement sound
+                self._play_sound('move')
+
+                self.move_steps -= 1
+                if self.move_steps <= 0:
+                    self.moving = False
+                    self.move_progress = 0.0
+                    self._land(team)
+                else:
+                    # prepare next segment
+                    self.from_pos_idx = team.pos
+                    self.to_pos_idx = (team.pos + 1) % BOARD_SPACES
+
+        # Update spin wheel animation
+        self._update_spin_wheel(dt)
+
+        # Feedback expiry and mystery auto-apply
+        self.timers.run()
+
+    def _land(self, team):
+        """Tile effect for the team that just finished its move"""
+        if team.pos in CHANCE_TILES:
+            self.show_chance_confirm = True
+        elif team.pos in MYSTERY_TILES:
+            self._trigger_mystery()
+        elif team.pos == SOCIETY_PENALTY_TILE:
+            # Society Penalty: Pay 1M and skip next turn
+            team.balance -= SOCIETY_PENALTY
+            self.skip_next_turn[team.team_id] = True
+            self.mystery_feedback = "Society Penalty: Lost ₹1.0M, skip next turn"
+            self._start_feedback_timer()
+        elif team.pos == FREE_PARKING_TILE:
+            # Free Parking: no action
+            pass
+        elif team.pos == EVENT_PENALTY_TILE:
+            # Event Penalty – ₹1.5M
+            team.balance -= EVENT_PENALTY
+            self.mystery_feedback = "Event Penalty: Lost ₹1.5M"
+            self._start_feedback_timer()
+        # No auto-advance; user ends turn
+
+    def _build_chance_cards(self):
+        return [
+            {
+                "q": "A man walks 10 km north from point A, turns right, and walks 5 km. He then turns right again and walks 10 km. What is the man's final position with respect to his starting point A?",
+                "options": [
+                    "5 km South", 
+                    "15 km East", 
+                    "5 km East",
+                    "10 km North"
+                ],
+                "answer": 2,
+            },
+            {
+                "q": "In a family, B is the brother of A. C is the father of B. E is the mother of D. A and D are married. How is E related to C?",
+                "options": ["Daughter", "Daughter-in-law", "Wife", "Mother-in-law"],
+                "answer": 3,
+            },
+            {
+                "q": "\"Ideas for life\" is the tagline of which electronics company?",
+                "options": ["Samsung", "Sony", "Philips", "Panasonic"],
+                "answer": 3,
+            },
+            {
+                "q": "In the sport of polo, what is the term for a period of play?",
+                "options": ["Innings", "Chukkar", "Quarter", "Round"],
+                "answer": 1,
+            },
+            {
+                "q": "The \"Golden Ball\" award is presented to the best player in which major international football tournament?",
+                "options": ["UEFA European Championship", "FIFA World Cup", "Copa América", "African Cup of Nations"],
+                "answer": 1,
+            },
+            {
+                "q": "Which of the following countries is known as the \"Land of Thousand Lakes\"?",
+                "options": ["Norway", "Switzerland", "Finland", "Canada"],
+                "answer": 2,
+            },
+            {
+                "q": "The Great Victoria Desert is located on which continent?",
+                "options": ["Africa", "North America", "Australia", "South America"],
+                "answer": 2,
+            },
+            {
+                "q": "Which of the following bodies of water is the saltiest in the world, with a salinity of around 34%?",
+                "options": ["Black Sea", "Dead Sea", "Caspian Sea", "Red Sea"],
+                "answer": 1,
+            },
+            {
+                "q": "Which bowler holds the record for the most wickets taken in Test cricket?",
+                "options": ["Anil Kumble", "Shane Warne", "Muttiah Muralitharan", "James Anderson"],
+                "answer": 2,
+            },
+            {
+                "q": "The term \"Hand of God\" is most famously associated with which footballer?",
+                "options": ["Pelé", "Lionel Messi", "Diego Maradona", "Cristiano Ronaldo"],
+                "answer": 2,
+            },
+            {
+                "q": "Friends are priceless… and which brand made it official with the tagline \"Har Ek Friend Zaroori Hota Hai\"?",
+                "options": ["Vodafone", "Airtel", "Jio", "Idea"],
+                "answer": 0,
+            },
+            {
+                "q": "Rohit is facing north. He turns 90° right, then 45° left, and again 135° right. Which direction is he facing now?",
+                "options": ["South", "South-East", "West", "North-West"],
+                "answer": 2,
+            },
+            {
+                "q": "\"Impossible is Nothing\" belongs to:",
+                "options": ["Puma", "Nike", "Adidas", "Reebok"],
+                "answer": 2,
+            },
+            {
+                "q": "Which of the following sports uses a \"puck\"?",
+                "options": ["Ice Hockey", "Baseball", "Polo", "Rugby"],
+                "answer": 0,
+            },
+            {
+                "q": "Which city is known as the \"City of Seven Hills\"?",
+                "options": ["Rome", "Istanbul", "Athens", "Lisbon"],
+                "answer": 0,
+            },
+            {
+                "q": "A bus starts from point A and goes 4 km north, 3 km east, 2 km south, and 3 km west. How far is it from the starting point?",
+                "options": ["2 km", "3 km", "4 km", "1 km"],
+                "answer": 0,
+            },
+            {
+                "q": "Icy, cold, and vast —Which desert claims the title of the largest on Earth despite no sand in sight?",
+                "options": ["Sahara", "Arabian", "Gobi", "Antarctica"],
+                "answer": 3,
+            },
+            {
+                "q": "\"The Joy of Flying\" is associated with:",
+                "options": ["Air India", "Jet Airways", "Lufthansa", "Emirates"],
+                "answer": 1,
+            },
+            {
+                "q": "\"I'm Lovin' It\" was first launched as a global campaign in which year?",
+                "options": ["2001", "2003", "2005", "2007"],
+                "answer": 1,
+            },
+            {
+                "q": "Who is the only athlete to have won Olympic gold medals in both the 100m and 200m events in three consecutive Olympics?",
+                "options": ["Carl Lewis", "Usain Bolt", "Jesse Owens", "Florence Griffith-Joyner"],
+                "answer": 1,
+            },
+        ]
+
+    def _build_mystery_cards(self):
+        # Spin wheel mystery effects - 5 specific options
+        return [
+            {"type": "move", "steps": 3, "text": "Advance 3 spaces", "color": (76, 175, 80)},
+            {"type": "move", "steps": -2, "text": "Go back 2 spaces", "color": (244, 67, 54)},
+            {"type": "go_to_free_parking", "text": "Go to free parking", "color": (33, 150, 243)},
+            {"type": "go_to_society_penalty", "text": "Go to society penalty", "color": (156, 39, 176)},
+            {"type": "no_rent", "text": "No rent next turn", "color": (255, 193, 7)},
+        ]
+
+    def _build_property_data(self):
+        # Property mapping per provided board order (prices in rupees)
+        return {
+            1: {"name": "Electric Cars", "price": 3_000_000, "rent": 500_000, "color": (255, 140, 0), "description": "Next-gen EV venture"},
+            3: {"name": "Snacks & Beverages", "price": 2_500_000, "rent": 500_000, "color": (255, 140, 0), "description": "FMCG snacks and drinks"},
+            5: {"name": "Dairy Products", "price": 2_000_000, "rent": 500_000, "color": (255, 140, 0), "description": "Milk and dairy brand"},
+            7: {"name": "Wearable Tech", "price": 3_000_000, "rent": 1_000_000, "color": (34, 139, 34), "description": "Smart wearables and health"},
+            9: {"name": "Smart Home Devices", "price": 3_500_000, "rent": 1_000_000, "color": (34, 139, 34), "description": "IoT devices for home"},
+            11: {"name": "Eco Headphones", "price": 2_500_000, "rent": 1_000_000, "color": (34, 139, 34), "description": "Sustainable audio gear"},
+            13: {"name": "Fashion Tech", "price": 2_500_000, "rent": 500_000, "color": (30, 144, 255), "description": "Tech-infused apparel"},
+            15: {"name": "Luxury Accessories", "price": 3_000_000, "rent": 1_000_000, "color": (30, 144, 255), "description": "Premium accessories"},
+            17: {"name": "Sustainable Apparel", "price": 2_000_000, "rent": 500_000, "color": (30, 144, 255), "description": "Eco-friendly clothing"},
+            19: {"name": "OTT Platforms", "price": 3_000_000, "rent": 1_000_000, "color": (220, 20, 60), "description": "Streaming services"},
+            21: {"name": "Fast Food Chains", "price": 2_000_000, "rent": 500_000, "color": (220, 20, 60), "description": "Quick service restaurants"},
+            23: {"name": "Motorbikes", "price": 2_500_000, "rent": 1_000_000, "color": (220, 20, 60), "description": "Two-wheeler brand"},
+        }
+
+    def roll_dice(self):
+        # Save state before rolling dice
+        self._save_state()
+        # Enhanced randomization for better dice distribution
+        # Use multiple entropy sources for better randomness
+        if self.seed is None:
+            current_time = time.time()
+            self.rng.seed(int(current_time * 1000000) % 2**32)  # Microsecond precision seeding
+            entropy = hash(str(current_time))
+        else:
+            # Seeded engines (simulations, tests) stay reproducible
+            entropy = self.rng.getrandbits(32)
+        
+        # Generate multiple random numbers and pick the most varied one
+        dice_rolls = []
+        for _ in range(3):  # Generate 3 potential rolls
+            dice_rolls.append(self.rng.randint(1, 6))
+        
+        # Add some additional entropy from system state
+        entropy_bonus = (entropy + len(self.game_history)) % 6 + 1
+        
+        # Use weighted selection to avoid consecutive similar numbers
+        if hasattr(self, 'last_dice_roll'):
+            # Avoid repeating the same number
+            available_rolls = [r for r in dice_rolls if r != self.last_dice_roll]
+            if available_rolls:
+                d = self.rng.choice(available_rolls)
+            else:
+                d = self.rng.choice(dice_rolls)
+        else:
+            d = self.rng.choice(dice_rolls)
+        
+        # Occasionally use entropy bonus for extra variation
+        if self.rng.random() < 0.3:  # 30% chance to use entropy bonus
+            d = entropy_bonus
+        
+        # Store last roll to avoid immediate repetition
+        self.last_dice_roll = d
+        
+        # Play dice roll sound
+        self._play_sound('dice')
+        
+        # Log dice roll event
+        self.log_streamlit_event(f"{self.teams[self.current_idx].name} rolled a {d}")
+        
+        self.move_steps = d
+        self.move_progress = 0.0
+        self.moving = True
+        # prepare first segment
+        team = self.teams[self.current_idx]
+        self.from_pos_idx = team.pos
+        self.to_pos_idx = (team.pos + 1) % BOARD_SPACES
+
+    def _record_trail(self):
+        team = self.teams[self.current_idx]
+        trail = self.token_trail[team.team_id]
+        trail.append(team.pos)
+        if len(trail) > 15:
+            trail.pop(0)
+
+    def undo_move(self):
+        """Undo the last move made in the game"""
+        if self._undo_state():
+            # Clear any active overlays when undoing
+            self.show_chance = False
+            self.show_chance_confirm = False
+            self.show_mystery = False
+            self.chance_feedback = None
+            self.mystery_feedback = None
+            self.timers.cancel("feedback")
+            self.timers.cancel("mystery_apply")
+            # Stop any ongoing movement
+            self.moving = False
+            self.move_steps = 0
+            self.move_progress = 0.0
+            self.from_pos_idx = None
+            self.to_pos_idx = None
+
+    def next_turn(self):
+        # Save state before advancing turn
+        self._save_state()
+        # advance to next, honoring skip flags
+        attempts = 0
+        while attempts < len(self.teams):
+            self.current_idx = (self.current_idx + 1) % len(self.teams)
+            team = self.teams[self.current_idx]
+            if self.skip_next_turn.get(team.team_id):
+                self.skip_next_turn[team.team_id] = False
+                attempts += 1
+                continue
+            break
+        
+        # Log turn advancement
+        self.log_streamlit_event(f"Turn advanced to {self.teams[self.current_idx].name}")
+
+    def can_buy(self, team):
+        space = team.pos % BOARD_SPACES
+        # Disallow buying on GO, special tiles and free parking / penalty tiles
+        if space in {0, SOCIETY_PENALTY_TILE, FREE_PARKING_TILE, EVENT_PENALTY_TILE} or space in CHANCE_TILES or space in MYSTERY_TILES:
+            return False
+        if self.ownership.owner(space) is not None:
+            return False
+        return True
+
+    def buy_current(self):
+        team = self.teams[self.current_idx]
+        if not self.can_buy(team):
+            return
+        # Save state before buying property
+        self._save_state()
+        self._set_owner(team.pos % BOARD_SPACES, team.team_id)
+        
+        # Play property purchase sound
+        self._play_sound('purchase')
+        
+        # Log property purchase event
+        prop_name = self.property_data.get(team.pos, {}).get('name', f'Property {team.pos}')
+        self.log_streamlit_event(f"{team.name} bought {prop_name}")
+
+    def _trigger_chance(self):
+        # Choose a random chance question that hasn't been used recently
+        available_questions = [card for card in self.chance_cards if card not in self.used_chance_questions]
+        if not available_questions:
+            # If all questions have been used, reset the list
+            self.used_chance_questions = []
+            available_questions = self.chance_cards.copy()
+        
+        self.chance_card = self.rng.choice(available_questions)
+        self.used_chance_questions.append(self.chance_card)
+        self.show_chance = True
+        self.chance_feedback = None
+
+    def _confirm_chance_yes(self):
+        """Player chose to take the chance"""
+        self.show_chance_confirm = False
+        self._trigger_chance()
+
+    def _confirm_chance_no(self):
+        """Player chose to skip the chance"""
+        self.show_chance_confirm = False
+        # No penalty for skipping chance
+
+    def _test_chance(self):
+        """Test method to manually trigger chance"""
+        self.show_chance_confirm = True
+
+    def _test_mystery(self):
+        """Test method to manually trigger mystery"""
+        self._trigger_mystery()
+
+    def _test_randomization(self):
+        # Test method to check randomization - run 10 spins and show results
+        print("Testing mystery wheel randomization...")
+        results = []
+        for i in range(10):
+            # Simulate a spin without the full animation
+            num_cards = len(self.mystery_cards)
+            angle_per_segment = 360 / num_cards
+            
+            # Choose random segment
+            available_segments = list(range(num_cards))
+            for recent_result in self.recent_mystery_results:
+                if recent_result in available_segments:
+                    available_segments.remove(recent_result)
+            
+            if not available_segments:
+                available_segments = list(range(num_cards))
+                self.recent_mystery_results = []
+            
+            target_segment = self.rng.choice(available_segments)
+            self.recent_mystery_results.append(target_segment)
+            if len(self.recent_mystery_results) > self.max_recent_results:
+                self.recent_mystery_results.pop(0)
+            
+            results.append(self.mystery_cards[target_segment]["text"])
+        
+        print("Last 10 mystery results:")
+        for i, result in enumerate(results, 1):
+            print(f"  {i}: {result}")
+        
+        # Count occurrences
+        from collections import Counter
+        counts = Counter(results)
+        print("Distribution:")
+        for text, count in counts.items():
+            print(f"  {text}: {count} times")
+
+    def _save_state(self):
+        """Save current game state to history for undo functionality"""
+        if not self.max_history_size:
+            return
+        state = {
+            'teams': [
+                {
+                    'team_id': team.team_id,
+                    'name': team.name,
+                    'color': team.color,
+                    'balance': team.balance,
+                    'pos': team.pos
+                } for team in self.teams
+            ],
+            'current_idx': self.current_idx,
+            'owners': self.ownership.snapshot(),
+            'moving': self.moving,
+            'move_steps': self.move_steps,
+            'move_progress': self.move_progress,
+            'from_pos_idx': self.from_pos_idx,
+            'to_pos_idx': self.to_pos_idx,
+            'token_trail': {k: v.copy() for k, v in self.token_trail.items()},
+            'skip_next_turn': self.skip_next_turn.copy(),
+            'show_chance': self.show_chance,
+            'chance_card': self.chance_card,
+            'chance_feedback': self.chance_feedback,
+            'show_chance_confirm': self.show_chance_confirm,
+            'feedback_remaining': self.timers.remaining("feedback"),
+            'show_mystery': self.show_mystery,
+            'mystery_card': self.mystery_card,
+            'mystery_feedback': self.mystery_feedback,
+            'mystery_apply_remaining': self.timers.remaining("mystery_apply"),
+            'show_sell_property': self.show_sell_property,
+            'sell_property_feedback': self.sell_property_feedback,
+            'spinning': self.spinning,
+            'spin_angle': self.spin_angle,
+            'spin_speed': self.spin_speed,
+            'spin_target_angle': self.spin_target_angle,
+            'spin_duration': self.spin_duration,
+            'spin_elapsed': self.spin_elapsed,
+            'selected_mystery': self.selected_mystery,
+            'used_mysteries': self.used_mysteries.copy(),
+            'used_chance_questions': self.used_chance_questions.copy()
+        }
+        
+        # Add to history and limit size
+        self.game_history.append(state)
+        if len(self.game_history) > self.max_history_size:
+            self.game_history.pop(0)
+
+    def _undo_state(self):
+        """Restore previous game state from history"""
+        if not self.game_history:
+            return False
+        
+        state = self.game_history.pop()
+        
+        # Restore teams
+        for i, team_data in enumerate(state['teams']):
+            self.teams[i].team_id = team_data['team_id']
+            self.teams[i].name = team_data['name']
+            self.teams[i].color = team_data['color']
+            self.teams[i].balance = team_data['balance']
+            self.teams[i].pos = team_data['pos']
+        
+        # Restore game state
+        self.current_idx = state['current_idx']
+        for tile, owner in self.ownership.changes_to(state['owners']):
+            self._set_owner(tile, owner)
+        self.moving = state['moving']
+        self.move_steps = state['move_steps']
+        self.move_progress = state['move_progress']
+        self.from_pos_idx = state['from_pos_idx']
+        self.to_pos_idx = state['to_pos_idx']
+        self.token_trail = state['token_trail']
+        self.skip_next_turn = state['skip_next_turn']
+        self.show_chance = state['show_chance']
+        self.chance_card = state['chance_card']
+        self.chance_feedback = state['chance_feedback']
+        self.show_chance_confirm = state.get('show_chance_confirm', False)
+        self._restore_timer("feedback", state['feedback_remaining'], self._clear_feedback)
+        self.show_mystery = state['show_mystery']
+        self.mystery_card = state['mystery_card']
+        self.mystery_feedback = state['mystery_feedback']
+        self._restore_timer("mystery_apply", state['mystery_apply_remaining'], self._auto_apply_mystery)
+        self.show_sell_property = state['show_sell_property']
+        self.sell_property_feedback = state['sell_property_feedback']
+        self.spinning = state.get('spinning', False)
+        self.spin_angle = state.get('spin_angle', 0)
+        self.spin_speed = state.get('spin_speed', 0)
+        self.spin_target_angle = state.get('spin_target_angle', 0)
+        self.spin_duration = state.get('spin_duration', SPIN_DURATION_S)
+        self.spin_elapsed = state.get('spin_elapsed', 0.0)
+        if self.spinning:
+            # The saved target is the end of the saved trajectory, so this rebuilds it exactly
+            self.spin_trajectory = spin_trajectory(self.spin_samples(), self.spin_speed, self.spin_target_angle)
+        self.selected_mystery = state.get('selected_mystery', None)
+        self.used_mysteries = state.get('used_mysteries', [])
+        self.used_chance_questions = state.get('used_chance_questions', [])
+        
+        return True
+
+    def _reset_game(self):
+        # Reset all game state
+        for team in self.teams:
+            team.pos = 0
+            team.balance = STARTING_BALANCE
+        self.current_idx = 0
+        self.moving = False
+        self.move_steps = 0
+        self.move_progress = 0.0
+        self.from_pos_idx = None
+        self.to_pos_idx = None
+        self.token_trail = {t.team_id: [] for t in self.teams}
+        self.show_chance = False
+        self.chance_card = None
+        self.chance_feedback = None
+        self.show_chance_confirm = False
+        self.timers.cancel("feedback")
+        self.timers.cancel("mystery_apply")
+        self.show_mystery = False
+        self.mystery_card = None
+        self.mystery_feedback = None
+        self.spinning = False
+        self.spin_angle = 0
+        self.spin_speed = 0
+        self.spin_target_angle = 0
+        self.spin_duration = 0
+        self.spin_elapsed = 0.0
+        self.selected_mystery = None
+        self.used_mysteries = []
+        self.used_chance_questions = []
+        self.recent_mystery_results = []
+        # Reset all properties
+        for tile in list(self.ownership.owner_of):
+            self._set_owner(tile, None)
+        # Clear history on reset
+        self.game_history = []
+        # Reset dice tracking
+        self.last_dice_roll = None
+
+    def _trigger_mystery(self):
+        self.show_mystery = True
+        self.mystery_feedback = None
+        self._start_spin_wheel()
+
+    def _adjust_balance(self, team_index, delta):
+        try:
+            # Save state before adjusting balance
+            self._save_state()
+            self.teams[team_index].balance += int(delta)
+        except Exception:
+            pass
+
+    def _check_chance_answer(self, selected_index):
+        # Save state before checking answer
+        self._save_state()
+        correct = selected_index == self.chance_card["answer"]
+        if correct:
+            self.chance_feedback = "Correct! 🎉"
+        else:
+            self.chance_feedback = "Incorrect ❌"
+        self._start_feedback_timer()
+        # Close overlay immediately to keep flow clear
+        self.show_chance = False
+
+    def _apply_mystery(self):
+        # Save state before applying mystery
+        self._save_state()
+        card = self.mystery_card
+        team = self.teams[self.current_idx]
+        
+        if card["type"] == "move":
+            # Move relative steps, clamped within board using modulo
+            steps = card["steps"]
+            team.pos = (team.pos + steps) % BOARD_SPACES
+            if steps > 0:
+                self.mystery_feedback = f"Advanced {steps} spaces!"
+            else:
+                self.mystery_feedback = f"Went back {abs(steps)} spaces!"
+        elif card["type"] == "go_to_free_parking":
+            # Go to free parking (position 12)
+            team.pos = FREE_PARKING_TILE
+            self.mystery_feedback = "Moved to Free Parking!"
+        elif card["type"] == "go_to_society_penalty":
+            # Go to society penalty (position 6)
+            team.pos = SOCIETY_PENALTY_TILE
+            self.mystery_feedback = "Moved to Society Penalty!"
+        elif card["type"] == "no_rent":
+            # Set a flag for no rent next turn (this would need to be implemented in rent collection)
+            self.mystery_feedback = "No rent next turn! (Note: Manual implementation needed)"
+        
+        self._start_feedback_timer()
+        self.show_mystery = False
+        self.selected_mystery = None
+
+    def _start_spin_wheel(self):
+        """Start the spin wheel animation"""
+        self.spinning = True
+        self.spin_angle = 0
+        self.spin_speed = 30  # Initial spin speed
+        
+        # Play wheel spinning sound
+        self._play_sound('spin')
+        self.spin_duration = SPIN_DURATION_S
+        self.spin_elapsed = 0.0
+        self.selected_mystery = None
+        self.mystery_card = None  # Will be determined after spin completes
+        
+        # Calculate target angle to land on a specific segment
+        num_cards = len(self.mystery_cards)
+        angle_per_segment = 360 / num_cards
+        
+        # Choose a random segment to land on with anti-repetition logic
+        # Avoid repeating recent results
+        available_segments = list(range(num_cards))
+        
+        # Remove recently used segments from available options
+        for recent_result in self.recent_mystery_results:
+            if recent_result in available_segments:
+                available_segments.remove(recent_result)
+        
+        # If all segments were recently used, reset the list
+        if not available_segments:
+            available_segments = list(range(num_cards))
+            self.recent_mystery_results = []
+        
+        # Choose from available segments
+        target_segment = self.rng.choice(available_segments)
+        
+        # Add some randomness to the segment positioning to avoid always landing exactly in center
+        # This adds a small random offset within the segment
+        segment_offset = self.rng.uniform(-angle_per_segment * 0.3, angle_per_segment * 0.3)
+        
+        # Calculate the angle needed to position that segment at the top (0 degrees)
+        # We want the segment to be at 0 degrees when the wheel stops
+        segment_center_angle = target_segment * angle_per_segment + (angle_per_segment / 2) + segment_offset
+        
+        # Add multiple full rotations for visual effect with more variation
+        min_rotations = 5
+        max_rotations = 10
+        rotations = self.rng.randint(min_rotations, max_rotations)
+        
+        # Add some additional random angle to make it more unpredictable
+        extra_random_angle = self.rng.uniform(0, 360)
+        
+        # Calculate final target angle
+        # We need to rotate so that the segment ends up at 0 degrees
+        target_angle = rotations * 360 + (360 - segment_center_angle) + extra_random_angle
+        
+        # Precompute the angle for every frame; it ends on the target (mod 360)
+        self.spin_trajectory = spin_trajectory(self.spin_samples(), self.spin_speed, target_angle)
+        self.spin_target_angle = self.spin_trajectory[-1]
+        
+        # Store the target segment for debugging/verification
+        self.target_segment = target_segment
+
+    def spin_samples(self):
+        """Trajectory length: one angle per 1/SPIN_SAMPLE_RATE s, the rate the spin speeds were tuned for"""
+        return max(1, round(self.spin_duration * SPIN_SAMPLE_RATE))
+
+    def _update_spin_wheel(self, dt):
+        """Update spin wheel animation"""
+        if not self.spinning:
+            return
+            
+        self.spin_elapsed += dt
+        
+        # Follow the precomputed trajectory (constant speed, then smooth deceleration)
+        self.spin_angle = spin_angle_at(self.spin_trajectory, self.spin_elapsed / self.spin_duration)
+        
+        # Check if spin is complete
+        if self.spin_elapsed >= self.spin_duration:
+            self.spinning = False
+            # Set exact target angle
+            self.spin_angle = self.spin_target_angle
+            
+            # Determine which segment is under the arrow (at 0 degrees)
+            self._determine_selected_mystery()
+            
+            # Auto-apply the mystery after a longer delay (4-5 seconds)
+            self.timers.schedule("mystery_apply", MYSTERY_APPLY_DELAY_S, self._auto_apply_mystery)
+
+    def _auto_apply_mystery(self):
+        if self.selected_mystery and not self.spinning:
+            self._apply_mystery()
+
+    def _start_feedback_timer(self):
+        """Keep the current feedback message up for FEEDBACK_DURATION_S"""
+        self.timers.schedule("feedback", FEEDBACK_DURATION_S, self._clear_feedback)
+
+    def _clear_feedback(self):
+        self.chance_feedback = None
+        self.mystery_feedback = None
+        self.sell_property_feedback = None
+
+    def _restore_timer(self, name, remaining, callback):
+        if remaining > 0:
+            self.timers.schedule(name, remaining, callback)
+        else:
+            self.timers.cancel(name)
+
+    def _determine_selected_mystery(self):
+        """Determine which mystery segment is under the arrow (at 0 degrees)"""
+        num_cards = len(self.mystery_cards)
+        angle_per_segment = 360 / num_cards
+        
+        # Normalize the final angle to 0-360 range
+        final_angle = self.spin_angle % 360
+        
+        # The arrow points to 0 degrees (top of the wheel)
+        # We need to find which segment is currently at the top (0 degrees)
+        # Since segments rotate with the wheel, we need to find which segment's center
+        # is closest to the 0 degree position after rotation
+        
+        # Find which segment is closest to 0 degrees (top)
+        min_distance = float('inf')
+        selected_index = 0
+        
+        # Debug: print segment positions
+        segment_positions = []
+        
+        for i in range(num_cards):
+            # Calculate where this segment's center is after rotation
+            segment_center = (i * angle_per_segment + final_angle) % 360
+            
+            # Calculate distance from 0 degrees (considering wraparound)
+            distance = min(segment_center, 360 - segment_center)
+            
+            segment_positions.append((i, segment_center, distance, self.mystery_cards[i]["text"]))
+            
+            if distance < min_distance:
+                min_distance = distance
+                selected_index = i
+        
+        # Debug output to console
+        if self.verbose:
+            print(f"Final angle: {final_angle:.2f}°")
+            print("Segment positions:")
+            for i, center, dist, text in segment_positions:
+                print(f"  Segment {i}: {text} - Center: {center:.2f}°, Distance: {dist:.2f}°")
+            print(f"Selected: Segment {selected_index} - {self.mystery_cards[selected_index]['text']}")
+        
+        # Get the selected mystery card
+        self.mystery_card = self.mystery_cards[selected_index]
+        self.selected_mystery = self.mystery_card
+        
+        # Track this result to avoid repetition
+        self.recent_mystery_results.append(selected_index)
+        if len(self.recent_mystery_results) > self.max_recent_results:
+            self.recent_mystery_results.pop(0)  # Remove oldest result
+        
+        # Add to used mysteries for randomization
+        if self.mystery_card not in self.used_mysteries:
+            self.used_mysteries.append(self.mystery_card)
+        
+        # Reset used mysteries if all have been used
+        if len(self.used_mysteries) >= len(self.mystery_cards):
+            self.used_mysteries = []
+
+    def _show_sell_property(self):
+        """Show property selling interface"""
+        team = self.teams[self.current_idx]
+        owned_properties = self._get_owned_properties(team.team_id)
+        
+        if not owned_properties:
+            self.sell_property_feedback = "No properties to sell!"
+            self._start_feedback_timer()
+            return
+            
+        self.show_sell_property = True
+        self.sell_property_feedback = None
+
+    def _get_owned_properties(self, team_id):
+        """Get list of properties owned by a team"""
+        owned = []
+        for i in sorted(self.ownership.tiles(team_id)):
+            if i in self.property_data:
+                prop_info = self.property_data[i]
+                owned.append({
+                    "index": i,
+                    "name": prop_info["name"],
+                    "price": prop_info["price"],
+                    "color": prop_info["color"]
+                })
+        return owned
+
+    def _set_owner(self, tile, team_id):
+        """The one place ownership changes (team_id None: back to the bank)"""
+        if self.ownership.set_owner(tile, team_id):
+            self.properties[tile]["owner"] = team_id
+
+    def _sell_property(self, property_index):
+        """Sell a property and give money to the team"""
+        # Save state before selling
+        self._save_state()
+        
+        team = self.teams[self.current_idx]
+        prop_info = self.property_data[property_index]
+        
+        # Calculate sell price as half the original price, then round to nearest 500k
+        half_price = prop_info["price"] // 2
+        sell_price = round(half_price / 500_000) * 500_000  # Round to nearest 500k
+        
+        # Give money to team
+        team.balance += sell_price
+        
+        # Remove ownership
+        self._set_owner(property_index, None)
+        
+        # Show feedback
+        self.sell_property_feedback = f"Sold {prop_info['name']} for ₹{sell_price/1_000_000:.1f}M"
+        self._start_feedback_timer()
+        
+        # Close selling interface
+        self.show_sell_property = False
+
+    def _start_trading(self):
+        """Start the property trading system"""
+        self.show_trading = True
+        self.trading_phase = 'select_property'
+        self.trading_seller = self.current_idx
+        self.trading_offers = {}
+        self.trading_feedback = None
+        self.trading_offer_amounts = {}  # Initialize offer amounts for each team
+
+    def _select_property_for_trade(self, property_index):
+        """Select a property to trade"""
+        team = self.teams[self.current_idx]
+        if self.ownership.owner(property_index) == team.team_id:
+            self.trading_property = property_index
+            self.trading_phase = 'collect_offers'
+            self.trading_feedback = f"Property selected! Other players can now make offers."
+        else:
+            self.trading_feedback = "You don't own this property!"
+
+    def _adjust_trading_offer(self, buyer_team_idx, delta):
+        """Adjust trading offer amount for a team"""
+        if self.trading_phase != 'collect_offers':
+            return
+        
+        buyer_team = self.teams[buyer_team_idx]
+        team_id = buyer_team.team_id
+        
+        # Initialize offer amount if not set
+        if team_id not in self.trading_offer_amounts:
+            self.trading_offer_amounts[team_id] = 500_000  # Start with 0.5M
+        
+        # Adjust amount
+        new_amount = self.trading_offer_amounts[team_id] + delta
+        
+        # Ensure amount is within valid range
+        if new_amount < 500_000:  # Minimum 0.5M
+            new_amount = 500_000
+        elif new_amount > buyer_team.balance:  # Can't exceed team's balance
+            new_amount = buyer_team.balance
+        
+        self.trading_offer_amounts[team_id] = new_amount
+        
+        # Update the actual offer
+        self.trading_offers[team_id] = new_amount
+        self.trading_feedback = f"{buyer_team.name} offer: ₹{new_amount/1_000_000:.1f}M"
+
+    def _make_trading_offer(self, buyer_team_idx, offer_amount):
+        """Make an offer for the trading property"""
+        if self.trading_phase != 'collect_offers':
+            return
+        
+        buyer_team = self.teams[buyer_team_idx]
+        if buyer_team.balance >= offer_amount:
+            self.trading_offers[buyer_team.team_id] = offer_amount
+            self.trading_feedback = f"{buyer_team.name} offered ₹{offer_amount/1_000_000:.1f}M"
+        else:
+            self.trading_feedback = f"{buyer_team.name} doesn't have enough money!"
+
+    def _choose_trading_buyer(self, buyer_team_id):
+        """Choose which buyer to sell the property to"""
+        if buyer_team_id not in self.trading_offers:
+            return
+        
+        # Save state before trading
+        self._save_state()
+        
+        offer_amount = self.trading_offers[buyer_team_id]
+        seller_team = self.teams[self.trading_seller]
+        buyer_team = next(t for t in self.teams if t.team_id == buyer_team_id)
+        
+        # Transfer money
+        buyer_team.balance -= offer_amount
+        seller_team.balance += offer_amount
+        
+        # Transfer property
+        self._set_owner(self.trading_property, buyer_team_id)
+        
+        # Show feedback
+        prop_info = self.property_data[self.trading_property]
+        self.trading_feedback = f"Sold {prop_info['name']} to {buyer_team.name} for ₹{offer_amount/1_000_000:.1f}M"
+        
+        # Close trading
+        self.show_trading = False
+        self.trading_phase = None
+        self.trading_offers = {}
+
+    def _cancel_trading(self):
+        """Cancel the trading process"""
+        self.show_trading = False
+        self.trading_phase = None
+        self.trading_offers = {}
+        self.trading_feedback = None
+        self.trading_offer_amounts = {}
@@ -0,0 +1,66 @@
+"""
+Game event log for the Streamlit bridge.
+
+Logged events go into a bounded in-memory ring buffer, which every published
+state snapshot includes as its recent messages, and into a pending batch that
+the bridge worker appends to a JSON Lines file from time to time. Logging an
+event is O(1) and never touches the disk on the game thread.
+"""
+import json
+import threading
+from collections import deque
+from datetime import datetime
+
+EVENT_LOG_FILE = "game_events.jsonl"
+MAX_RECENT_EVENTS = 50
+
+
+class EventLog:
+    """Bounded recent-event buffer plus an append-only JSONL file"""
+
+    def __init__(self, path=EVENT_LOG_FILE, max_recent=MAX_RECENT_EVENTS):
+        self.path = path
+        self.recent = deque(maxlen=max_recent)
+        self.pending = []
+        self.seq = 0  # number of events logged so far
+        self.written_count = 0
+        self._messages = []
+        self._lock = threading.Lock()
+
+    def append(self, message):
+        """Record an event; returns the entry"""
+        self.seq += 1
+        entry = {
+            'seq': self.seq,
+            'timestamp': datetime.now().isoformat(),
+            'message': message
+        }
+        self.recent.append(entry)
+        self._messages = None
+        with self._lock:
+            self.pending.append(entry)
+        return entry
+
+    def messages(self):
+        """The recent events as a list (the same list object until the next append)"""
+        if self._messages is None:
+            self._messages = list(self.recent)
+        return self._messages
+
+    def flush(self):
+        """Append pending events to the log file; returns how many were written"""
+        with self._lock:
+            batch, self.pending = self.pending, []
+        if not batch:
+            return 0
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(''.join(json.dumps(entry) + '\n' for entry in batch))
+        except OSError as e:
+            print(f"Error writing event log: {e}")
+            # Keep the batch for the next attempt
+            with self._lock:
+                self.pending[:0] = batch
+            return 0
+        self.written_count += len(batch)
+        return len(batch)
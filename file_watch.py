@@ -0,0 +1,50 @@
+"""
+Cheap change detection for bridge files and spool directories.
+
+StatWatcher compares os.stat metadata (mtime, size and inode) with what it saw
+last time, so callers only list or parse a path when it actually changed.
+Files replaced with os.replace get a new inode, and a spool directory's mtime
+changes whenever an entry is renamed in or unlinked.
+
+Filesystems with coarse timestamps can change a path twice within one mtime
+tick; to stay safe, a path whose mtime is within RACY_WINDOW_S of the current
+time is always reported as changed.
+"""
+import os
+import time
+
+RACY_WINDOW_S = 2.0
+
+
+class StatWatcher:
+    """Reports whether a path changed since the last check"""
+
+    def __init__(self, path):
+        self.path = path
+        self.last_signature = None
+        self.skipped_reads = 0
+        self.performed_reads = 0
+
+    def changed(self):
+        """Return True if the path should be re-read"""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            signature = None
+            racy = False
+        else:
+            signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+            racy = time.time() - st.st_mtime_ns / 1e9 < RACY_WINDOW_S
+        if signature == self.last_signature and not racy:
+            self.skipped_reads += 1
+            return False
+        self.last_signature = signature
+        self.performed_reads += 1
+        return True
+
+    def invalidate(self):
+        """Force the next changed() call to report a change"""
+        self.last_signature = None
+
+    def stats(self):
+        return {"path": self.path, "skipped": self.skipped_reads, "performed": self.performed_reads}
@@ -0,0 +1,78 @@
+"""
+Adaptive frame pacing for the game loop.
+
+While something is animating (a token moving, the wheel spinning, an overlay
+or feedback popup open, the mouse over a button) the game ticks at full
+rate. After IDLE_DELAY_S without activity it drops to IDLE_FPS and sleeps in
+pygame.event.wait between frames, so a static board between turns costs a
+few frames a second instead of sixty.
+
+Input wakes an idle loop immediately. Bridge commands cannot post pygame
+events, so the idle wait is split into WAKE_INTERVAL_S slices and the caller's
+wake() check (e.g. "are commands queued or a game timer due?") runs between
+slices; Streamlit commands are therefore applied about as quickly as the
+bridge worker polls.
+"""
+import time
+
+import pygame
+
+IDLE_FPS = 6
+IDLE_DELAY_S = 1.0  # keep full rate this long after the last activity
+WAKE_INTERVAL_S = 0.05
+
+
+class FramePacer:
+    """Ticks at full rate while active, otherwise blocks until the next idle frame or an event"""
+
+    def __init__(self, clock, fps, idle_fps=IDLE_FPS, idle_delay=IDLE_DELAY_S,
+                 wake_interval=WAKE_INTERVAL_S):
+        self.clock = clock
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.idle_delay = idle_delay
+        self.wake_interval = wake_interval
+        self.last_active = time.perf_counter()
+        self.last_frame = self.last_active
+        self.active_frames = 0
+        self.idle_frames = 0
+
+    def next_frame(self, active, wake=None):
+        """Wait for the next frame and return the pending pygame events"""
+        now = time.perf_counter()
+        if active:
+            self.last_active = now
+        if now - self.last_active < self.idle_delay:
+            self.clock.tick(self.fps)
+            self.active_frames += 1
+            self.last_frame = time.perf_counter()
+            return pygame.event.get()
+
+        events = []
+        frame_due = self.last_frame + 1.0 / self.idle_fps
+        while True:
+            remaining = frame_due - time.perf_counter()
+            if remaining <= 0:
+                break
+            timeout_ms = max(1, int(min(remaining, self.wake_interval) * 1000))
+            event = pygame.event.wait(timeout_ms)
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+                break
+            if wake is not None and wake():
+                self.last_active = time.perf_counter()
+                break
+        events.extend(pygame.event.get())
+        self.clock.tick()
+        self.idle_frames += 1
+        self.last_frame = time.perf_counter()
+        return events
+
+    def mark_active(self):
+        """Return to full rate now, e.g. after the window is restored"""
+        self.last_active = time.perf_counter()
+
+    def stats(self):
+        frames = self.active_frames + self.idle_frames
+        return {"active_frames": self.active_frames, "idle_frames": self.idle_frames,
+                "idle_fraction": self.idle_frames / frames if frames else 0.0}
@@ -1,4 +1,3 @@
-import json
 import os
 import time
 import threading
@@ -6,11 +5,37 @@ from datetime import datetime
 import subprocess
 import sys
 
+import codec
+from push_client import get_game_client
+from spool import CONTROL_COMMANDS_SPOOL, PLAYER_ACTIONS_SPOOL, Spool
+
+# Key presses used by the process_* helpers, mapped to the game's command names
+CONTROL_COMMAND_KEYS = {
+    'R': 'roll_dice',
+    'E': 'next_turn',
+    'B': 'buy_property',
+    'S': 'sell_property',
+    'C': 'test_chance',
+    'M': 'test_mystery',
+    'T': 'start_trading',
+    'RESET': 'reset_game',
+}
+PLAYER_ACTION_KEYS = {
+    'R': 'roll_dice',
+    'E': 'end_turn',
+    'B': 'buy_property',
+    'S': 'sell_property',
+    'Y': 'take_chance',
+    'SPIN': 'spin_mystery',
+    'T': 'start_trading',
+}
+
 class GameIntegration:
     def __init__(self):
         self.game_state_file = "game_state.json"
-        self.player_actions_file = "player_actions.json"
-        self.control_commands_file = "control_commands.json"
+        self.control_spool = Spool(CONTROL_COMMANDS_SPOOL)
+        self.action_spool = Spool(PLAYER_ACTIONS_SPOOL)
+        self.client = get_game_client()
         self.game_process = None
         self.running = False
         
@@ -54,10 +79,8 @@ class GameIntegration:
     def process_control_commands(self):
         """Process commands from the control center"""
         try:
-            with open(self.control_commands_file, 'r') as f:
-                commands = json.load(f)
-            
-            for timestamp, command_data in commands.items():
+            for name in self.control_spool.pending():
+                command_data = self.control_spool.read(name) or {}
                 command = command_data.get('command')
                 
                 if command == 'roll_dice':
@@ -78,9 +101,7 @@ class GameIntegration:
                     self.send_to_game('RESET')  # Custom reset command
                 
                 # Remove processed command
-                del commands[timestamp]
-                with open(self.control_commands_file, 'w') as f:
-                    json.dump(commands, f)
+                self.control_spool.discard(name)
                     
         except Exception as e:
             print(f"Error processing control commands: {e}")
@@ -88,73 +109,67 @@ class GameIntegration:
     def process_player_actions(self):
         """Process actions from players"""
         try:
-            with open(self.player_actions_file, 'r') as f:
-                actions = json.load(f)
-            
-            for team_id, action_data in actions.items():
+            for name in self.action_spool.pending():
+                action_data = self.action_spool.read(name) or {}
+                team_id = action_data.get('team_id')
                 action = action_data.get('action')
                 
                 # Only process actions for the current player
                 current_player = self.get_current_player()
                 if team_id == current_player:
                     if action == 'roll_dice':
-                        self.send_to_game('R')
+                        self.send_to_game('R', team_id)
                     elif action == 'end_turn':
-                        self.send_to_game('E')
+                        self.send_to_game('E', team_id)
                     elif action == 'buy_property':
-                        self.send_to_game('B')
+                        self.send_to_game('B', team_id)
                     elif action == 'sell_property':
-                        self.send_to_game('S')
+                        self.send_to_game('S', team_id)
                     elif action == 'take_chance':
-                        self.send_to_game('Y')  # Yes to chance
+                        self.send_to_game('Y', team_id)  # Yes to chance
                     elif action == 'spin_mystery':
-                        self.send_to_game('SPIN')  # Custom mystery spin
+                        self.send_to_game('SPIN', team_id)  # Custom mystery spin
                     elif action == 'start_trading':
-                        self.send_to_game('T')
+                        self.send_to_game('T', team_id)
                 
                 # Remove processed action
-                del actions[team_id]
-                with open(self.player_actions_file, 'w') as f:
-                    json.dump(actions, f)
+                self.action_spool.discard(name)
                     
         except Exception as e:
             print(f"Error processing player actions: {e}")
     
-    def send_to_game(self, key_or_command):
-        """Send a key press or command to the pygame game"""
-        # This would need to be implemented to actually send input to your pygame game
-        # For now, we'll just log it
-        print(f"Sending to game: {key_or_command}")
-        
-        # You could implement this using:
-        # 1. Named pipes
-        # 2. Socket communication
-        # 3. File-based communication
-        # 4. Direct function calls if integrated
+    def send_to_game(self, key_or_command, team_id=None):
+        """Send a key press or command to the pygame game over its push server socket"""
+        if team_id is not None:
+            action = PLAYER_ACTION_KEYS.get(key_or_command, key_or_command)
+            sent = self.client.send_action(team_id, action)
+        else:
+            command = CONTROL_COMMAND_KEYS.get(key_or_command, key_or_command)
+            sent = self.client.send_command(command, source="game_integration")
+        if not sent:
+            print(f"Game did not accept: {key_or_command}")
+        return sent
     
     def get_current_player(self):
         """Get the current player ID"""
         try:
-            with open(self.game_state_file, 'r') as f:
-                state = json.load(f)
-            current_idx = state.get('current_player', 0)
-            return f"T{current_idx + 1}"
-        except:
+            state = codec.load(self.game_state_file)
+        except (OSError, ValueError):
             return "T1"
+        current_idx = state.get('current_player', 0)
+        return f"T{current_idx + 1}"
     
     def update_game_state(self, state_data):
         """Update the game state file"""
         try:
-            with open(self.game_state_file, 'w') as f:
-                json.dump(state_data, f, indent=2)
+            codec.dump(self.game_state_file, state_data)
         except Exception as e:
             print(f"Error updating game state: {e}")
     
     def add_game_message(self, message):
         """Add a message to the game log"""
         try:
-            with open(self.game_state_file, 'r') as f:
-                state = json.load(f)
+            state = codec.load(self.game_state_file)
             
             if 'messages' not in state:
                 state['messages'] = []
@@ -0,0 +1,171 @@
+"""
+Analytical landing probabilities for the board.
+
+Builds the Markov chain of one team's turns on the BOARD_SPACES board and
+solves it with NumPy instead of simulating: the d6 roll with wrap-around,
+the mystery wheel's moves and teleports, the skipped turn after landing on
+the Society Penalty tile, and the waived rent after drawing "No rent next
+turn". Rebuilding and solving the chain takes under a millisecond, so the
+table can be recomputed whenever an organizer edits the board config. Usage:
+
+    python markov.py [teams]
+
+A chain state is a tile plus two flags: "skips its next turn" (only on the
+Society Penalty tile, reached by the dice) and "pays no rent on its next
+turn". The stationary distribution gives where a team is between turns;
+multiplying by the landing matrix gives how often a turn ends on each tile,
+and so the expected rent a property earns per round from each opponent.
+Rules follow batch_sim.py, which can be used to cross-check the results.
+Mystery moves and teleports: tile effects (penalties, the skipped turn, the
+GO bonus) are not applied where they end, as in the engine, but rent and
+buying are.
+Each spin is an independent, uniform card draw here. The live wheel does not
+repeat its recent results, which moves single tile shares by up to about 4%
+(relative) in batch_sim; with independent draws the two agree to sampling
+noise.
+"""
+import sys
+import time
+
+import numpy as np
+
+from engine import (
+    BOARD_SPACES, EVENT_PENALTY, EVENT_PENALTY_TILE, FREE_PARKING_TILE, GO_BONUS, MYSTERY_TILES,
+    SOCIETY_PENALTY, SOCIETY_PENALTY_TILE, GameEngine,
+)
+
+DIE_FACES = 6
+NO_RENT_OFFSET = BOARD_SPACES  # tile + NO_RENT_OFFSET: on tile, pays no rent next turn
+SKIP_STATE = 2 * BOARD_SPACES  # on the Society Penalty tile, skipping the next turn
+N_STATES = 2 * BOARD_SPACES + 1
+
+
+def _mystery_outcomes(tile, mystery_cards):
+    """(final tile, no-rent flag, probability) for a spin on tile"""
+    share = 1.0 / len(mystery_cards)
+    for card in mystery_cards:
+        if card["type"] == "move":
+            yield (tile + card["steps"]) % BOARD_SPACES, False, share
+        elif card["type"] == "go_to_free_parking":
+            yield FREE_PARKING_TILE, False, share
+        elif card["type"] == "go_to_society_penalty":
+            yield SOCIETY_PENALTY_TILE, False, share
+        elif card["type"] == "no_rent":
+            yield tile, True, share
+        else:
+            yield tile, False, share
+
+
+def transition_matrices(mystery_cards):
+    """(P, L): state-to-state transitions per turn, and state-to-tile turn endings
+
+    L[s, tile] is the probability that a turn played from state s ends on tile;
+    it is zero for the skipped turn, which moves nothing.
+    """
+    P = np.zeros((N_STATES, N_STATES))
+    L = np.zeros((N_STATES, BOARD_SPACES))
+    spins = {tile: list(_mystery_outcomes(tile, mystery_cards)) for tile in MYSTERY_TILES}
+    for tile in range(BOARD_SPACES):
+        row = np.zeros(N_STATES)
+        for roll in range(1, DIE_FACES + 1):
+            dest = (tile + roll) % BOARD_SPACES
+            if dest == SOCIETY_PENALTY_TILE:
+                row[SKIP_STATE] += 1.0 / DIE_FACES
+            elif dest in spins:
+                for final, no_rent, share in spins[dest]:
+                    row[final + (NO_RENT_OFFSET if no_rent else 0)] += share / DIE_FACES
+            else:
+                row[dest] += 1.0 / DIE_FACES
+        landing = row[:BOARD_SPACES] + row[BOARD_SPACES:2 * BOARD_SPACES]
+        landing[SOCIETY_PENALTY_TILE] += row[SKIP_STATE]
+        # The no-rent flag only changes what the next turn pays, not where it goes
+        for state in (tile, tile + NO_RENT_OFFSET):
+            P[state] = row
+            L[state] = landing
+    P[SKIP_STATE, SOCIETY_PENALTY_TILE] = 1.0
+    return P, L
+
+
+def stationary_distribution(P):
+    """pi with pi @ P == pi and sum(pi) == 1"""
+    n = len(P)
+    A = P.T - np.eye(n)
+    A[-1] = 1.0  # replace one (redundant) balance equation by the normalisation
+    b = np.zeros(n)
+    b[-1] = 1.0
+    # States no tile can reach (e.g. no-rent flags off the mystery tiles) just solve to 0
+    return np.linalg.lstsq(A, b, rcond=None)[0]
+
+
+def analyze(property_data=None, mystery_cards=None, n_teams=None):
+    """Per-tile landing table and per-property expected rent and ROI"""
+    defaults = GameEngine(seed=0, history_size=0)
+    if property_data is None:
+        property_data = defaults.property_data
+    if mystery_cards is None:
+        mystery_cards = defaults.mystery_cards
+    if n_teams is None:
+        n_teams = len(defaults.teams)
+
+    P, L = transition_matrices(mystery_cards)
+    pi = stationary_distribution(P)
+    landing = pi @ L  # per turn (skipped turns included), chance the turn ends on each tile
+    paying = pi[:BOARD_SPACES] @ L[:BOARD_SPACES]  # endings that owe rent (no no-rent flag)
+    occupancy = pi[:BOARD_SPACES] + pi[BOARD_SPACES:2 * BOARD_SPACES]
+    occupancy[SOCIETY_PENALTY_TILE] += pi[SKIP_STATE]
+
+    # Passing or landing on GO: the roll carries the token past tile BOARD_SPACES - 1
+    played = pi[:2 * BOARD_SPACES].reshape(2, BOARD_SPACES).sum(axis=0)
+    passes_go = sum(played[tile] * max(0, tile + DIE_FACES - BOARD_SPACES + 1) / DIE_FACES
+                    for tile in range(BOARD_SPACES))
+    # Penalties are paid on dice landings only; mystery teleports to tile 6 are free
+    society = pi[SKIP_STATE]
+    cash_per_turn = (passes_go * GO_BONUS - society * SOCIETY_PENALTY
+                     - landing[EVENT_PENALTY_TILE] * EVENT_PENALTY)
+
+    properties = {}
+    opponents = n_teams - 1
+    for tile, info in sorted(property_data.items()):
+        # Every opponent plays one turn per round
+        income = paying[tile] * info["rent"] * opponents
+        properties[tile] = {
+            "name": info["name"],
+            "price": info["price"],
+            "rent": info["rent"],
+            "landing": float(landing[tile]),
+            "rent_per_round": float(income),
+            "roi_per_round": float(income / info["price"]),
+            "payback_rounds": float(info["price"] / income) if income else float("inf"),
+        }
+    return {
+        "stationary": pi,
+        "occupancy": occupancy,
+        "landing": landing,
+        "passes_go": float(passes_go),
+        "society_penalty": float(society),
+        "cash_per_turn": float(cash_per_turn),
+        "properties": properties,
+    }
+
+
+def main():
+    n_teams = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    start = time.perf_counter()
+    result = analyze(n_teams=n_teams)
+    elapsed = time.perf_counter() - start
+    print(f"solved in {elapsed * 1000:.2f} ms; per turn: passes GO {result['passes_go']:.3f}, "
+          f"society penalty {result['society_penalty']:.3f}, "
+          f"fixed cash flow ₹{result['cash_per_turn'] / 1_000_000:+.2f}M")
+    print(f"{'tile':>4}  {'name':<22}{'on tile':>9}{'landing':>9}{'rent/round':>12}{'ROI/round':>11}{'payback':>9}")
+    properties = result["properties"]
+    for tile in range(BOARD_SPACES):
+        line = f"{tile:>4}  {properties[tile]['name'] if tile in properties else '':<22}" \
+               f"{result['occupancy'][tile]:>9.4f}{result['landing'][tile]:>9.4f}"
+        if tile in properties:
+            info = properties[tile]
+            line += f"{info['rent_per_round']:>12,.0f}{info['roi_per_round']:>11.4f}{info['payback_rounds']:>9.1f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
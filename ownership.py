@@ -0,0 +1,84 @@
+"""
+Incremental index of property ownership.
+
+Ownership used to be read by scanning engine.properties, a list of one dict
+per tile: listing a team's properties, drawing the houses and building the
+Streamlit snapshot each walked all of it every frame. OwnershipIndex keeps
+the answers instead and updates them in O(1) per ownership change:
+
+- owner_of: tile -> team_id, owned tiles only
+- tiles_by_owner: team_id -> set of tiles
+- group_counts: (team_id, colour group) -> tiles of that group owned
+- values: team_id -> sum of the owned properties' prices, so a team's net
+  worth (cash plus property value) is one addition
+
+version is bumped on every change, so renderers and snapshots can cache
+anything derived from ownership and rebuild it only when the version moved.
+GameEngine routes every ownership change (buy, sell, trade, undo, reset)
+through set_owner(); the sets and dicts it returns are live and must not be
+modified by callers.
+"""
+
+
+class OwnershipIndex:
+    """Owner per tile, tiles per owner, colour-group counts and property value per team"""
+
+    def __init__(self, property_data):
+        self.property_data = property_data
+        self.owner_of = {}
+        self.tiles_by_owner = {}
+        self.group_counts = {}
+        self.values = {}
+        self.version = 0
+
+    def owner(self, tile):
+        return self.owner_of.get(tile)
+
+    def tiles(self, team_id):
+        return self.tiles_by_owner.get(team_id, ())
+
+    def group(self, tile):
+        """Colour group of a property tile (None for tiles that are not properties)"""
+        info = self.property_data.get(tile)
+        return info["color"] if info else None
+
+    def group_count(self, team_id, group):
+        return self.group_counts.get((team_id, group), 0)
+
+    def property_value(self, team_id):
+        return self.values.get(team_id, 0)
+
+    def net_worth(self, team):
+        return team.balance + self.values.get(team.team_id, 0)
+
+    def set_owner(self, tile, team_id):
+        """Give tile to team_id (None: back to the bank); returns True if the owner changed"""
+        old = self.owner_of.get(tile)
+        if old == team_id:
+            return False
+        info = self.property_data.get(tile)
+        group = info["color"] if info else None
+        price = info["price"] if info else 0
+        if old is not None:
+            self.tiles_by_owner[old].discard(tile)
+            self.group_counts[(old, group)] -= 1
+            self.values[old] -= price
+            del self.owner_of[tile]
+        if team_id is not None:
+            self.tiles_by_owner.setdefault(team_id, set()).add(tile)
+            key = (team_id, group)
+            self.group_counts[key] = self.group_counts.get(key, 0) + 1
+            self.values[team_id] = self.values.get(team_id, 0) + price
+            self.owner_of[tile] = team_id
+        self.version += 1
+        return True
+
+    def snapshot(self):
+        """Current owners, for undo (see changes_to); O(owned tiles)"""
+        return dict(self.owner_of)
+
+    def changes_to(self, owners):
+        """(tile, owner) pairs that turn the current ownership into a snapshot"""
+        changes = [(tile, None) for tile in self.owner_of if tile not in owners]
+        changes.extend((tile, owner) for tile, owner in owners.items() if self.owner_of.get(tile) != owner)
+        return changes
@@ -0,0 +1,191 @@
+"""
+Client library for the game's push server (see push_server.py).
+
+GameClient keeps one pooled request connection, shared by every Streamlit
+session in the process, plus an optional subscription thread that keeps the
+latest pushed state and lets callers block until the state changes. The
+subscription patches its local copy with the typed deltas the game pushes
+(see state_deltas.py) and, after a reconnect, asks only for the versions it
+missed. When the game is not reachable, every call fails fast (and reconnects
+are throttled), so callers can fall back to the file-based bridge.
+"""
+import json
+import socket
+import threading
+import time
+
+from push_server import PUSH_HOST, PUSH_PORT, encode_message
+from state_deltas import apply_deltas
+
+CONNECT_TIMEOUT_S = 0.25
+REQUEST_TIMEOUT_S = 1.0
+RETRY_INTERVAL_S = 2.0
+
+
+class _LineSocket:
+    def __init__(self, sock):
+        self.sock = sock
+        self.buffer = b""
+
+    def send(self, message):
+        self.sock.sendall(encode_message(message))
+
+    def recv(self):
+        while b"\n" not in self.buffer:
+            data = self.sock.recv(65536)
+            if not data:
+                raise ConnectionError("push server closed the connection")
+            self.buffer += data
+        line, self.buffer = self.buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def close(self):
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class GameClient:
+    """Sends commands to the game and follows its state over a local socket"""
+
+    def __init__(self, host=PUSH_HOST, port=PUSH_PORT):
+        self.host = host
+        self.port = port
+        self._conn = None
+        self._lock = threading.Lock()
+        self._next_attempt = 0.0
+        self._subscriber = None
+        self._cond = threading.Condition()
+        self.state = None
+        self.epoch = None
+        self.version = None
+        self.following = False
+
+    def _connect(self, timeout):
+        sock = socket.create_connection((self.host, self.port), timeout=CONNECT_TIMEOUT_S)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(timeout)
+        return _LineSocket(sock)
+
+    def _request(self, message):
+        """Send one request on the pooled connection and return the reply, or None"""
+        with self._lock:
+            for _ in range(2):  # retry once on a stale pooled connection
+                if self._conn is None:
+                    if time.monotonic() < self._next_attempt:
+                        return None
+                    try:
+                        self._conn = self._connect(REQUEST_TIMEOUT_S)
+                    except OSError:
+                        self._next_attempt = time.monotonic() + RETRY_INTERVAL_S
+                        return None
+                try:
+                    self._conn.send(message)
+                    return self._conn.recv()
+                except (OSError, ValueError, ConnectionError):
+                    self._conn.close()
+                    self._conn = None
+            return None
+
+    def send_command(self, command, source="control_center"):
+        """Send a control center command; returns True if the game accepted it"""
+        reply = self._request({"type": "command", "command": command, "source": source})
+        return bool(reply and reply.get("ok"))
+
+    def send_action(self, team_id, action):
+        """Send a team action; returns True if the game accepted it"""
+        reply = self._request({"type": "action", "action": action, "team_id": team_id})
+        return bool(reply and reply.get("ok"))
+
+    def get_state(self):
+        """Fetch the current state snapshot, or None if the game is unreachable"""
+        reply = self._request({"type": "get_state"})
+        return reply.get("state") if reply else None
+
+    def changes_since(self, epoch, version):
+        """Ask for everything after (epoch, version)
+
+        Returns the server's reply: {"type": "deltas", "entries": [...]} when
+        the game still has the history, a full {"type": "snapshot"} otherwise,
+        or None if the game is unreachable.
+        """
+        return self._request({"type": "since", "epoch": epoch, "version": version})
+
+    # ---- subscriptions ---------------------------------------------------
+
+    def subscribe(self):
+        """Start following pushed state changes in a background thread"""
+        if self._subscriber is not None and self._subscriber.is_alive():
+            return
+        self._subscriber = threading.Thread(target=self._follow, name="push-client", daemon=True)
+        self._subscriber.start()
+
+    def wait_for_update(self, since_version, timeout):
+        """Block until a version newer than since_version arrives or timeout elapses
+
+        Returns the latest known state (which may be unchanged on timeout).
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self.version is None or self.version == since_version:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self.state
+
+    def _follow(self):
+        while True:
+            try:
+                conn = self._connect(None)
+            except OSError:
+                time.sleep(RETRY_INTERVAL_S)
+                continue
+            try:
+                # Resume from the version we already have; the game answers with
+                # just the missed deltas when it still remembers them
+                conn.send({"type": "subscribe", "epoch": self.epoch, "version": self.version})
+                self.following = True
+                while True:
+                    self._apply(conn.recv())
+            except (OSError, ValueError, ConnectionError):
+                self.following = False
+                conn.close()
+                time.sleep(RETRY_INTERVAL_S)
+
+    def _apply(self, message):
+        with self._cond:
+            kind = message.get("type")
+            if kind == "snapshot":
+                if message.get("state") is not None:
+                    self.state = message["state"]
+                    self.epoch = message.get("epoch")
+                    self.version = message.get("version")
+            elif kind == "deltas" and self.state is not None:
+                state = self.state
+                for entry in message.get("entries", []):
+                    state = apply_deltas(state, entry["deltas"])
+                self.state = dict(state, version=message.get("version"))
+                self.version = message.get("version")
+            elif kind == "delta" and self.state is not None:
+                if message.get("base_version") != self.version:
+                    # Missed a version; reconnect and catch up
+                    raise ConnectionError("state delta out of sequence")
+                state = apply_deltas(self.state, message.get("deltas", []))
+                self.state = dict(state, version=message.get("version"))
+                self.version = message.get("version")
+            self._cond.notify_all()
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_game_client():
+    """Return the process-wide pooled GameClient"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = GameClient()
+        return _shared_client
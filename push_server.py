@@ -0,0 +1,272 @@
+"""
+Local socket push server running inside the game process.
+
+Clients connect over TCP on localhost and exchange newline-delimited JSON
+messages:
+
+    {"type": "command", "command": "roll_dice", "source": "control_center"}
+    {"type": "action", "action": "end_turn", "team_id": "T1"}
+    {"type": "get_state"}
+    {"type": "since", "epoch": 1700000000000, "version": 41}
+    {"type": "subscribe", "epoch": 1700000000000, "version": 41}
+
+Commands and actions are injected into the game's bridge inbox as
+BridgeCommand objects and acknowledged with {"type": "ack", "ok": ...}.
+
+The server keeps a DeltaHistory of typed deltas (see state_deltas.py).
+"since" answers with {"type": "deltas", "entries": [...]} covering every
+version after the given one, or with a full {"type": "snapshot"} if that
+version is too old or from an earlier game run. "subscribe" answers the same
+way (epoch/version are optional) and then pushes a {"type": "delta"} every
+time the game publishes a new state version.
+
+Unsent output is capped at MAX_OUTBUF_BYTES per connection. A subscriber that
+stops reading has its queued deltas dropped and gets one fresh
+{"type": "snapshot"} instead; a client that keeps sending requests without
+reading the replies is disconnected.
+"""
+import json
+import queue
+import selectors
+import socket
+import threading
+
+from bridge_worker import parse_control_command, parse_player_action
+from state_deltas import DeltaHistory
+
+PUSH_HOST = "127.0.0.1"
+PUSH_PORT = 8765
+MAX_LINE_BYTES = 64 * 1024
+MAX_OUTBUF_BYTES = 256 * 1024
+
+
+def encode_message(message):
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class _Connection:
+    def __init__(self, sock):
+        self.sock = sock
+        self.inbuf = b""
+        self.outbuf = bytearray()
+        self.subscribed = False
+
+
+class PushServer(threading.Thread):
+    """Accepts commands and pushes state changes to subscribers"""
+
+    def __init__(self, inbox, host=PUSH_HOST, port=PUSH_PORT, history=None):
+        super().__init__(name="push-server", daemon=True)
+        self.inbox = inbox
+        self.host = host
+        self.port = port
+        self.selector = selectors.DefaultSelector()
+        self.connections = {}
+        self.lock = threading.Lock()
+        self.history = history if history is not None else DeltaHistory()
+        self._listen_sock = None
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._stop_event = threading.Event()
+
+    def bind(self):
+        """Open the listening socket; returns False if the port is unavailable"""
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((self.host, self.port))
+            sock.listen()
+            sock.setblocking(False)
+        except OSError as e:
+            print(f"Push server disabled: {e}")
+            return False
+        self._listen_sock = sock
+        self.selector.register(sock, selectors.EVENT_READ, None)
+        self.selector.register(self._wake_r, selectors.EVENT_READ, None)
+        return True
+
+    # ---- called from other threads ---------------------------------------
+
+    def broadcast(self, snapshot):
+        """Record the snapshot's typed deltas and queue them for every subscriber"""
+        with self.lock:
+            deltas = self.history.record(snapshot)
+            if deltas is None:
+                data = encode_message(self._snapshot_message(snapshot))
+            else:
+                version = snapshot.get("version")
+                data = encode_message({"type": "delta", "epoch": snapshot.get("epoch"),
+                                       "version": version, "base_version": version - 1,
+                                       "deltas": deltas})
+            resync = None
+            for conn in self.connections.values():
+                if not conn.subscribed:
+                    continue
+                if len(conn.outbuf) + len(data) <= MAX_OUTBUF_BYTES:
+                    conn.outbuf += data
+                    continue
+                # Slow subscriber: drop its backlog, keeping the message at the
+                # head (it may be partly sent), and resync it with a snapshot
+                if resync is None:
+                    resync = encode_message(self._snapshot_message(snapshot))
+                del conn.outbuf[conn.outbuf.find(b"\n") + 1:]
+                conn.outbuf += resync
+        self._wake()
+
+    def stop(self, timeout=1.0):
+        self._stop_event.set()
+        self._wake()
+        if self.is_alive():
+            self.join(timeout)
+
+    def _wake(self):
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    # ---- server thread ---------------------------------------------------
+
+    def run(self):
+        if self._listen_sock is None and not self.bind():
+            return
+        try:
+            while not self._stop_event.is_set():
+                self._update_write_interest()
+                for key, events in self.selector.select(timeout=1.0):
+                    sock = key.fileobj
+                    if sock is self._listen_sock:
+                        self._accept()
+                    elif sock is self._wake_r:
+                        self._drain_wakeups()
+                    else:
+                        if events & selectors.EVENT_READ:
+                            self._read(sock)
+                        if events & selectors.EVENT_WRITE and sock in self.connections:
+                            self._write(sock)
+        finally:
+            for sock in list(self.connections):
+                self._close(sock)
+            self.selector.close()
+            self._listen_sock.close()
+
+    def _accept(self):
+        try:
+            sock, _ = self._listen_sock.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.lock:
+            self.connections[sock] = _Connection(sock)
+        self.selector.register(sock, selectors.EVENT_READ, None)
+
+    def _drain_wakeups(self):
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _update_write_interest(self):
+        with self.lock:
+            for sock, conn in self.connections.items():
+                events = selectors.EVENT_READ | (selectors.EVENT_WRITE if conn.outbuf else 0)
+                self.selector.modify(sock, events, None)
+
+    def _read(self, sock):
+        conn = self.connections[sock]
+        try:
+            data = sock.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._close(sock)
+            return
+        conn.inbuf += data
+        if len(conn.inbuf) > MAX_LINE_BYTES and b"\n" not in conn.inbuf:
+            self._close(sock)
+            return
+        while b"\n" in conn.inbuf:
+            line, conn.inbuf = conn.inbuf.split(b"\n", 1)
+            if line.strip():
+                self._handle(conn, line)
+        if len(conn.outbuf) > MAX_OUTBUF_BYTES:
+            self._close(sock)
+
+    def _write(self, sock):
+        conn = self.connections[sock]
+        with self.lock:
+            try:
+                sent = sock.send(conn.outbuf)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                sent = -1
+            if sent >= 0:
+                del conn.outbuf[:sent]
+        if sent < 0:
+            self._close(sock)
+
+    def _reply(self, conn, message):
+        with self.lock:
+            conn.outbuf += encode_message(message)
+
+    @staticmethod
+    def _snapshot_message(snapshot):
+        return {"type": "snapshot",
+                "epoch": snapshot.get("epoch") if snapshot else None,
+                "version": snapshot.get("version") if snapshot else None,
+                "state": snapshot}
+
+    def _changes_since(self, message):
+        """Deltas since the client's version if the history covers it, else a snapshot"""
+        entries = self.history.since(message.get("epoch"), message.get("version"))
+        if entries is None:
+            return self._snapshot_message(self.history.snapshot())
+        return {"type": "deltas", "epoch": self.history.epoch,
+                "version": self.history.version, "entries": entries}
+
+    def _handle(self, conn, line):
+        try:
+            message = json.loads(line)
+        except ValueError:
+            self._reply(conn, {"type": "ack", "ok": False, "error": "invalid JSON"})
+            return
+        kind = message.get("type") if isinstance(message, dict) else None
+
+        if kind in ("command", "action"):
+            parse = parse_control_command if kind == "command" else parse_player_action
+            command = parse(message)
+            if command is None:
+                self._reply(conn, {"type": "ack", "ok": False, "error": f"malformed {kind}"})
+                return
+            try:
+                self.inbox.put_nowait(command)
+            except queue.Full:
+                self._reply(conn, {"type": "ack", "ok": False, "error": "game is busy"})
+                return
+            self._reply(conn, {"type": "ack", "ok": True})
+        elif kind == "get_state":
+            self._reply(conn, self._snapshot_message(self.history.snapshot()))
+        elif kind in ("since", "subscribe"):
+            # Under the lock so no broadcast slips in between the reply and the
+            # first pushed delta
+            with self.lock:
+                if kind == "subscribe":
+                    conn.subscribed = True
+                conn.outbuf += encode_message(self._changes_since(message))
+        else:
+            self._reply(conn, {"type": "ack", "ok": False, "error": f"unknown message type {kind!r}"})
+
+    def _close(self, sock):
+        with self.lock:
+            self.connections.pop(sock, None)
+        try:
+            self.selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+        sock.close()
@@ -0,0 +1,248 @@
+"""
+Shared-memory transport for the hot part of the game state.
+
+The game writes a fixed-layout binary record (balances, positions, property
+owners, current player and flags) into a ``multiprocessing.shared_memory``
+segment. The record is guarded by a sequence counter (seqlock): the writer
+makes the counter odd while it updates the record and even again when done,
+and a reader retries until it sees the same even counter before and after
+unpacking. Readers unpack straight from the shared buffer, with no file I/O
+and no JSON parsing.
+
+The segment is optional: if it cannot be created or attached, callers fall
+back to game_state.json.
+"""
+import os
+import struct
+from collections import namedtuple
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - platforms without shared memory
+    shared_memory = None
+
+SEGMENT_NAME = "arthvidya_monopoly_state"
+NUM_TEAMS = 5
+NUM_TILES = 24
+NO_OWNER = -1
+FLAG_MOVING = 0x01
+CLOSED_SEQ = 2 ** 64 - 1  # written by close(): the segment is being unlinked
+
+# seq, generation, version, event_seq, current_player, flags, balances, positions, owners
+_SEQ = struct.Struct("<Q")
+_RECORD = struct.Struct(f"<IQIbB{NUM_TEAMS}q{NUM_TEAMS}B{NUM_TILES}b")
+SEGMENT_SIZE = _SEQ.size + _RECORD.size
+MAX_READ_ATTEMPTS = 100
+
+_owned = set()  # segment names a SharedStateWriter in this process owns
+
+HotState = namedtuple("HotState", [
+    "generation", "version", "event_seq", "current_player", "moving", "balances", "positions", "owners",
+])
+
+
+def _attach(name):
+    """Attach to an existing segment without letting this process unlink it on exit"""
+    if name in _owned:
+        # The resource tracker holds one entry per name: unregistering here
+        # would drop the owning writer's, and its unlink() would then fail
+        return shared_memory.SharedMemory(name=name, create=False)
+    try:
+        return shared_memory.SharedMemory(name=name, create=False, track=False)
+    except TypeError:
+        # Python < 3.13: attaching registers the segment with the resource
+        # tracker, which would destroy it when this process exits.
+        shm = shared_memory.SharedMemory(name=name, create=False)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+
+class SharedStateWriter:
+    """Owned by the game process; writes the hot state record"""
+
+    def __init__(self, name=SEGMENT_NAME):
+        self.name = name
+        self.shm = None
+        self.seq = 0
+        self.version = 0
+        self.generation = int.from_bytes(os.urandom(4), "little")
+        self.last_record = None
+        if shared_memory is None:
+            return
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=SEGMENT_SIZE)
+        except FileExistsError:
+            # Left over from a game that did not shut down cleanly; reuse it.
+            # Attached like a created one, so the resource tracker owns it too
+            self.shm = shared_memory.SharedMemory(name=name, create=False)
+            if self.shm.size < SEGMENT_SIZE:
+                # Written by an older record layout; replace it
+                self.shm.close()
+                self.shm.unlink()
+                self.shm = shared_memory.SharedMemory(name=name, create=True, size=SEGMENT_SIZE)
+            else:
+                seq = _SEQ.unpack_from(self.shm.buf, 0)[0]
+                self.seq = 0 if seq == CLOSED_SEQ else seq & ~1
+        except OSError as e:
+            print(f"Shared memory state disabled: {e}")
+            self.shm = None
+        if self.shm is not None:
+            _owned.add(name)
+
+    @property
+    def enabled(self):
+        return self.shm is not None
+
+    def write(self, event_seq, current_player, moving, balances, positions, owners):
+        """Write a new record if any field changed; returns True when written"""
+        if self.shm is None:
+            return False
+        record = (event_seq, current_player, FLAG_MOVING if moving else 0,
+                  tuple(balances), tuple(positions), tuple(owners))
+        if record == self.last_record:
+            return False
+        self.last_record = record
+        self.version += 1
+        buf = self.shm.buf
+        self.seq += 1  # odd: write in progress
+        _SEQ.pack_into(buf, 0, self.seq)
+        _RECORD.pack_into(buf, _SEQ.size, self.generation, self.version, event_seq, current_player,
+                          record[2], *balances, *positions, *owners)
+        self.seq += 1  # even: record is consistent
+        _SEQ.pack_into(buf, 0, self.seq)
+        return True
+
+    def close(self):
+        """Release and remove the segment"""
+        if self.shm is None:
+            return
+        # Readers still mapped to this segment re-attach when they see this
+        _SEQ.pack_into(self.shm.buf, 0, CLOSED_SEQ)
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+        _owned.discard(self.name)
+        self.shm = None
+
+
+class SharedStateReader:
+    """Used by web clients; reads the hot state record if the game published one"""
+
+    def __init__(self, name=SEGMENT_NAME):
+        self.name = name
+        self.shm = None
+        self.generation = None
+        self.restarted = False  # the last read() saw a new writer
+
+    def attach(self):
+        """Attach to the segment if it exists; returns True when attached"""
+        if self.shm is not None:
+            return True
+        if shared_memory is None:
+            return False
+        try:
+            self.shm = _attach(self.name)
+        except (FileNotFoundError, OSError):
+            return False
+        if self.shm.size < SEGMENT_SIZE:
+            self.shm.close()
+            self.shm = None
+            return False
+        return True
+
+    def read(self):
+        """Return a consistent HotState, or None if the segment is absent or never written"""
+        self.restarted = False
+        if not self.attach():
+            return None
+        hot = self._read_record()
+        if hot is CLOSED_SEQ:
+            # The game closed this segment; a restarted game has a new one
+            self.close()
+            if not self.attach():
+                return None
+            hot = self._read_record()
+            if hot is CLOSED_SEQ:
+                return None
+        if hot is not None and hot.generation != self.generation:
+            self.restarted = self.generation is not None
+            self.generation = hot.generation
+        return hot
+
+    def _read_record(self):
+        buf = self.shm.buf
+        for _ in range(MAX_READ_ATTEMPTS):
+            seq_before = _SEQ.unpack_from(buf, 0)[0]
+            if seq_before == CLOSED_SEQ:
+                return CLOSED_SEQ
+            if seq_before & 1:
+                continue  # writer is mid-update
+            fields = _RECORD.unpack_from(buf, _SEQ.size)
+            if _SEQ.unpack_from(buf, 0)[0] != seq_before:
+                continue  # record changed while we were reading it
+            if seq_before == 0:
+                return None
+            generation, version, event_seq, current_player, flags = fields[:5]
+            balances = fields[5:5 + NUM_TEAMS]
+            positions = fields[5 + NUM_TEAMS:5 + 2 * NUM_TEAMS]
+            owners = fields[5 + 2 * NUM_TEAMS:]
+            return HotState(generation, version, event_seq, current_player, bool(flags & FLAG_MOVING),
+                            balances, positions, owners)
+        return None
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm = None
+
+
+def merge_hot_state(state, hot):
+    """Return a copy of a JSON snapshot with its hot fields replaced from a HotState"""
+    merged = dict(state)
+    teams = []
+    for i, team in enumerate(state.get("teams", [])):
+        team = dict(team)
+        if i < NUM_TEAMS:
+            team["balance"] = hot.balances[i]
+            team["pos"] = hot.positions[i]
+        teams.append(team)
+    merged["teams"] = teams
+    merged["current_player"] = hot.current_player
+    merged["dice_rolled"] = not hot.moving
+    if 0 <= hot.current_player < len(teams):
+        merged["current_position"] = teams[hot.current_player]["pos"]
+
+    old_properties = state.get("properties", {})
+    properties = {}
+    for tile, owner_idx in enumerate(hot.owners):
+        if owner_idx == NO_OWNER or owner_idx >= len(teams):
+            continue
+        owner = teams[owner_idx]["id"]
+        name = old_properties.get(str(tile), {}).get("name", f"Property {tile}")
+        properties[str(tile)] = {"owner": owner, "name": name}
+    merged["properties"] = properties
+    return merged
+
+
+def read_state(shared_reader, snapshot_reader):
+    """Load game state preferring shared memory, falling back to the JSON snapshot
+
+    The JSON snapshot still supplies names, colours and messages; it is only
+    reloaded when the game has logged new events since the cached copy, or
+    when a restarted game took over the segment.
+    """
+    hot = shared_reader.read()
+    if hot is None:
+        return snapshot_reader.load()
+    state = snapshot_reader.cached_state
+    if state is None or shared_reader.restarted or state.get("event_seq") != hot.event_seq:
+        state = snapshot_reader.load() or state
+    if state is None:
+        return None
+    return merge_hot_state(state, hot)
@@ -0,0 +1,85 @@
+"""
+Maildir-style spool directories for bridge commands.
+
+Each command is written as its own uniquely named file: it is first written
+under ``tmp/`` and then atomically renamed into ``new/``, so a reader never
+sees a partial command and concurrent writers never touch the same file.
+File names start with a zero-padded nanosecond timestamp, so sorting them
+gives submission order. The consumer reads and unlinks entries one by one.
+Entries are encoded with the configured bridge codec (see codec.py), so they
+use the neutral ENTRY_SUFFIX whatever the format; entries named ``.json`` by
+older versions are still read.
+"""
+import itertools
+import os
+import time
+import uuid
+
+import codec
+
+SPOOL_ROOT = "bridge_spool"
+CONTROL_COMMANDS_SPOOL = os.path.join(SPOOL_ROOT, "control_commands")
+PLAYER_ACTIONS_SPOOL = os.path.join(SPOOL_ROOT, "player_actions")
+ENTRY_SUFFIX = ".msg"
+_ENTRY_SUFFIXES = (ENTRY_SUFFIX, ".json")
+
+_counter = itertools.count()
+
+
+class Spool:
+    """A directory of one-file-per-entry commands"""
+
+    def __init__(self, root, entry_codec=None):
+        self.root = root
+        self.codec = entry_codec or codec.get_codec()
+        self.tmp_dir = os.path.join(root, "tmp")
+        self.new_dir = os.path.join(root, "new")
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        os.makedirs(self.new_dir, exist_ok=True)
+
+    def submit(self, entry):
+        """Write entry as a new spool file and return its name"""
+        name = f"{time.time_ns():020d}.{os.getpid()}.{next(_counter):06d}.{uuid.uuid4().hex[:8]}{ENTRY_SUFFIX}"
+        tmp_path = os.path.join(self.tmp_dir, name)
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(self.codec.encode(entry))
+            os.replace(tmp_path, os.path.join(self.new_dir, name))
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return name
+
+    def pending(self):
+        """Return names of unconsumed entries, oldest first"""
+        try:
+            names = os.listdir(self.new_dir)
+        except FileNotFoundError:
+            return []
+        return sorted(n for n in names if n.endswith(_ENTRY_SUFFIXES))
+
+    def read(self, name):
+        """Return the parsed entry, or None if it vanished or is unreadable"""
+        try:
+            return codec.load(os.path.join(self.new_dir, name))
+        except (OSError, ValueError):
+            return None
+
+    def discard(self, name):
+        """Remove a consumed entry"""
+        try:
+            os.unlink(os.path.join(self.new_dir, name))
+        except FileNotFoundError:
+            pass
+
+    def peek(self):
+        """Return (name, entry) for every pending entry without consuming them"""
+        entries = []
+        for name in self.pending():
+            entry = self.read(name)
+            if entry is not None:
+                entries.append((name, entry))
+        return entries
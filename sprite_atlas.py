@@ -0,0 +1,120 @@
+"""
+Pre-rendered sprites for the board pieces.
+
+Tokens (body, rim, shine and team label) and house icons (shadow, body, roof
+and door) used to be drawn from primitives every frame, once per team and
+once per owned property. SpriteAtlas renders each distinct piece once: a
+token per team and a house per owner colour and board scale, so drawing them
+is a blit. The game rebuilds the atlas at startup and when the window (and so
+the house scale) changes; pieces for teams or colours that appear later are
+rendered on first use.
+
+Token sprites are colour-keyed opaque surfaces, drawn exactly as the pieces
+were drawn on the screen; house sprites keep the translucent shadow, so they
+use per-pixel alpha.
+"""
+import pygame
+
+SPRITE_COLORKEY = (255, 0, 255)
+TOKEN_RADIUS = 18
+TOKEN_SHADOW_SIZE = (34, 14)
+
+
+def house_scale(board_rect):
+    return max(14, board_rect.width // 55)
+
+
+class SpriteAtlas:
+    """Token and house sprites, rendered once per team / colour and scale"""
+
+    def __init__(self, text_cache, font):
+        self.text_cache = text_cache
+        self.font = font
+        self.tokens = {}  # (team_id, color) -> surface
+        self.houses = {}  # (color, scale) -> (surface, offset from the house anchor)
+        self.token_shadow = None
+
+    def build(self, teams, board_rect):
+        """Render the sprites for the current teams and board size"""
+        self.tokens.clear()
+        self.houses.clear()
+        self.token_shadow = self._render_token_shadow()
+        scale = house_scale(board_rect)
+        for team in teams:
+            self.token(team)
+            self.house(team.color, scale)
+
+    def token(self, team):
+        """Token body for team; blit it centred on the token position"""
+        key = (team.team_id, team.color)
+        sprite = self.tokens.get(key)
+        if sprite is None:
+            sprite = self.tokens[key] = self._render_token(team)
+        return sprite
+
+    def house(self, color, scale):
+        """(sprite, offset): blit the sprite at anchor + offset"""
+        key = (tuple(color), scale)
+        entry = self.houses.get(key)
+        if entry is None:
+            entry = self.houses[key] = self._render_house(color, scale)
+        return entry
+
+    def _render_token_shadow(self):
+        surface = pygame.Surface(TOKEN_SHADOW_SIZE).convert()
+        surface.fill(SPRITE_COLORKEY)
+        surface.set_colorkey(SPRITE_COLORKEY)
+        pygame.draw.ellipse(surface, (0, 0, 0, 120), surface.get_rect())
+        return surface
+
+    def _render_token(self, team):
+        size = 2 * TOKEN_RADIUS + 4
+        c = size // 2
+        surface = pygame.Surface((size, size)).convert()
+        surface.fill(SPRITE_COLORKEY)
+        surface.set_colorkey(SPRITE_COLORKEY)
+        pygame.draw.circle(surface, team.color, (c, c), TOKEN_RADIUS)
+        pygame.draw.circle(surface, (30, 30, 30), (c, c), TOKEN_RADIUS, 2)  # rim
+        # shine
+        pygame.draw.circle(surface, (255, 255, 255, 40), (c - 6, c - 8), 8)
+        # label
+        label = self.text_cache.render(self.font, team.team_id, True, (255, 255, 255))
+        surface.blit(label, (c - label.get_width() / 2, c - label.get_height() / 2))
+        return surface
+
+    def _render_house(self, color, scale):
+        body_w = int(scale * 1.2)
+        body_h = int(scale * 0.8)
+        roof_h = int(scale * 0.6)
+        # Draw around an anchor far enough inside the surface that all coordinates stay positive,
+        # so the integer rounding matches drawing at the real anchor
+        cx = body_w + 4
+        by = roof_h + body_h + 1
+        left = int(cx - body_w / 2)
+        top = int(by - body_h)
+        origin = (left - 3, top - roof_h - 1)
+        surface = pygame.Surface((body_w + 8, roof_h + 2 * body_h + 4), pygame.SRCALPHA).convert_alpha()
+        surface.fill((0, 0, 0, 0))
+
+        def local(x, y):
+            return (x - origin[0], y - origin[1])
+
+        # shadow
+        shadow = pygame.Surface((body_w + 6, body_h + 6), pygame.SRCALPHA).convert_alpha()
+        shadow.fill((0, 0, 0, 0))
+        pygame.draw.ellipse(shadow, (0, 0, 0, 90), shadow.get_rect())
+        surface.blit(shadow, local(left - 3, top + body_h - 4))
+        # body and roof
+        body = pygame.Rect(local(left, top), (body_w, body_h))
+        pygame.draw.rect(surface, color, body)
+        pygame.draw.rect(surface, (34, 34, 34), body, 1)
+        points = [local(cx, top - roof_h), local(left - 1, top), local(left + body_w + 1, top)]
+        pygame.draw.polygon(surface, color, points)
+        pygame.draw.polygon(surface, (34, 34, 34), points, 1)
+        # door
+        door_w = max(4, int(body_w * 0.26))
+        door_h = max(5, int(body_h * 0.6))
+        door_left = int(cx - door_w / 2)
+        door_top = int(top + body_h - door_h)
+        pygame.draw.rect(surface, (255, 255, 255), (local(door_left, door_top), (door_w, door_h)))
+        return surface, (origin[0] - cx, origin[1] - by)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Arthvidya Monopoly - Bot Tournament
+Plays many headless games between bot policies to balance the board and cards
+before an event, e.g.:
+
+    python start_tournament.py --games 20000 --policies always-buy cash-threshold trade-averse
+"""
+
+import argparse
+import sys
+
+from tournament import DEFAULT_MAX_TURNS, GAMES_PER_TASK, POLICIES, run_tournament
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Play bot tournaments on the headless game engine")
+    parser.add_argument("--games", type=int, default=10_000, help="number of games to play")
+    parser.add_argument("--policies", nargs="+", default=["always-buy", "cash-threshold", "trade-averse",
+                                                          "always-buy", "cash-threshold"],
+                        choices=sorted(POLICIES), metavar="POLICY",
+                        help=f"one policy per seat, 2 to 5 seats ({', '.join(sorted(POLICIES))})")
+    parser.add_argument("--seed", type=int, default=0, help="seed of game 0; game n uses seed + n")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS, help="turn limit per game")
+    parser.add_argument("--games-per-task", type=int, default=GAMES_PER_TASK,
+                        help="games each worker plays per task")
+    args = parser.parse_args(argv)
+    if not 2 <= len(args.policies) <= 5:
+        parser.error("between 2 and 5 policies (one per seat) are needed")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    print(f"🎲 Playing {args.games} games: {' vs '.join(args.policies)}")
+
+    last_report = [0]
+
+    def progress(stats):
+        # Roughly ten progress lines per tournament
+        if stats.games - last_report[0] >= max(1, args.games // 10):
+            last_report[0] = stats.games
+            print(f"   {stats.games}/{args.games} games")
+
+    summary = run_tournament(args.policies, args.games, seed=args.seed, workers=args.workers,
+                             max_turns=args.max_turns, games_per_task=args.games_per_task,
+                             on_progress=progress)
+
+    print(f"✅ {summary['games']} games in {summary['seconds']:.1f}s on {summary['workers']} workers: "
+          f"{summary['games_per_second']:.0f} games/s, {summary['games_per_second_per_core']:.0f} per core")
+    print(f"   {summary['decided']} decided by bankruptcy, {summary['mean_turns']:.1f} turns on average "
+          f"(longest {summary['max_turns']})")
+    print(f"{'policy':<16}{'seats':>8}{'win rate':>10}{'bankrupt':>10}")
+    for name, row in summary["policies"].items():
+        print(f"{name:<16}{row['seats']:>8}{row['win_rate']:>10.3f}{row['bankruptcy_rate']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Typed state deltas and a bounded history of them.
+
+Every published snapshot is diffed against the previous one into a short list
+of typed deltas, for example:
+
+    {"kind": "balance", "team": "T1", "value": 9500000}
+    {"kind": "position", "team": "T1", "value": 7}
+    {"kind": "owner", "tile": "7", "owner": "T1", "name": "Mumbai"}
+    {"kind": "turn", "current_player": 2}
+    {"kind": "append", "key": "messages", "items": [...], "size": 50}
+    {"kind": "set", "key": "dice_rolled", "value": true}
+    {"kind": "remove", "key": "game_log"}
+
+DeltaHistory keeps the deltas for the most recent versions so a client that
+last saw version N can ask for everything since N and patch its local copy
+with apply_deltas. If N is too old (or from an earlier game run) the history
+cannot answer and the client needs a full snapshot instead.
+"""
+import threading
+from collections import deque
+
+HISTORY_SIZE = 256
+
+_META_KEYS = ("epoch", "version")
+
+
+def _team_ids(teams):
+    return [t.get("id") for t in teams]
+
+
+def _team_deltas(old, new):
+    """Per-team balance/position deltas, or None if the team list changed shape"""
+    if _team_ids(old) != _team_ids(new):
+        return None
+    deltas = []
+    for before, after in zip(old, new):
+        if before == after:
+            continue
+        if {k: v for k, v in before.items() if k not in ("balance", "pos")} != \
+                {k: v for k, v in after.items() if k not in ("balance", "pos")}:
+            return None
+        if before.get("balance") != after.get("balance"):
+            deltas.append({"kind": "balance", "team": after["id"], "value": after.get("balance")})
+        if before.get("pos") != after.get("pos"):
+            deltas.append({"kind": "position", "team": after["id"], "value": after.get("pos")})
+    return deltas
+
+
+def _owner_deltas(old, new):
+    deltas = []
+    for tile in sorted(set(old) | set(new), key=lambda t: int(t) if str(t).isdigit() else 0):
+        if old.get(tile) == new.get(tile):
+            continue
+        prop = new.get(tile)
+        if prop is None:
+            deltas.append({"kind": "owner", "tile": tile, "owner": None, "name": None})
+        else:
+            deltas.append({"kind": "owner", "tile": tile,
+                           "owner": prop.get("owner"), "name": prop.get("name")})
+    return deltas
+
+
+def _appended_items(old, new):
+    """Items appended to old to get new (after trimming from the front), or None"""
+    if not old or not new:
+        return None
+    try:
+        last = len(new) - 1 - new[::-1].index(old[-1])
+    except ValueError:
+        return None
+    overlap = new[:last + 1]
+    if old[-len(overlap):] != overlap:
+        return None
+    return new[last + 1:]
+
+
+def diff_states(old, new):
+    """Typed deltas that turn snapshot old into snapshot new (ignoring epoch/version)"""
+    deltas = []
+    for key, value in new.items():
+        if key in _META_KEYS or old.get(key) == value:
+            continue
+        if key == "teams" and isinstance(old.get(key), list):
+            team_deltas = _team_deltas(old[key], value)
+            if team_deltas is not None:
+                deltas.extend(team_deltas)
+                continue
+        elif key == "properties" and isinstance(old.get(key), dict):
+            deltas.extend(_owner_deltas(old[key], value))
+            continue
+        elif key == "current_player":
+            deltas.append({"kind": "turn", "current_player": value})
+            continue
+        elif isinstance(value, list) and isinstance(old.get(key), list):
+            # Bounded logs such as messages: send only the new entries
+            items = _appended_items(old[key], value)
+            if items is not None:
+                deltas.append({"kind": "append", "key": key, "items": items, "size": len(value)})
+                continue
+        deltas.append({"kind": "set", "key": key, "value": value})
+    for key in old:
+        if key not in new and key not in _META_KEYS:
+            deltas.append({"kind": "remove", "key": key})
+    return deltas
+
+
+def apply_deltas(state, deltas):
+    """Return a copy of state with deltas applied (state itself is not modified)"""
+    state = dict(state)
+    teams = None
+    properties = None
+    for delta in deltas:
+        kind = delta.get("kind")
+        if kind in ("balance", "position"):
+            if teams is None:
+                teams = [dict(t) for t in state.get("teams", [])]
+                state["teams"] = teams
+            field = "balance" if kind == "balance" else "pos"
+            for team in teams:
+                if team.get("id") == delta["team"]:
+                    team[field] = delta["value"]
+                    break
+        elif kind == "owner":
+            if properties is None:
+                properties = dict(state.get("properties", {}))
+                state["properties"] = properties
+            if delta.get("owner") is None:
+                properties.pop(delta["tile"], None)
+            else:
+                properties[delta["tile"]] = {"owner": delta["owner"], "name": delta["name"]}
+        elif kind == "turn":
+            state["current_player"] = delta["current_player"]
+        elif kind == "append":
+            items = list(state.get(delta["key"], [])) + delta["items"]
+            state[delta["key"]] = items[len(items) - delta["size"]:]
+        elif kind == "set":
+            state[delta["key"]] = delta["value"]
+            if delta["key"] == "teams":
+                teams = None
+            elif delta["key"] == "properties":
+                properties = None
+        elif kind == "remove":
+            state.pop(delta["key"], None)
+    return state
+
+
+class DeltaHistory:
+    """Bounded history of typed deltas per published version (thread-safe)"""
+
+    def __init__(self, size=HISTORY_SIZE):
+        self.entries = deque(maxlen=size)
+        self.lock = threading.Lock()
+        self.epoch = None
+        self.version = None
+        self.last_snapshot = None
+
+    def record(self, snapshot):
+        """Diff snapshot against the previous one and remember the deltas; returns them"""
+        with self.lock:
+            previous = self.last_snapshot
+            epoch = snapshot.get("epoch")
+            if previous is None or epoch != self.epoch:
+                # First snapshot of this game run: nothing to diff against
+                self.entries.clear()
+                deltas = None
+            else:
+                deltas = diff_states(previous, snapshot)
+                self.entries.append({"version": snapshot.get("version"), "deltas": deltas})
+            self.epoch = epoch
+            self.version = snapshot.get("version")
+            self.last_snapshot = snapshot
+            return deltas
+
+    def since(self, epoch, version):
+        """Delta entries newer than version, or None if a full snapshot is needed"""
+        with self.lock:
+            if self.last_snapshot is None or epoch != self.epoch or version is None:
+                return None
+            if version == self.version:
+                return []
+            if version > self.version:
+                return None
+            # Entry versions are consecutive; the oldest entry's base is one below it
+            if not self.entries or self.entries[0]["version"] - 1 > version:
+                return None
+            return [entry for entry in self.entries if entry["version"] > version]
+
+    def snapshot(self):
+        with self.lock:
+            return self.last_snapshot
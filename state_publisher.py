@@ -0,0 +1,110 @@
+"""
+Versioned state publication for the Streamlit bridge.
+
+The game builds a small snapshot dict every frame, but game_state.json is only
+rewritten when that snapshot actually differs from the last published one.
+Every published snapshot carries an ``epoch`` (fixed per game process) and a
+monotonically increasing ``version``, written as the first keys of the file so
+readers can peek at them and skip re-parsing an unchanged snapshot.
+
+Snapshots are encoded with the configured bridge codec (see codec.py). Only
+JSON snapshots can be peeked at; binary ones are simply decoded.
+"""
+import re
+import time
+
+import codec
+from file_watch import StatWatcher
+
+VERSION_PEEK_BYTES = 96
+_EPOCH_RE = re.compile(rb'"epoch"\s*:\s*(\d+)')
+_VERSION_RE = re.compile(rb'"version"\s*:\s*(\d+)')
+
+
+def write_snapshot(path, snapshot, snapshot_codec=None):
+    """Atomically replace path with the encoded snapshot (readers never see a partial file)"""
+    codec.dump(path, snapshot, snapshot_codec)
+
+
+def peek_snapshot_version(path):
+    """Return (epoch, version) from the head of a snapshot file, or None if absent"""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(VERSION_PEEK_BYTES)
+    except OSError:
+        return None
+    epoch = _EPOCH_RE.search(head)
+    version = _VERSION_RE.search(head)
+    if not epoch or not version:
+        return None
+    return int(epoch.group(1)), int(version.group(1))
+
+
+class StatePublisher:
+    """Publishes game state snapshots only when they change"""
+
+    def __init__(self, path, snapshot_codec=None):
+        self.path = path
+        self.codec = snapshot_codec or codec.get_codec()
+        # Epoch distinguishes game restarts, so a restarted game's version 1
+        # is never mistaken for a previous run's version 1.
+        self.epoch = int(time.time() * 1000)
+        self.version = 0
+        self.last_state = None
+        self.published_count = 0
+        self.skipped_count = 0
+        self.listeners = []
+
+    def add_listener(self, callback):
+        """Call callback(snapshot) after every published snapshot"""
+        self.listeners.append(callback)
+
+    def publish(self, state):
+        """Publish state if it changed; returns the versioned snapshot or None"""
+        if state == self.last_state:
+            self.skipped_count += 1
+            return None
+        snapshot = {"epoch": self.epoch, "version": self.version + 1}
+        snapshot.update(state)
+        write_snapshot(self.path, snapshot, self.codec)
+        # Only a written snapshot counts: after a failed write the same state
+        # is retried instead of being skipped as unchanged
+        self.version += 1
+        self.last_state = state
+        self.published_count += 1
+        for callback in self.listeners:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                print(f"State listener error: {e}")
+        return snapshot
+
+
+class SnapshotReader:
+    """Reads a published snapshot, re-parsing only when its version changed"""
+
+    def __init__(self, path):
+        self.path = path
+        self.cached_token = None
+        self.cached_state = None
+        self.watch = StatWatcher(path)
+
+    def load(self):
+        """Return the latest snapshot, or None if it cannot be read"""
+        if self.cached_state is not None and not self.watch.changed():
+            return self.cached_state
+        token = peek_snapshot_version(self.path)
+        if token is not None and token == self.cached_token:
+            return self.cached_state
+        try:
+            state = codec.load(self.path)
+        except (OSError, ValueError):
+            return None
+        # Cache under the version actually parsed; the file may have been
+        # replaced between the peek and the read.
+        if "epoch" in state and "version" in state:
+            self.cached_token = (state["epoch"], state["version"])
+        else:
+            self.cached_token = None
+        self.cached_state = state
+        return state
@@ -1,5 +1,4 @@
 import streamlit as st
-import json
 import time
 import threading
 import queue
@@ -8,12 +7,22 @@ from datetime import datetime
 import subprocess
 import sys
 
+import codec
+from push_client import get_game_client
+from shm_state import SharedStateReader, read_state
+from spool import CONTROL_COMMANDS_SPOOL, PLAYER_ACTIONS_SPOOL, Spool
+from state_publisher import SnapshotReader
+
 # Game state management
 class GameStateManager:
     def __init__(self):
         self.game_state_file = "game_state.json"
-        self.player_actions_file = "player_actions.json"
-        self.control_commands_file = "control_commands.json"
+        self.control_spool = Spool(CONTROL_COMMANDS_SPOOL)
+        self.action_spool = Spool(PLAYER_ACTIONS_SPOOL)
+        self.state_reader = SnapshotReader(self.game_state_file)
+        self.shared_state = SharedStateReader()
+        self.game_client = get_game_client()
+        self.game_client.subscribe()
         self.init_files()
     
     def init_files(self):
@@ -36,51 +45,49 @@ class GameStateManager:
                 "pending_actions": {},
                 "game_log": []
             })
-        
-        if not os.path.exists(self.player_actions_file):
-            self.save_player_actions({})
-        
-        if not os.path.exists(self.control_commands_file):
-            self.save_control_commands({})
     
     def save_game_state(self, state):
-        """Save game state to JSON file"""
-        with open(self.game_state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        """Save game state to the state file using the configured bridge codec"""
+        codec.dump(self.game_state_file, state)
     
     def load_game_state(self):
-        """Load game state from JSON file"""
-        try:
-            with open(self.game_state_file, 'r') as f:
-                return json.load(f)
-        except:
-            return None
-    
-    def save_player_actions(self, actions):
-        """Save player actions to JSON file"""
-        with open(self.player_actions_file, 'w') as f:
-            json.dump(actions, f, indent=2)
+        """Load game state, preferring the copy patched from the game's pushed deltas"""
+        if self.game_client.following and self.game_client.state is not None:
+            return self.game_client.state
+        # Not connected to the game's push server; shared memory, else the JSON file
+        return read_state(self.shared_state, self.state_reader)
+    
+    def submit_player_action(self, action):
+        """Send a player action over the game socket, spooling it as a file if the game is unreachable"""
+        if self.game_client.send_action(action["team_id"], action["action"]):
+            return
+        self.action_spool.submit(action)
     
     def load_player_actions(self):
-        """Load player actions from JSON file"""
-        try:
-            with open(self.player_actions_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {}
-    
-    def save_control_commands(self, commands):
-        """Save control commands to JSON file"""
-        with open(self.control_commands_file, 'w') as f:
-            json.dump(commands, f, indent=2)
+        """Load pending player actions (latest per team) from the spool"""
+        actions = {}
+        for _, action in self.action_spool.peek():
+            actions[action.get('team_id', 'unknown')] = action
+        return actions
+    
+    def submit_control_command(self, command):
+        """Send a control command over the game socket, spooling it as a file if the game is unreachable"""
+        if self.game_client.send_command(command["command"], command.get("source", "control_center")):
+            return
+        self.control_spool.submit(command)
     
     def load_control_commands(self):
-        """Load control commands from JSON file"""
-        try:
-            with open(self.control_commands_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {}
+        """Load pending control commands from the spool"""
+        return dict(self.control_spool.peek())
+    
+    def wait_for_update(self, timeout):
+        """Block until the game pushes a state change or timeout elapses"""
+        self.game_client.subscribe()
+        if self.game_client.version is None:
+            # Not connected to the game's push server (yet); plain polling
+            time.sleep(timeout)
+            return
+        self.game_client.wait_for_update(self.game_client.version, timeout)
 
 # Initialize the game state manager
 @st.cache_resource
@@ -153,6 +160,7 @@ def control_center_page(game_manager):
     
     # Game controls
     st.subheader("🎮 Game Controls")
+    show_command_status(game_state, "control_center")
     
     col1, col2, col3 = st.columns(3)
     
@@ -238,7 +246,7 @@ def control_center_page(game_manager):
     
     # Auto-refresh
     if st.checkbox("🔄 Auto-refresh (5s)"):
-        time.sleep(5)
+        game_manager.wait_for_update(5)
         st.rerun()
 
 def team_page(game_manager, team_number):
@@ -270,6 +278,8 @@ def team_page(game_manager, team_number):
         is_current = game_state['current_player'] == (team_number - 1)
         st.metric("🎯 Status", "Your Turn" if is_current else "Waiting")
     
+    show_command_status(game_state, team_id)
+    
     # Current player actions
     if is_current:
         st.success("🎯 It's your turn!")
@@ -347,28 +357,34 @@ def team_page(game_manager, team_number):
     
     # Auto-refresh
     if st.checkbox("🔄 Auto-refresh (3s)"):
-        time.sleep(3)
+        game_manager.wait_for_update(3)
         st.rerun()
 
 def send_command(game_manager, command):
     """Send a command from the control center"""
-    commands = game_manager.load_control_commands()
-    commands[datetime.now().isoformat()] = {
+    game_manager.submit_control_command({
         "command": command,
         "timestamp": datetime.now().isoformat(),
         "source": "control_center"
-    }
-    game_manager.save_control_commands(commands)
+    })
 
 def send_player_action(game_manager, team_id, action):
     """Send a player action"""
-    actions = game_manager.load_player_actions()
-    actions[team_id] = {
+    game_manager.submit_player_action({
         "action": action,
         "timestamp": datetime.now().isoformat(),
         "team_id": team_id
-    }
-    game_manager.save_player_actions(actions)
+    })
+
+def show_command_status(game_state, source):
+    """Show why the game deferred or rejected the last command from this page"""
+    status = game_state.get('command_status', {}).get(source)
+    if not status:
+        return
+    if status['status'] == 'deferred':
+        st.info(f"⏳ '{status['command']}' is waiting: {status['reason']}")
+    elif status['status'] == 'rejected':
+        st.warning(f"🚫 '{status['command']}' was rejected: {status['reason']}")
 
 if __name__ == "__main__":
     main()
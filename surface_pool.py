@@ -0,0 +1,94 @@
+"""
+Reusable helper surfaces for overlays and drop shadows.
+
+The overlays used to allocate a full-window SRCALPHA surface (about 5 MB at
+1400x900) every frame just to dim the board, and every card, popup and house
+icon allocated its own translucent shadow surface. These surfaces only depend
+on their size and a few drawing parameters, so SurfacePool keeps them keyed
+by size, flags and what was painted on them, and a steady-state frame
+allocates nothing. The least recently used entries are dropped beyond a fixed
+size (popup shadows follow the message width); the game clears the pool when
+the window is resized.
+
+frame_allocations counts the surfaces allocated since begin_frame(), so a
+non-zero value in steady state points at a cache miss.
+
+Pooled surfaces are shared: callers may blit them but must not draw on them.
+"""
+from collections import OrderedDict
+
+import pygame
+
+DEFAULT_MAX_ENTRIES = 64
+
+
+class SurfacePool:
+    """Cache of pre-painted surfaces keyed by size, flags and contents"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.allocations = 0
+        self.frame_allocations = 0
+        self.peak_frame_allocations = 0
+        self.frames = 0
+
+    def get(self, size, flags=0, contents=None, paint=None):
+        """Surface of size/flags painted by paint(surface) the first time this key is used"""
+        key = (tuple(size), flags, contents)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            return surface
+        surface = pygame.Surface(key[0], flags)
+        if flags & pygame.SRCALPHA:
+            surface = surface.convert_alpha()
+        else:
+            surface = surface.convert()
+        if paint is not None:
+            paint(surface)
+        self.allocations += 1
+        self.frame_allocations += 1
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def dim_overlay(self, size, color):
+        """Window-sized dimming layer; color is (r, g, b, alpha)"""
+        # Opaque surface with surface alpha: blends faster than per-pixel alpha
+        def paint(surface):
+            surface.fill(color[:3])
+            surface.set_alpha(color[3])
+        return self.get(size, 0, ("dim", tuple(color)), paint)
+
+    def rounded_shadow(self, size, color, border_radius):
+        """Translucent rounded rectangle filling the surface"""
+        def paint(surface):
+            surface.fill((0, 0, 0, 0))
+            pygame.draw.rect(surface, color, surface.get_rect(), border_radius=border_radius)
+        return self.get(size, pygame.SRCALPHA, ("rounded", tuple(color), border_radius), paint)
+
+    def ellipse_shadow(self, size, color):
+        """Translucent ellipse filling the surface"""
+        def paint(surface):
+            surface.fill((0, 0, 0, 0))
+            pygame.draw.ellipse(surface, color, surface.get_rect())
+        return self.get(size, pygame.SRCALPHA, ("ellipse", tuple(color)), paint)
+
+    def begin_frame(self):
+        self.peak_frame_allocations = max(self.peak_frame_allocations, self.frame_allocations)
+        self.frame_allocations = 0
+        self.frames += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "allocations": self.allocations,
+            "frames": self.frames,
+            "last_frame_allocations": self.frame_allocations,
+            "peak_frame_allocations": self.peak_frame_allocations,
+        }
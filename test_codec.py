@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the bridge codecs
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import codec
+
+SAMPLE = {
+    "epoch": 1_700_000_000_000,
+    "version": 42,
+    "teams": [{"id": f"T{i}", "balance": -1_500_000 * i, "pos": i, "skip": i % 2 == 0} for i in range(5)],
+    "properties": {str(tile): {"owner": "T1", "name": "Mumbai"} for tile in range(300)},  # > 255 entries
+    "messages": [f"message {i}" for i in range(300)],  # > 255 items
+    "long_text": "₹ rent " * 100,  # > 255 bytes
+    "nested": {"a": {"b": {"c": [1, [2, [3, None]], {"d": 0.25}]}}},
+    "empty": {"list": [], "map": {}, "text": ""},
+}
+BIG_INTS = [2 ** 31, -2 ** 31 - 1, 2 ** 62, -2 ** 63]
+HUGE_INTS = [2 ** 64, -2 ** 70, 10 ** 30]  # beyond 64 bits: json and packed only
+
+
+@pytest.mark.parametrize("name", sorted(codec.CODECS))
+def test_round_trip(name):
+    data = codec.CODECS[name].encode(SAMPLE)
+    assert codec.CODECS[name].decode(data) == SAMPLE
+    assert codec.decode(data) == SAMPLE
+    assert codec.decode(codec.CODECS[name].encode(BIG_INTS)) == BIG_INTS
+
+
+@pytest.mark.parametrize("name", ["json", "packed"])
+def test_round_trip_huge_ints(name):
+    # Not via decode(): it parses JSON with orjson when installed, which is 64-bit only
+    assert codec.CODECS[name].decode(codec.CODECS[name].encode(HUGE_INTS)) == HUGE_INTS
+
+
+def test_decode_detects_the_format():
+    assert codec.CODECS["packed"].encode(SAMPLE).startswith(codec.PACKED_MAGIC)
+    assert codec.CODECS["json"].encode(SAMPLE).startswith(b"{")
+    if "msgpack" in codec.CODECS:
+        assert codec.CODECS["msgpack"].encode(SAMPLE).startswith(codec.MSGPACK_MAGIC)
+    for name in codec.CODECS:
+        assert codec.decode(codec.CODECS[name].encode([name, 1])) == [name, 1]
+
+
+@pytest.mark.parametrize("name", sorted(codec.CODECS))
+def test_truncated_data_raises_value_error(name):
+    data = codec.CODECS[name].encode(SAMPLE)
+    for size in (len(data) // 2, len(data) - 1):
+        with pytest.raises(ValueError):
+            codec.decode(data[:size])
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"{not json",
+    codec.PACKED_MAGIC,
+    codec.PACKED_MAGIC + b"x",  # unknown tag
+    codec.PACKED_MAGIC + b"s\x05ab",  # string shorter than its length
+    codec.PACKED_MAGIC + b"s\x02\xff\xfe",  # not UTF-8
+    codec.PACKED_MAGIC + b"NN",  # trailing data
+    codec.MSGPACK_MAGIC + b"\xc1\xc1",
+])
+def test_garbage_raises_value_error(data):
+    with pytest.raises(ValueError):
+        codec.decode(data)
+
+
+def test_dump_and_load(tmp_path):
+    path = tmp_path / "game_state.json"
+    for name in codec.CODECS:
+        codec.dump(str(path), SAMPLE, codec.CODECS[name])
+        assert codec.load(str(path)) == SAMPLE
+    assert os.listdir(tmp_path) == ["game_state.json"]  # no temp files left behind
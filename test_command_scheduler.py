@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for bridge command scheduling
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bridge_worker import BridgeCommand
+from command_scheduler import (
+    COALESCE_WINDOW_S, COALESCED, DEFER_TIMEOUT_S, DEFERRED, EXECUTED, MAX_QUEUED_PER_SOURCE, READY,
+    REJECTED, CommandScheduler, defer,
+)
+from engine import GameEngine
+
+
+def action(team_id, name):
+    return BridgeCommand(source=team_id, name=name, team_id=team_id)
+
+
+def make_scheduler():
+    results = []
+    scheduler = CommandScheduler(on_result=lambda command, status, reason: results.append((command.name, status)))
+    return scheduler, results
+
+
+def run_all(scheduler, check=lambda command: READY):
+    executed = []
+    scheduler.run(check, lambda command: executed.append((command.source, command.name)),
+                  deadline=time.perf_counter() + 1.0)
+    return executed
+
+
+def test_duplicates_coalesce_within_the_window():
+    scheduler, results = make_scheduler()
+    now = time.monotonic()
+    assert scheduler.submit(action("T1", "roll_dice"), now)
+    assert not scheduler.submit(action("T1", "roll_dice"), now)  # still queued
+    assert run_all(scheduler) == [("T1", "roll_dice")]
+    assert not scheduler.submit(action("T1", "roll_dice"), time.monotonic())  # just executed
+    assert scheduler.submit(action("T2", "roll_dice"), now)  # other team, other key
+    assert scheduler.submit(action("T1", "roll_dice"), time.monotonic() + 2.0)  # window passed
+    assert [status for _, status in results] == [COALESCED, EXECUTED, COALESCED]
+
+
+def test_full_queue_rejects_more_commands():
+    scheduler, results = make_scheduler()
+    for i in range(MAX_QUEUED_PER_SOURCE):
+        assert scheduler.submit(action("T1", f"action_{i}"))
+    assert not scheduler.submit(action("T1", "one_too_many"))
+    assert results == [("one_too_many", REJECTED)]
+    assert scheduler.submit(action("T2", "roll_dice"))  # other sources keep their own queue
+    assert scheduler.pending() == MAX_QUEUED_PER_SOURCE + 1
+
+
+def test_deferred_command_is_rejected_after_the_timeout():
+    scheduler, results = make_scheduler()
+    scheduler.submit(action("T1", "end_turn"))
+    scheduler.submit(action("T2", "end_turn"), time.monotonic() - DEFER_TIMEOUT_S - 1)
+    moving = lambda command: defer("token is moving")
+    assert run_all(scheduler, moving) == []
+    assert run_all(scheduler, moving) == []
+    # Reported once while waiting; the stale one times out at once
+    assert results == [("end_turn", DEFERRED), ("end_turn", REJECTED)]
+    assert scheduler.pending() == 1
+    assert run_all(scheduler) == [("T1", "end_turn")]
+
+
+def test_sources_take_turns():
+    scheduler, _ = make_scheduler()
+    for name in ("a1", "a2", "a3"):
+        scheduler.submit(action("T1", name))
+    for name in ("b1", "b2"):
+        scheduler.submit(action("T2", name))
+    scheduler.submit(BridgeCommand(source="control_center", name="c1"))
+    executed = run_all(scheduler)
+    assert [name for _, name in executed] == ["a1", "b1", "c1", "a2", "b2", "a3"]
+    assert scheduler.pending() == 0
+
+
+def test_commands_sent_while_the_token_moves():
+    game = GameEngine(seed=3)
+    results = []
+    scheduler = CommandScheduler(on_result=lambda command, status, reason: results.append(
+        (command.source, command.name, status, reason)))
+    executed = []
+
+    def execute(command):
+        executed.append(command.name)
+        if command.name == "roll_dice":
+            game.roll_dice()
+
+    def run():
+        scheduler.run(game.check_streamlit_command, execute, deadline=time.perf_counter() + 1.0)
+
+    now = time.monotonic()
+    scheduler.submit(action("T1", "roll_dice"), now)
+    run()
+    assert game.moving
+    # Repeated clicks after the coalescing window, while the token still moves
+    later = now + COALESCE_WINDOW_S + 0.2
+    for command in (action("T1", "roll_dice"), BridgeCommand(source="control_center", name="roll_dice"),
+                    action("T1", "end_turn"), action("T1", "buy_property"), action("T1", "sell_property")):
+        scheduler.submit(command, later)
+    while game.moving:
+        run()
+        game.step(0.1)
+    run()
+    assert executed == ["roll_dice", "sell_property"]  # one roll; selling waited for the landing
+    rejected = {(source, name): reason for source, name, status, reason in results if status == REJECTED}
+    assert rejected[("T1", "roll_dice")] == rejected[("control_center", "roll_dice")] == \
+        "dice already rolled, token is moving"
+    assert set(rejected) == {("T1", "roll_dice"), ("control_center", "roll_dice"),
+                             ("T1", "end_turn"), ("T1", "buy_property")}
+    assert game.current_idx == 0
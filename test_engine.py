@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for the headless rules engine
+"""
+import os
+import subprocess
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from engine import BOARD_SPACES, MYSTERY_APPLY_DELAY_S, SPIN_DURATION_S, GameEngine
+
+
+def finish_move(game):
+    while game.moving:
+        game.step(0.1)
+
+
+def test_engine_does_not_import_pygame():
+    code = "import sys, engine; sys.exit('pygame' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.returncode == 0
+
+
+def test_roll_moves_current_team():
+    game = GameEngine(seed=1)
+    game.roll_dice()
+    steps = game.last_dice_roll
+    finish_move(game)
+    assert game.teams[0].pos == steps
+    assert game.token_trail["T1"][-1] == steps
+
+
+def test_one_long_step_finishes_the_move():
+    game = GameEngine(seed=1)
+    game.roll_dice()
+    game.step(10.0)
+    assert not game.moving
+    assert game.teams[0].pos == game.last_dice_roll
+    assert game.token_trail["T1"][-1] == game.last_dice_roll
+
+
+def test_seeded_games_repeat():
+    rolls = []
+    for _ in range(2):
+        game = GameEngine(seed=7)
+        seq = []
+        for _ in range(20):
+            game.roll_dice()
+            seq.append(game.last_dice_roll)
+            finish_move(game)
+            game.next_turn()
+        rolls.append(seq)
+    assert rolls[0] == rolls[1]
+
+
+def test_go_bonus_and_penalties():
+    game = GameEngine(seed=1)
+    team = game.teams[0]
+    team.pos = BOARD_SPACES - 1
+    game.move_steps = 7
+    game.moving = True
+    game.from_pos_idx = team.pos
+    game.to_pos_idx = 0
+    finish_move(game)
+    # Passed GO (+2M) and landed on Society Penalty (-1M, skip next turn)
+    assert team.pos == 6
+    assert team.balance == 11_000_000
+    assert game.skip_next_turn["T1"]
+
+
+def test_buy_sell_and_undo():
+    game = GameEngine(seed=1)
+    team = game.teams[0]
+    team.pos = 1
+    game.buy_current()
+    assert game.properties[1]["owner"] == "T1"
+    game._sell_property(1)
+    assert game.properties[1]["owner"] is None
+    assert team.balance == 11_500_000
+    game.undo_move()
+    assert game.properties[1]["owner"] == "T1"
+    assert team.balance == 10_000_000
+
+
+def test_trade_transfers_money_and_property():
+    game = GameEngine(seed=1)
+    game._set_owner(3, "T1")
+    game._start_trading()
+    game._select_property_for_trade(3)
+    game._adjust_trading_offer(1, 1_500_000)
+    game._choose_trading_buyer("T2")
+    assert game.properties[3]["owner"] == "T2"
+    assert game.teams[0].balance == 12_000_000
+    assert game.teams[1].balance == 8_000_000
+
+
+def test_mystery_applies_after_spin_and_delay():
+    game = GameEngine(seed=3)
+    game._trigger_mystery()
+    game.step(SPIN_DURATION_S)
+    assert not game.spinning and game.selected_mystery is not None
+    game.step(MYSTERY_APPLY_DELAY_S)
+    assert game.selected_mystery is None
+    assert not game.show_mystery
+    assert game.mystery_feedback
+
+
+def test_ownership_index_follows_every_change():
+    game = GameEngine(seed=1)
+    index = game.ownership
+    game.teams[0].pos = 7
+    game.buy_current()
+    game._set_owner(9, "T1")
+    green = game.property_data[7]["color"]
+    assert index.tiles("T1") == {7, 9}
+    assert index.group_count("T1", green) == 2
+    assert index.net_worth(game.teams[0]) == 10_000_000 + 3_000_000 + 3_500_000
+    game._start_trading()
+    game._select_property_for_trade(9)
+    game._adjust_trading_offer(1, 500_000)
+    game._choose_trading_buyer("T2")
+    assert index.tiles("T1") == {7} and index.tiles("T2") == {9}
+    assert index.group_count("T2", green) == 1
+    game.undo_move()
+    assert index.tiles("T1") == {7, 9} and not index.tiles("T2")
+    assert [p["owner"] for p in game.properties if p["owner"]] == ["T1", "T1"]
+    game._reset_game()
+    assert not index.owner_of and index.property_value("T1") == 0
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for the Markov-chain landing model, cross-checked against batch_sim
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import markov
+from batch_sim import BatchSimulator
+from engine import GameEngine
+
+WARM_UP_TURNS = 50  # every game starts on GO; skip the transient before counting
+LANDING_TOLERANCE = 0.004  # absolute, per tile; sampling noise here is about 0.001
+
+
+def test_chain_is_well_formed():
+    P, L = markov.transition_matrices(GameEngine(seed=0, history_size=0).mystery_cards)
+    assert np.allclose(P.sum(axis=1), 1.0)
+    assert (P >= 0).all() and (L >= 0).all()
+    pi = markov.stationary_distribution(P)
+    assert np.isclose(pi.sum(), 1.0)
+    assert np.allclose(pi @ P, pi)
+    assert (pi > -1e-12).all()
+    # Every turn but the skipped one ends on some tile
+    assert np.isclose((pi @ L).sum(), 1.0 - pi[markov.SKIP_STATE])
+
+
+def test_landing_shares_match_the_batch_simulator():
+    expected = markov.analyze()["landing"]
+    expected = expected / expected.sum()  # batch_sim does not count skipped turns
+
+    # Nobody buys, so no team goes broke and every game runs the full length
+    sim = BatchSimulator(2000, seed=1, buy_reserve=float("inf"), recent_results=0)
+    for _ in range(WARM_UP_TURNS):
+        sim.step()
+    sim.landings[:] = 0
+    summary = sim.run(max_turns=100)
+    assert summary["finished"] == 0
+    assert np.abs(summary["landing_share"] - expected).max() < LANDING_TOLERANCE
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Tests for the push server's per-connection output
+"""
+import json
+import os
+import queue
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from push_server import MAX_OUTBUF_BYTES, PushServer, _Connection
+
+
+def test_slow_subscriber_is_resynced_with_a_snapshot():
+    server = PushServer(queue.Queue())
+    conn = _Connection(None)
+    conn.subscribed = True
+    server.connections["never-reads"] = conn
+    messages = ["m" * 200] * 50
+    for version in range(1, 3000):
+        server.broadcast({"epoch": 1, "version": version, "messages": messages, "turn": version})
+    assert len(conn.outbuf) <= MAX_OUTBUF_BYTES
+
+    # Whatever is queued still reads as one consistent stream
+    pushed = [json.loads(line) for line in bytes(conn.outbuf).split(b"\n") if line]
+    assert "snapshot" in [message["type"] for message in pushed[1:]]
+    version = None
+    for message in pushed:
+        if message["type"] == "delta" and version is not None:
+            assert message["base_version"] == version
+        version = message["version"]
+    assert version == 2999
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared-memory state segment
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from shm_state import _SEQ, NO_OWNER, NUM_TILES, SharedStateReader, SharedStateWriter, read_state, shared_memory
+
+pytestmark = pytest.mark.skipif(shared_memory is None, reason="shared memory not available")
+
+BALANCES = [10_000_000] * 5
+POSITIONS = [0] * 5
+OWNERS = [NO_OWNER] * NUM_TILES
+
+
+class FakeSnapshotReader:
+    def __init__(self, state):
+        self.state = state
+        self.cached_state = None
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        self.cached_state = self.state
+        return self.state
+
+
+@pytest.fixture
+def name():
+    return f"test_state_{os.getpid()}"
+
+
+def test_seqlock_hides_a_write_in_progress(name):
+    writer = SharedStateWriter(name)
+    reader = SharedStateReader(name)
+    try:
+        assert reader.read() is None  # created but never written
+        writer.write(1, 2, True, BALANCES, [3, 0, 0, 0, 0], OWNERS)
+        hot = reader.read()
+        assert (hot.event_seq, hot.current_player, hot.moving, hot.positions[0]) == (1, 2, True, 3)
+        _SEQ.pack_into(writer.shm.buf, 0, writer.seq + 1)  # odd: writer is mid-update
+        assert reader.read() is None
+        _SEQ.pack_into(writer.shm.buf, 0, writer.seq)
+        assert reader.read() == hot
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_reader_follows_a_restarted_game(name):
+    snapshot = FakeSnapshotReader({"event_seq": 5, "teams": [{"id": "T1", "balance": 0, "pos": 0}]})
+    writer = SharedStateWriter(name)
+    reader = SharedStateReader(name)
+    try:
+        writer.write(5, 0, False, BALANCES, [7, 0, 0, 0, 0], OWNERS)
+        assert read_state(reader, snapshot)["teams"][0]["pos"] == 7
+        assert snapshot.loads == 1
+        writer.close()
+
+        # Same event_seq as the old game, so only the restart can force the reload
+        writer = SharedStateWriter(name)
+        writer.write(5, 0, False, BALANCES, [2, 0, 0, 0, 0], OWNERS)
+        assert read_state(reader, snapshot)["teams"][0]["pos"] == 2
+        assert snapshot.loads == 2
+        assert read_state(reader, snapshot)["teams"][0]["pos"] == 2
+        assert snapshot.loads == 2
+
+        writer.close()
+        assert reader.read() is None
+    finally:
+        reader.close()
+        writer.close()
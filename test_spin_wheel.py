@@ -6,18 +6,14 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from main import Game
-import pygame
+from engine import GameEngine
 
 def test_spin_wheel():
     """Test the spin wheel functionality"""
     print("Testing spin wheel functionality...")
     
-    # Initialize pygame
-    pygame.init()
-    
-    # Create game instance
-    game = Game()
+    # Create a headless game instance (no window needed)
+    game = GameEngine(seed=2024)
     
     # Test mystery cards
     print(f"Number of mystery cards: {len(game.mystery_cards)}")
@@ -35,8 +31,8 @@ def test_spin_wheel():
     # Test spin wheel update
     print("\nTesting spin wheel update...")
     for i in range(10):
-        game._update_spin_wheel()
-        print(f"Frame {i+1}: Angle={game.spin_angle:.1f}, Progress={game.spin_progress}, Spinning={game.spinning}")
+        game._update_spin_wheel(1 / 60)
+        print(f"Frame {i+1}: Angle={game.spin_angle:.1f}, Elapsed={game.spin_elapsed:.3f}s, Spinning={game.spinning}")
         if not game.spinning:
             break
     
@@ -48,7 +44,6 @@ def test_spin_wheel():
         print(f"Mystery feedback: {game.mystery_feedback}")
     
     print("\nSpin wheel test completed successfully!")
-    pygame.quit()
 
 if __name__ == "__main__":
     test_spin_wheel()
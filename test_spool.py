@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Tests for the command spool directories
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import codec
+from spool import ENTRY_SUFFIX, Spool
+
+
+def test_entries_of_any_codec_are_read_in_order(tmp_path):
+    root = str(tmp_path / "spool")
+    legacy = "00000000000000000001.1.000000.abcdef01.json"  # named by an older version
+    names = [Spool(root, codec.CODECS[name]).submit({"n": i}) for i, name in enumerate(sorted(codec.CODECS))]
+    spool = Spool(root)
+    with open(os.path.join(spool.new_dir, legacy), 'wb') as f:
+        f.write(b'{"n": -1}')
+    assert all(name.endswith(ENTRY_SUFFIX) for name in names)
+    assert spool.pending() == [legacy] + names
+    assert [entry["n"] for _, entry in spool.peek()] == [-1] + list(range(len(names)))
+    spool.discard(names[0])
+    assert names[0] not in spool.pending()
+
+
+def test_failed_submit_leaves_no_temp_file(tmp_path):
+    spool = Spool(str(tmp_path / "spool"))
+    with pytest.raises(TypeError):
+        spool.submit({"payload": object()})
+    assert os.listdir(spool.tmp_dir) == [] and spool.pending() == []
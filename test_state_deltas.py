@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for typed state deltas and the delta history
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from state_deltas import DeltaHistory, _appended_items, apply_deltas, diff_states
+
+
+def make_state(**changes):
+    state = {
+        "epoch": 1,
+        "version": 1,
+        "teams": [{"id": "T1", "name": "Alpha", "balance": 10_000_000, "pos": 0},
+                  {"id": "T2", "name": "Beta", "balance": 10_000_000, "pos": 0}],
+        "properties": {"1": {"owner": "T1", "name": "Goa"}},
+        "current_player": 0,
+        "messages": ["a", "b", "c"],
+        "dice_rolled": False,
+        "game_log": ["start"],
+    }
+    state.update(changes)
+    return state
+
+
+def test_round_trip_with_trimmed_messages():
+    old = make_state()
+    new = make_state(
+        version=2,
+        teams=[{"id": "T1", "name": "Alpha", "balance": 9_500_000, "pos": 7},
+               {"id": "T2", "name": "Beta", "balance": 10_500_000, "pos": 0}],
+        properties={"7": {"owner": "T1", "name": "Mumbai"}},
+        current_player=1,
+        messages=["c", "d", "e"],  # bounded log: two appended, two trimmed
+        dice_rolled=True,
+    )
+    del new["game_log"]
+    deltas = diff_states(old, new)
+    kinds = {delta["kind"] for delta in deltas}
+    assert kinds == {"balance", "position", "owner", "turn", "append", "set", "remove"}
+    assert {"kind": "append", "key": "messages", "items": ["d", "e"], "size": 3} in deltas
+    patched = apply_deltas(old, deltas)
+    assert {k: v for k, v in patched.items() if k != "version"} == {k: v for k, v in new.items() if k != "version"}
+    assert old == make_state()  # apply_deltas works on a copy
+
+
+def test_appended_items():
+    assert _appended_items(["a", "b"], ["a", "b", "c"]) == ["c"]
+    assert _appended_items(["a", "b", "c"], ["b", "c", "d"]) == ["d"]
+    assert _appended_items(["x", "y", "x"], ["x", "z"]) == ["z"]  # matches the last "x"
+    assert _appended_items(["a", "b"], ["a", "b"]) == []
+    assert _appended_items(["a", "b"], ["c", "d"]) is None
+    assert _appended_items(["a", "b"], ["x", "b"]) is None
+    assert _appended_items([], ["a"]) is None
+
+
+def test_team_shape_change_sends_the_whole_list():
+    old = make_state()
+    renamed = make_state(teams=[{"id": "T1", "name": "Gamma", "balance": 1, "pos": 0},
+                                {"id": "T2", "name": "Beta", "balance": 10_000_000, "pos": 0}])
+    removed = make_state(teams=old["teams"][:1])
+    for new in (renamed, removed):
+        deltas = diff_states(old, new)
+        assert deltas == [{"kind": "set", "key": "teams", "value": new["teams"]}]
+        assert apply_deltas(old, deltas)["teams"] == new["teams"]
+
+
+def record_versions(history, versions, epoch=1):
+    for version in versions:
+        history.record(make_state(epoch=epoch, version=version, current_player=version))
+
+
+def test_history_since_falls_back_to_a_full_snapshot():
+    history = DeltaHistory(size=3)
+    assert history.since(1, 0) is None  # nothing published yet
+    record_versions(history, range(1, 6))  # deltas for 2..5, only 3..5 kept
+    assert [entry["version"] for entry in history.since(1, 2)] == [3, 4, 5]  # base of the oldest entry
+    assert history.since(1, 1) is None  # too old
+    assert [entry["version"] for entry in history.since(1, 4)] == [5]
+    assert history.since(1, 5) == []
+    assert history.since(1, 6) is None
+    assert history.since(2, 4) is None  # wrong epoch
+    assert history.since(1, None) is None
+
+    # A restarted game starts a new history
+    record_versions(history, [1, 2], epoch=2)
+    assert history.since(1, 4) is None
+    assert [entry["version"] for entry in history.since(2, 1)] == [2]
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the bot tournament runner
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from engine import GameEngine
+from tournament import (
+    POLICIES, TournamentStats, _raise_cash, _settle_debts, play_game, run_tournament, seat_policies,
+)
+
+
+def make_game(policy_names):
+    game = GameEngine(seed=1, history_size=0)
+    game.teams = game.teams[:len(policy_names)]
+    bots = [POLICIES[name]() for name in policy_names]
+    alive = {team.team_id for team in game.teams}
+    return game, bots, alive
+
+
+@pytest.fixture
+def no_trades(monkeypatch):
+    def refuse(game, buyer_team_id):
+        raise AssertionError("trade-averse seat sold through the trading flow")
+    monkeypatch.setattr(GameEngine, "_choose_trading_buyer", refuse)
+
+
+def test_play_game_repeats_for_a_seed():
+    policies = ["always-buy", "cash-threshold", "trade-averse"]
+    results = [play_game(seed, policies) for seed in (5, 5, 6)]
+    assert results[0] == results[1]
+    assert results[0] != results[2]
+    assert results[0]["policies"] == policies and results[0]["turns"] > 0
+
+
+def test_team_that_cannot_cover_its_debt_is_eliminated():
+    game, bots, alive = make_game(["trade-averse", "trade-averse", "trade-averse"])
+    team = game.teams[0]
+    for tile in (1, 3):
+        game._set_owner(tile, "T1")
+    game._set_owner(9, "T2")
+    team.balance = -20_000_000
+    assert _settle_debts(game, bots, team, alive)
+    assert alive == {"T2", "T3"}
+    assert not game.ownership.tiles("T1")
+    assert game.ownership.owner(1) is None and game.ownership.owner(3) is None
+    assert game.ownership.owner(9) == "T2"  # other teams keep theirs
+    assert game.properties[1]["owner"] is None
+
+    # Nothing left to sell: out at once, balance untouched
+    game.current_idx = 1
+    game.teams[1].balance = -1
+    game._set_owner(9, None)
+    assert _settle_debts(game, bots, game.teams[1], alive)
+    assert alive == {"T3"} and game.teams[1].balance == -1
+
+    game.current_idx = 2
+    assert not _settle_debts(game, bots, game.teams[2], alive)
+
+
+def test_trade_averse_seat_sells_to_the_bank(no_trades):
+    game, bots, alive = make_game(["trade-averse", "always-buy", "always-buy"])
+    team = game.teams[0]
+    game._set_owner(7, "T1")  # price 3M; the others would bid all of it
+    team.balance = -1_000_000
+    _raise_cash(game, bots, team, alive)
+    assert game.ownership.owner(7) is None
+    assert team.balance == 500_000  # half price to the bank
+    assert game.teams[1].balance == game.teams[2].balance == 10_000_000
+    assert not game.show_trading
+
+
+def test_trading_seat_sells_to_the_best_offer():
+    game, bots, alive = make_game(["always-buy", "always-buy", "trade-averse"])
+    team = game.teams[0]
+    game._set_owner(7, "T1")
+    team.balance = -1_000_000
+    _raise_cash(game, bots, team, alive)
+    assert game.ownership.owner(7) == "T2"
+    assert team.balance == 2_000_000 and game.teams[1].balance == 7_000_000
+
+
+def test_trade_averse_games_never_trade(no_trades):
+    for seed in range(20):
+        play_game(seed, ["trade-averse"] * 3)
+
+
+def test_seats_rotate_and_stats_add_up():
+    names = ["always-buy", "cash-threshold", "trade-averse"]
+    assert seat_policies(names, 0) == names
+    assert seat_policies(names, 1) == ["cash-threshold", "trade-averse", "always-buy"]
+    assert seat_policies(names, 3) == names
+
+    stats = TournamentStats(names)
+    stats.add({"policies": seat_policies(names, 0), "winner": 0, "bankrupt": [2], "turns": 40, "decided": False})
+    stats.add({"policies": seat_policies(names, 1), "winner": 2, "bankrupt": [0, 1], "turns": 90, "decided": True})
+    summary = stats.summary()
+    assert summary["games"] == 2 and summary["decided"] == 1
+    assert summary["mean_turns"] == 65 and summary["max_turns"] == 90
+    assert stats.wins == {"always-buy": 2, "cash-threshold": 0, "trade-averse": 0}
+    assert stats.bankruptcies == {"always-buy": 0, "cash-threshold": 1, "trade-averse": 2}
+    assert summary["policies"]["always-buy"] == {"seats": 2, "win_rate": 1.0, "bankruptcy_rate": 0.0}
+    assert summary["policies"]["trade-averse"]["bankruptcy_rate"] == 1.0
+
+
+def test_small_tournament_on_one_worker():
+    progress = []
+    summary = run_tournament(["always-buy", "trade-averse"], games=6, seed=3, workers=1, max_turns=60,
+                             games_per_task=4, on_progress=lambda stats: progress.append(stats.games))
+    assert summary["games"] == 6 and summary["workers"] == 1
+    assert progress == [4, 6]
+    rows = summary["policies"]
+    assert rows["always-buy"]["seats"] == rows["trade-averse"]["seats"] == 6
+    assert rows["always-buy"]["win_rate"] + rows["trade-averse"]["win_rate"] == pytest.approx(1.0)
+    assert summary["max_turns"] <= 60
+
+    # Same games and totals as playing them one by one in this process
+    names = ["always-buy", "trade-averse"]
+    serial = TournamentStats(names)
+    for number in range(6):
+        serial.add(play_game(3 + number, seat_policies(names, number), 60))
+    assert serial.summary()["policies"] == rows
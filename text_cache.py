@@ -0,0 +1,59 @@
+"""
+Shared cache of rendered text surfaces.
+
+font.render is one of the most expensive calls in the frame, and nearly all
+of the game's strings (button labels, token IDs, headings, balances) are the
+same from one frame to the next. TextCache keeps the most recently used
+surfaces keyed by font, text, antialias and colours, evicting the least
+recently used ones beyond a fixed size. A changed string (e.g. a new balance)
+is simply a new key, so it is rendered once when the value changes.
+
+Cached surfaces are shared: callers may blit them but must not draw on them.
+"""
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 512
+
+
+class TextCache:
+    """LRU cache in front of pygame.font.Font.render"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """Same arguments as font.render; returns a shared surface"""
+        key = (font, text, bool(antialias), tuple(color),
+               tuple(background) if background is not None else None)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
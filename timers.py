@@ -0,0 +1,79 @@
+"""
+Deadline timers for the game loop.
+
+Game timers (how long a feedback popup stays up, the delay before a mystery
+card is applied) used to be frame counters decremented in _update, so they
+ran slower whenever the game rendered fewer frames. TimerScheduler keeps
+them as absolute deadlines in a heap, on whatever clock callable it is given:
+time.monotonic by default, the simulated time (sim_time) in GameEngine, which
+advances only through step(). The game calls run() once per update and due
+callbacks fire regardless of how many frames were drawn in between.
+
+Timers are named. Scheduling a name that is already pending replaces it, and
+cancel() drops it; stale heap entries are skipped when they come up.
+"""
+import heapq
+import itertools
+import time
+
+
+class TimerScheduler:
+    """Named one-shot timers ordered by deadline"""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock  # seconds; monotonic by default, the engine passes its simulated clock
+        self.heap = []  # (deadline, seq, name)
+        self.pending = {}  # name -> (deadline, seq, callback)
+        self.counter = itertools.count()
+        self.fired = 0
+
+    def schedule(self, name, delay, callback):
+        """Call callback() delay seconds from now, replacing a pending timer of the same name"""
+        deadline = self.clock() + delay
+        seq = next(self.counter)
+        self.pending[name] = (deadline, seq, callback)
+        heapq.heappush(self.heap, (deadline, seq, name))
+
+    def cancel(self, name):
+        self.pending.pop(name, None)
+
+    def active(self, name):
+        return name in self.pending
+
+    def remaining(self, name):
+        """Seconds until the named timer fires, or 0.0 if it is not pending"""
+        entry = self.pending.get(name)
+        if entry is None:
+            return 0.0
+        return max(0.0, entry[0] - self.clock())
+
+    def due(self):
+        """True if a pending timer has reached its deadline"""
+        self._drop_stale()
+        return bool(self.heap) and self.heap[0][0] <= self.clock()
+
+    def next_deadline(self):
+        """Deadline of the earliest pending timer on this scheduler's clock, or None"""
+        self._drop_stale()
+        return self.heap[0][0] if self.heap else None
+
+    def run(self):
+        """Fire every timer whose deadline has passed, earliest first"""
+        now = self.clock()
+        while True:
+            self._drop_stale()
+            if not self.heap or self.heap[0][0] > now:
+                return
+            _, _, name = heapq.heappop(self.heap)
+            _, _, callback = self.pending.pop(name)
+            self.fired += 1
+            callback()
+
+    def _drop_stale(self):
+        heap = self.heap
+        while heap:
+            deadline, seq, name = heap[0]
+            entry = self.pending.get(name)
+            if entry is not None and entry[1] == seq:
+                return
+            heapq.heappop(heap)
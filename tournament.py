@@ -0,0 +1,281 @@
+"""
+Bot tournaments on the headless engine.
+
+play_game() plays one full game on engine.GameEngine with a bot policy in
+every seat; run_tournament() spreads many games over a ProcessPoolExecutor
+and folds the results into a TournamentStats as they finish. Every game gets
+its own seed (base seed + game number), so any game can be replayed exactly,
+and policies rotate through the seats from game to game so no policy keeps
+the first-mover advantage. start_tournament.py is the command line front end.
+
+Besides the engine's rules, the runner applies what the game master does by
+hand in the live game (see ARTHVIDYA_MONOPOLY_RULES.md): the price is paid
+when a property is bought, rent is paid for landing on an opponent's
+property (unless the team drew "No rent next turn" on its previous turn), a
+team that cannot get back above zero by selling is eliminated and its
+properties return to the bank. A game ends with one team left or after
+max_turns turns; the winner is the last team standing or the highest net
+worth. Chance questions carry no money and are declined. Mystery moves and
+teleports: tile effects (penalties, the skipped turn, the GO bonus) are not
+applied where they end, as in the engine, but rent and buying are.
+
+A policy answers four questions: buy the property it landed on, how much to
+offer for a property another team is selling, which property to sell when it
+needs cash, and whether to take offers from other teams for it. Selling goes
+through the engine's trading flow to the best offer, or to the bank at half
+price when the seller takes no offers or none beats that.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from engine import GameEngine
+
+DEFAULT_MAX_TURNS = 300
+GAMES_PER_TASK = 50  # games per pool task; amortizes the inter-process round trip
+SETTLE_STEP_S = 1.0  # engine step while a move, spin or mystery timer is pending
+
+
+class Policy:
+    """Base bot: buys what it can afford and never trades"""
+
+    name = "base"
+
+    def wants_to_buy(self, game, team, tile, price):
+        return team.balance >= price
+
+    def offer_for(self, game, team, tile, price):
+        """Amount offered for another team's property, or None"""
+        return None
+
+    def property_to_sell(self, game, team, owned):
+        """One of owned (from _get_owned_properties) to sell when short of cash"""
+        return min(owned, key=lambda prop: prop["price"])
+
+    def accepts_offers(self, game, team, tile):
+        """Put tile up for trade with the other teams (False: sell it to the bank)"""
+        return True
+
+
+class AlwaysBuy(Policy):
+    """Buys every property it can afford and bids up to the price in trades"""
+
+    name = "always-buy"
+
+    def offer_for(self, game, team, tile, price):
+        return price if team.balance >= price else None
+
+
+class CashThreshold(Policy):
+    """Only spends money it can spare above a cash reserve"""
+
+    name = "cash-threshold"
+
+    def __init__(self, reserve=4_000_000):
+        self.reserve = reserve
+
+    def wants_to_buy(self, game, team, tile, price):
+        return team.balance - price >= self.reserve
+
+    def offer_for(self, game, team, tile, price):
+        offer = price * 3 // 4
+        return offer if team.balance - offer >= self.reserve else None
+
+    def property_to_sell(self, game, team, owned):
+        return max(owned, key=lambda prop: prop["price"])
+
+
+class TradeAverse(Policy):
+    """Buys from the bank only; never bids, and sells to the bank"""
+
+    name = "trade-averse"
+
+    def accepts_offers(self, game, team, tile):
+        return False
+
+
+POLICIES = {policy.name: policy for policy in (AlwaysBuy, CashThreshold, TradeAverse)}
+
+
+def _settle(game):
+    """Step the engine until the mystery wheel has stopped and its card is applied"""
+    while game.spinning or game.timers.active("mystery_apply"):
+        game.step(SETTLE_STEP_S)
+
+
+def _release(game, team_id):
+    for tile in list(game.ownership.tiles(team_id)):
+        game._set_owner(tile, None)
+
+
+def _raise_cash(game, bots, team, alive):
+    """Sell properties of the team on turn until its balance is not negative"""
+    while team.balance < 0:
+        owned = game._get_owned_properties(team.team_id)
+        if not owned:
+            return
+        bot = bots[game.current_idx]
+        prop = bot.property_to_sell(game, team, owned)
+        if not bot.accepts_offers(game, team, prop["index"]):
+            game._sell_property(prop["index"])
+            continue
+        bank_price = round(prop["price"] // 2 / 500_000) * 500_000  # as _sell_property
+        game._start_trading()
+        game._select_property_for_trade(prop["index"])
+        for idx, buyer in enumerate(game.teams):
+            if idx == game.current_idx or buyer.team_id not in alive:
+                continue
+            offer = bots[idx].offer_for(game, buyer, prop["index"], prop["price"])
+            if offer:
+                game._make_trading_offer(idx, offer)
+        best = max(game.trading_offers.items(), key=lambda item: item[1], default=None)
+        if best is not None and best[1] > bank_price:
+            game._choose_trading_buyer(best[0])
+        else:
+            game._cancel_trading()
+            game._sell_property(prop["index"])
+
+
+def _settle_debts(game, bots, team, alive):
+    """Raise cash for the team on turn, eliminating it if that is not enough; returns True if eliminated"""
+    _raise_cash(game, bots, team, alive)
+    if team.balance >= 0:
+        return False
+    alive.discard(team.team_id)
+    _release(game, team.team_id)
+    return True
+
+
+def play_game(seed, policy_names, max_turns=DEFAULT_MAX_TURNS):
+    """Play one game; policy_names[i] plays seat i. Returns a result dict"""
+    bots = [POLICIES[name]() for name in policy_names]
+    game = GameEngine(seed=seed, history_size=0)
+    game.teams = game.teams[:len(bots)]
+    alive = {team.team_id for team in game.teams}
+    no_rent = set()
+    bankrupt = []
+    turns = 0
+    while turns < max_turns and len(alive) > 1:
+        turns += 1
+        team = game.teams[game.current_idx]
+        bot = bots[game.current_idx]
+        waived = team.team_id in no_rent
+        no_rent.discard(team.team_id)
+
+        game.roll_dice()
+        while game.moving:
+            game.step(SETTLE_STEP_S)
+        if game.show_chance_confirm:
+            game._confirm_chance_no()
+        if game.show_mystery:
+            _settle(game)
+            if game.mystery_card and game.mystery_card["type"] == "no_rent":
+                no_rent.add(team.team_id)
+
+        owner = game.ownership.owner(team.pos)
+        if owner not in (None, team.team_id) and not waived:
+            rent = game.property_data[team.pos]["rent"]
+            team.balance -= rent
+            next(t for t in game.teams if t.team_id == owner).balance += rent
+        elif game.can_buy(team):
+            price = game.property_data[team.pos]["price"]
+            if bot.wants_to_buy(game, team, team.pos, price):
+                game.buy_current()
+                team.balance -= price
+
+        if _settle_debts(game, bots, team, alive):
+            bankrupt.append(game.current_idx)
+        if len(alive) <= 1:
+            break
+        game.next_turn()
+        while game.teams[game.current_idx].team_id not in alive:
+            game.next_turn()
+
+    worth = [game.ownership.net_worth(team) if team.team_id in alive else None for team in game.teams]
+    winner = max((w, -seat) for seat, w in enumerate(worth) if w is not None)
+    return {
+        "seed": seed,
+        "policies": list(policy_names),
+        "winner": -winner[1],
+        "bankrupt": bankrupt,
+        "turns": turns,
+        "decided": len(alive) == 1,
+        "net_worth": worth,
+    }
+
+
+def seat_policies(policy_names, game_number):
+    """Rotate the policies through the seats, one seat per game"""
+    shift = game_number % len(policy_names)
+    return policy_names[shift:] + policy_names[:shift]
+
+
+def _play_batch(base_seed, first, count, policy_names, max_turns):
+    return [play_game(base_seed + number, seat_policies(policy_names, number), max_turns)
+            for number in range(first, first + count)]
+
+
+class TournamentStats:
+    """Running totals per policy, updated one game result at a time"""
+
+    def __init__(self, policy_names):
+        names = sorted(set(policy_names))
+        self.games = 0
+        self.decided = 0
+        self.total_turns = 0
+        self.max_turns_seen = 0
+        self.seats = dict.fromkeys(names, 0)  # seats played
+        self.wins = dict.fromkeys(names, 0)
+        self.bankruptcies = dict.fromkeys(names, 0)
+
+    def add(self, result):
+        policies = result["policies"]
+        self.games += 1
+        self.decided += result["decided"]
+        self.total_turns += result["turns"]
+        self.max_turns_seen = max(self.max_turns_seen, result["turns"])
+        for name in policies:
+            self.seats[name] += 1
+        self.wins[policies[result["winner"]]] += 1
+        for seat in result["bankrupt"]:
+            self.bankruptcies[policies[seat]] += 1
+
+    def summary(self):
+        rows = {}
+        for name, seats in self.seats.items():
+            rows[name] = {
+                "seats": seats,
+                "win_rate": self.wins[name] / seats if seats else 0.0,
+                "bankruptcy_rate": self.bankruptcies[name] / seats if seats else 0.0,
+            }
+        return {
+            "games": self.games,
+            "decided": self.decided,
+            "mean_turns": self.total_turns / self.games if self.games else 0.0,
+            "max_turns": self.max_turns_seen,
+            "policies": rows,
+        }
+
+
+def run_tournament(policy_names, games, seed=0, workers=None, max_turns=DEFAULT_MAX_TURNS,
+                   games_per_task=GAMES_PER_TASK, on_progress=None):
+    """Play games across a process pool; on_progress(stats) is called as batches finish"""
+    workers = workers or os.cpu_count() or 1
+    stats = TournamentStats(policy_names)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_play_batch, seed, first, min(games_per_task, games - first),
+                               list(policy_names), max_turns)
+                   for first in range(0, games, games_per_task)]
+        for future in as_completed(futures):
+            for result in future.result():
+                stats.add(result)
+            if on_progress is not None:
+                on_progress(stats)
+    elapsed = time.perf_counter() - start
+    summary = stats.summary()
+    summary["workers"] = workers
+    summary["seconds"] = elapsed
+    summary["games_per_second"] = games / elapsed if elapsed else 0.0
+    summary["games_per_second_per_core"] = summary["games_per_second"] / workers
+    return summary
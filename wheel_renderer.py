@@ -0,0 +1,160 @@
+"""
+Cached rendering of the mystery spin wheel.
+
+The wheel face (rings, coloured segments and hub) is drawn once per radius
+into a surface and rotated to the current spin angle each frame, instead of
+recomputing every segment polygon per frame. Segment labels stay upright, so
+they are blitted separately from the text cache. The pointer is static and
+cached as well.
+
+The "sheet" mode, for slow machines, keeps the face pre-rotated every
+SHEET_STEP_DEG degrees, so a spin frame is a plain blit of the nearest
+frame. Each frame is rotated once, on first use, and cropped back to the
+face size (everything outside the disc is colour key). Once the wheel stops
+it is drawn at its exact angle, so the face lines up with the labels and the
+selected segment.
+"""
+import math
+
+import pygame
+
+FACE_COLORKEY = (255, 0, 255)
+MODE_ROTATE = "rotate"
+MODE_SHEET = "sheet"
+SHEET_STEP_DEG = 5
+ARC_POINTS = 30
+
+
+class WheelRenderer:
+    """Draws the spin wheel from cached surfaces"""
+
+    def __init__(self, cards, text_cache, font, mode=MODE_ROTATE):
+        self.cards = cards
+        self.text_cache = text_cache
+        self.font = font
+        self.mode = mode
+        self.radius = None
+        self.face = None
+        self.sheet = None
+        self.pointer = None
+        self.pointer_offset = (0, 0)
+        self.last_angle = None
+        self.last_frame = None
+
+    def _build(self, radius):
+        self.radius = radius
+        self.face = self._build_face(radius)
+        self.pointer, self.pointer_offset = self._build_pointer(radius)
+        self.sheet = None
+        self.last_angle = None
+        if self.mode == MODE_SHEET:
+            # Filled lazily, so opening the wheel never stalls on building every frame
+            self.sheet = [None] * (360 // SHEET_STEP_DEG)
+
+    def _rotate(self, angle):
+        """Face rotated clockwise by angle, cropped back to the face size"""
+        rotated = pygame.transform.rotate(self.face, -angle)
+        frame = pygame.Surface(self.face.get_size()).convert()
+        frame.fill(FACE_COLORKEY)
+        rect = frame.get_rect()
+        frame.blit(rotated, rotated.get_rect(center=rect.center))
+        frame.set_colorkey(FACE_COLORKEY)
+        return frame
+
+    def _build_face(self, radius):
+        # Colour-keyed rather than per-pixel alpha: much cheaper to rotate and blit
+        size = 2 * radius + 2
+        face = pygame.Surface((size, size)).convert()
+        face.fill(FACE_COLORKEY)
+        face.set_colorkey(FACE_COLORKEY)
+        c = size // 2
+        pygame.draw.circle(face, (255, 255, 255), (c, c), radius)
+        pygame.draw.circle(face, (128, 0, 128), (c, c), radius, 8)
+        pygame.draw.circle(face, (255, 215, 0), (c, c), radius, 3)
+
+        angle_per_segment = 360 / len(self.cards)
+        for i, card in enumerate(self.cards):
+            start = math.radians(i * angle_per_segment)
+            end = math.radians((i + 1) * angle_per_segment)
+            points = [(c, c)]
+            for j in range(ARC_POINTS + 1):
+                angle = start + (end - start) * j / ARC_POINTS
+                points.append((c + radius * 0.9 * math.cos(angle), c + radius * 0.9 * math.sin(angle)))
+            pygame.draw.polygon(face, card["color"], points)
+            pygame.draw.polygon(face, (0, 0, 0), points, 2)
+
+        # Hub
+        pygame.draw.circle(face, (183, 28, 28), (c, c), 30)
+        pygame.draw.circle(face, (255, 215, 0), (c, c), 30, 3)
+        return face
+
+    def _build_pointer(self, radius):
+        """Arrow above the wheel and the selection marker; returns (surface, offset from centre)"""
+        arrow_length = 25
+        arrow_width = 15
+        top = -radius - 10
+        left = -radius - 12
+        surface = pygame.Surface((2 * radius + 24, radius + 24), pygame.SRCALPHA).convert_alpha()
+        surface.fill((0, 0, 0, 0))
+
+        def local(x, y):
+            return (x - left, y - top)
+
+        arrow_points = [
+            (0, top),  # Tip
+            (-arrow_width // 2, top + arrow_length),  # Bottom left
+            (-arrow_width // 4, top + arrow_length - 5),  # Inner left
+            (arrow_width // 4, top + arrow_length - 5),  # Inner right
+            (arrow_width // 2, top + arrow_length),  # Bottom right
+        ]
+        pygame.draw.polygon(surface, (0, 0, 0, 100), [local(x + 2, y + 2) for x, y in arrow_points])
+        pygame.draw.polygon(surface, (183, 28, 28), [local(x, y) for x, y in arrow_points])
+        pygame.draw.polygon(surface, (255, 215, 0), [local(x, y) for x, y in arrow_points], 3)
+
+        # Arrow shaft extending to the wheel edge
+        shaft_start = local(0, top + arrow_length)
+        shaft_end = local(0, -radius + 5)
+        pygame.draw.line(surface, (183, 28, 28), shaft_start, shaft_end, 4)
+        pygame.draw.line(surface, (255, 215, 0), shaft_start, shaft_end, 2)
+
+        # Selection indicator on the wheel edge at 0 degrees
+        marker = local(int(radius * 0.95), 0)
+        pygame.draw.circle(surface, (255, 255, 255), marker, 8)
+        pygame.draw.circle(surface, (183, 28, 28), marker, 8, 3)
+        pygame.draw.circle(surface, (255, 215, 0), marker, 8, 1)
+        return surface, (left, top)
+
+    def draw(self, screen, center_x, center_y, radius, angle, spinning=True):
+        """Draw the wheel rotated by angle degrees (clockwise on screen)"""
+        if radius != self.radius:
+            self._build(radius)
+
+        if self.sheet is not None and not spinning:
+            # Stopped: one exact rotation, cached until the angle changes
+            if angle % 360 != self.last_angle:
+                self.last_angle = angle % 360
+                self.last_frame = self._rotate(self.last_angle)
+            face = self.last_frame
+        elif self.sheet is not None:
+            slot = int(round(angle / SHEET_STEP_DEG)) % len(self.sheet)
+            face = self.sheet[slot]
+            if face is None:
+                face = self.sheet[slot] = self._rotate(slot * SHEET_STEP_DEG)
+        else:
+            # The wheel sits still while the result is shown; rotate only when it moves
+            angle = angle % 360
+            if angle != self.last_angle:
+                self.last_angle = angle
+                self.last_frame = pygame.transform.rotate(self.face, -angle)
+            face = self.last_frame
+        screen.blit(face, face.get_rect(center=(center_x, center_y)))
+
+        # Upright labels at the middle of each segment
+        angle_per_segment = 360 / len(self.cards)
+        for i, card in enumerate(self.cards):
+            mid = math.radians(i * angle_per_segment + angle_per_segment / 2 + angle)
+            text = self.text_cache.render(self.font, card["text"], True, (255, 255, 255))
+            screen.blit(text, text.get_rect(center=(center_x + radius * 0.6 * math.cos(mid),
+                                                    center_y + radius * 0.6 * math.sin(mid))))
+
+        screen.blit(self.pointer, (center_x + self.pointer_offset[0], center_y + self.pointer_offset[1]))
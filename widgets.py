@@ -0,0 +1,131 @@
+"""
+Retained clickable widgets for the pygame UI.
+
+Drawing code used to rebuild a list of (rect, closure) click areas every
+frame and the click handler scanned it linearly. WidgetLayer instead keeps
+one Widget per stable key across frames: each frame the drawing code declares
+the widgets it shows (updating rect, action and visual state in place), and
+widgets that were not declared are dropped at the end of the frame, e.g. when
+an overlay closes.
+
+A widget may carry a paint function; its pixels are then rendered once into
+a cached colour-keyed surface and only re-rendered when its size or state
+(label, hover, ...) changes, so drawing it is a single blit. Widgets without
+one are only hit areas and their owner draws them as before; panels are
+painted widgets that cannot be clicked (e.g. the sidebar team rows).
+
+Hit testing goes through a uniform grid of cells, rebuilt only when a widget
+appears, disappears or moves; the widget declared last (drawn on top) wins.
+"""
+import pygame
+
+WIDGET_COLORKEY = (255, 0, 255)
+GRID_CELL = 64
+
+
+class Widget:
+    __slots__ = ("key", "rect", "bounds", "action", "args", "paint", "state", "surface", "order")
+
+    def __init__(self, key):
+        self.key = key
+        self.rect = None
+        self.bounds = None
+        self.action = None
+        self.args = ()
+        self.paint = None
+        self.state = None
+        self.surface = None
+        self.order = 0
+
+    def click(self):
+        return self.action(*self.args)
+
+
+class WidgetLayer:
+    """Persistent widgets with cached rendering and a grid index for hit tests"""
+
+    def __init__(self, cell_size=GRID_CELL):
+        self.cell_size = cell_size
+        self.widgets = {}
+        self.seen = set()
+        self.grid = {}
+        self.index_dirty = True
+        self.order = 0
+        self.target = None
+        self.renders = 0
+
+    def begin_frame(self, target):
+        """Start declaring this frame's widgets; painted widgets are blitted onto target"""
+        self.target = target
+        self.seen = set()
+        self.order = 0
+
+    def panel(self, key, rect, paint, state, bounds=None):
+        """Declare a painted widget that is not clickable"""
+        return self.button(key, rect, None, paint=paint, state=state, bounds=bounds)
+
+    def button(self, key, rect, action, *args, paint=None, state=None, bounds=None):
+        """Declare a widget for this frame; draws it if it has a paint function"""
+        widget = self.widgets.get(key)
+        if widget is None:
+            widget = self.widgets[key] = Widget(key)
+            self.index_dirty = True
+        if widget.rect != rect:
+            widget.rect = pygame.Rect(rect)
+            self.index_dirty = True
+        if self.order != widget.order:
+            widget.order = self.order
+            self.index_dirty = True
+        self.order += 1
+        widget.action = action
+        widget.args = args
+        self.seen.add(key)
+        if paint is not None:
+            self._draw(widget, pygame.Rect(bounds or rect), paint, state)
+        return widget
+
+    def _draw(self, widget, bounds, paint, state):
+        if (widget.surface is None or widget.bounds is None or widget.bounds.size != bounds.size
+                or widget.state != state or widget.paint != paint):
+            surface = pygame.Surface(bounds.size).convert()
+            surface.fill(WIDGET_COLORKEY)
+            surface.set_colorkey(WIDGET_COLORKEY)
+            paint(surface, widget.rect.move(-bounds.x, -bounds.y), state)
+            widget.surface = surface
+            widget.paint = paint
+            widget.state = state
+            self.renders += 1
+        widget.bounds = bounds
+        self.target.blit(widget.surface, bounds)
+
+    def end_frame(self):
+        """Drop widgets that were not declared this frame"""
+        if len(self.seen) != len(self.widgets):
+            for key in [k for k in self.widgets if k not in self.seen]:
+                del self.widgets[key]
+            self.index_dirty = True
+
+    def _rebuild_index(self):
+        self.grid = {}
+        size = self.cell_size
+        for widget in self.widgets.values():
+            if widget.action is None:
+                continue
+            r = widget.rect
+            for cx in range(r.left // size, (r.right - 1) // size + 1):
+                for cy in range(r.top // size, (r.bottom - 1) // size + 1):
+                    self.grid.setdefault((cx, cy), []).append(widget)
+        self.index_dirty = False
+
+    def hit(self, pos):
+        """Topmost widget under pos, or None"""
+        if self.index_dirty:
+            self._rebuild_index()
+        cell = self.grid.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if not cell:
+            return None
+        best = None
+        for widget in cell:
+            if widget.rect.collidepoint(pos) and (best is None or widget.order > best.order):
+                best = widget
+        return best